@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "setup_django",
+    "median_time",
+    "create_blog_models",
+    "print_table",
+)
+
+import datetime
+import os
+import random
+import statistics
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.infrastructure.persistence import models
+
+_VOCABULARY: typing.Final[typing.Sequence[str]] = tuple(
+    f"word{i}" for i in range(5000)
+)
+
+
+def setup_django(*, database_name: typing.Optional[str] = None) -> None:
+    """
+    Configures Django and creates an empty test database with all
+    migrations applied. The database is kept in memory, unless the
+    name of a (new) file is given.
+    """
+    os.environ.setdefault(
+        "DJANGO_SETTINGS_MODULE",
+        "src.shared.infrastructure.django.settings",
+    )
+    os.environ.setdefault("DJANGO_SECRET_KEY", "benchmark")
+
+    import django
+    from django.db import connection
+    from django.test import utils
+
+    django.setup()
+    utils.setup_test_environment()
+    if database_name is not None:
+        connection.settings_dict["TEST"]["NAME"] = database_name
+    connection.creation.create_test_db(verbosity=0)
+
+
+def median_time(
+    func: typing.Callable[[], typing.Any], *, repeat: int = 20
+) -> float:
+    """Returns the median wall time of `func` in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def create_blog_models(
+    count: int, *, start: int = 0, words: int = 300
+) -> typing.List[models.BlogModel]:
+    """
+    Inserts `count` blogs with random content in bulk (bypassing
+    model signals) and returns them.
+    """
+    from src.modules.blog.infrastructure.persistence import models
+
+    rng = random.Random(start)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    blog_models = models.BlogModel.objects.bulk_create(
+        models.BlogModel(
+            sno=sno,
+            title=" ".join(rng.choices(_VOCABULARY, k=6)),
+            meta=" ".join(rng.choices(_VOCABULARY, k=20)),
+            content="<p>"
+            + " ".join(rng.choices(_VOCABULARY, k=words))
+            + "</p>",
+            thumbnail_url="https://example.com/thumbnail.jpg",
+            category="uncategorized",
+            time=now - datetime.timedelta(minutes=sno),
+            slug=f"blog-{sno}",
+        )
+        for sno in range(start + 1, start + count + 1)
+    )
+    return typing.cast(typing.List[models.BlogModel], blog_models)
+
+
+def print_table(
+    header: typing.Sequence[str],
+    rows: typing.Iterable[typing.Sequence[typing.Any]],
+) -> None:
+    """Prints benchmark results as a plain-text table."""
+    print(" | ".join(f"{column:>14}" for column in header))
+    for row in rows:
+        print(
+            " | ".join(
+                f"{value:>14.3f}"
+                if isinstance(value, float)
+                else f"{value:>14}"
+                for value in row
+            )
+        )
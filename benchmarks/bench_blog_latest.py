@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Compares the work done by the `index` view to load the latest blogs
+before (`get_all_blogs`) and after (`get_latest`) it was bounded, as
+the number of blogs grows.
+
+Run with `python -m benchmarks.bench_blog_latest [SIZE ...]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import typing
+
+from benchmarks import _util
+
+_DEFAULT_SIZES: typing.Final[typing.Sequence[int]] = (100, 1000, 10000)
+_LATEST_BLOGS_COUNT: typing.Final[int] = 3
+
+
+def main(sizes: typing.Sequence[int]) -> None:
+    _util.setup_django()
+
+    from django.db import connection
+
+    from src.modules.blog.infrastructure.persistence import (
+        blog_repository,
+    )
+    from src.modules.blog.infrastructure.persistence import models
+
+    repo = blog_repository.DjangoBlogRepository()
+
+    rows = []
+    total = 0
+    for size in sorted(sizes):
+        _util.create_blog_models(size - total, start=total)
+        total = size
+
+        rows.append(
+            (
+                size,
+                _util.median_time(repo.get_all_blogs, repeat=3),
+                _util.median_time(
+                    lambda: repo.get_latest(_LATEST_BLOGS_COUNT)
+                ),
+            )
+        )
+
+    _util.print_table(("blogs", "all, ms", "latest, ms"), rows)
+
+    query = models.BlogModel.objects.order_by("-time", "-sno")[
+        :_LATEST_BLOGS_COUNT
+    ]
+    with connection.cursor() as cursor:
+        sql, params = query.query.sql_with_params()
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        print()
+        for row in cursor.fetchall():
+            print(row[-1])
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or _DEFAULT_SIZES)
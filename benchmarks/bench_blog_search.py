@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Compares the latency of the blog search through the inverted index
+with the previous full scan (`get_all_blogs` + `Blog.contains_word`)
+as the number of blogs grows.
+
+Run with `python -m benchmarks.bench_blog_search [SIZE ...]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import typing
+
+from benchmarks import _util
+
+_DEFAULT_SIZES: typing.Final[typing.Sequence[int]] = (100, 1000, 10000)
+_RARE_QUERY: typing.Final[str] = "needle"
+_COMMON_QUERY: typing.Final[str] = "word42 word4242"
+
+
+def main(sizes: typing.Sequence[int]) -> None:
+    _util.setup_django()
+
+    from django.db import transaction
+
+    from src.modules.blog.infrastructure.persistence import blog_mapper
+    from src.modules.blog.infrastructure.persistence import (
+        blog_repository,
+    )
+    from src.modules.blog.infrastructure.persistence import (
+        blog_search_index,
+    )
+    from src.modules.blog.infrastructure.persistence import models
+
+    mapper = blog_mapper.BlogMapper()
+    repo = blog_repository.DjangoBlogRepository()
+    index = blog_search_index.DjangoBlogSearchIndex()
+
+    def search_with_index(query: str) -> None:
+        # The work done by the `search` view for the first page.
+        blog_ids = index.lookup(query, limit=3)
+        repo.get_all_blogs(filter_=dict(sno__in=blog_ids))
+
+    def search_with_scan(query: str) -> None:
+        blogs = repo.get_all_blogs()
+        for word in query.split():
+            [blog for blog in blogs if blog.contains_word(word)]
+
+    rows = []
+    total = 0
+    for size in sorted(sizes):
+        blog_models = _util.create_blog_models(
+            size - total, start=total
+        )
+        with transaction.atomic():
+            for position, model in enumerate(blog_models):
+                if position < 5 and total == 0:
+                    # The rare term occurs in a fixed number of blogs.
+                    model.content += f" {_RARE_QUERY}"
+                    models.BlogModel.objects.filter(
+                        sno=model.sno
+                    ).update(content=model.content)
+                index.index(mapper.model_to_entity(model))
+        total = size
+
+        rows.append(
+            (
+                size,
+                _util.median_time(
+                    lambda: search_with_scan(_RARE_QUERY), repeat=3
+                ),
+                _util.median_time(
+                    lambda: search_with_index(_RARE_QUERY)
+                ),
+                _util.median_time(
+                    lambda: search_with_index(_COMMON_QUERY)
+                ),
+            )
+        )
+
+    _util.print_table(
+        ("blogs", "scan, ms", "index rare, ms", "index common, ms"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or _DEFAULT_SIZES)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Compares the memory allocated to load a list page as full Blog
+aggregates (as the list views did before) and as BlogSummary read
+models, for pages of different sizes.
+
+Run with `python -m benchmarks.bench_blog_summary [PAGE_SIZE ...]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+import typing
+
+from benchmarks import _util
+
+_DEFAULT_PAGE_SIZES: typing.Final[typing.Sequence[int]] = (3, 30, 300)
+_BLOG_COUNT: typing.Final[int] = 1000
+_WORDS_PER_BLOG: typing.Final[int] = 2000
+
+
+def _peak_kib(func: typing.Callable[[], typing.Any]) -> float:
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def main(page_sizes: typing.Sequence[int]) -> None:
+    _util.setup_django()
+
+    from src.modules.blog.infrastructure.persistence import blog_mapper
+    from src.modules.blog.infrastructure.persistence import (
+        blog_repository,
+    )
+    from src.modules.blog.infrastructure.persistence import models
+
+    mapper = blog_mapper.BlogMapper()
+    repo = blog_repository.DjangoBlogRepository()
+
+    _util.create_blog_models(_BLOG_COUNT, words=_WORDS_PER_BLOG)
+
+    def load_aggregates(size: int) -> None:
+        mapper.models_to_entities(
+            models.BlogModel.objects.order_by("-time", "-sno")[:size]
+        )
+
+    def load_summaries(size: int) -> None:
+        repo.get_page(1, size)
+
+    rows = []
+    for size in sorted(page_sizes):
+        # Warm up, so that one-off allocations are not measured.
+        load_aggregates(size)
+        load_summaries(size)
+
+        rows.append(
+            (
+                size,
+                _peak_kib(lambda: load_aggregates(size)),
+                _peak_kib(lambda: load_summaries(size)),
+                _util.median_time(lambda: load_aggregates(size)),
+                _util.median_time(lambda: load_summaries(size)),
+            )
+        )
+
+    _util.print_table(
+        (
+            "page size",
+            "blogs, KiB",
+            "summaries, KiB",
+            "blogs, ms",
+            "summaries, ms",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or _DEFAULT_PAGE_SIZES)
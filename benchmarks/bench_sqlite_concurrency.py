@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Compares how many pages of blogs the readers load per second while
+a writer keeps changing blogs, as in the admin, with the default
+SQLite settings and with `SQLITE_PRAGMAS` (write-ahead log, memory
+mapping and so on). Also shows what opening a connection costs,
+which persistent connections (`CONN_MAX_AGE`) save per request.
+
+Run with `python -m benchmarks.bench_sqlite_concurrency [READERS ...]`.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import typing
+from unittest import mock
+
+from benchmarks import _util
+
+_DEFAULT_READERS: typing.Final[typing.Sequence[int]] = (1, 4, 8)
+_BLOGS_COUNT: typing.Final[int] = 1000
+_PAGE_SIZE: typing.Final[int] = 10
+_DURATION: typing.Final[float] = 2.0
+# The settings of SQLite and Django when no pragmas are set.
+_DEFAULT_PRAGMAS: typing.Final[typing.Mapping[str, typing.Any]] = {
+    "journal_mode": "DELETE",
+    "synchronous": "FULL",
+}
+
+
+def _run(readers: int) -> typing.Tuple[float, float]:
+    # Returns the reads and the writes per second, while all the
+    # threads run with their own connections.
+    from django.db import connection
+    from django.db import transaction
+
+    from src.modules.blog.infrastructure.persistence import (
+        blog_repository,
+    )
+    from src.modules.blog.infrastructure.persistence import models
+
+    repo = blog_repository.DjangoBlogRepository()
+    stop = threading.Event()
+    counts = [0] * (readers + 1)
+
+    def read(index: int) -> None:
+        rng = random.Random(index)
+        num_pages = _BLOGS_COUNT // _PAGE_SIZE
+        try:
+            while not stop.is_set():
+                repo.get_page(rng.randint(1, num_pages), _PAGE_SIZE)
+                counts[index] += 1
+        finally:
+            connection.close()
+
+    def write() -> None:
+        rng = random.Random()
+        try:
+            while not stop.is_set():
+                with transaction.atomic():
+                    models.BlogModel.objects.filter(
+                        sno=rng.randint(1, _BLOGS_COUNT)
+                    ).update(meta=str(rng.random()))
+                counts[readers] += 1
+        finally:
+            connection.close()
+
+    threads = [
+        threading.Thread(target=read, args=(index,))
+        for index in range(readers)
+    ]
+    threads.append(threading.Thread(target=write))
+    for thread in threads:
+        thread.start()
+    time.sleep(_DURATION)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return sum(counts[:readers]) / _DURATION, counts[
+        readers
+    ] / _DURATION
+
+
+def _connect() -> None:
+    from django.db import connection
+
+    connection.close()
+    connection.ensure_connection()
+
+
+def main(all_readers: typing.Sequence[int]) -> None:
+    # The journal only applies to databases in files.
+    directory = tempfile.mkdtemp()
+    _util.setup_django(
+        database_name=os.path.join(directory, "db.sqlite3")
+    )
+
+    from django.conf import settings
+    from django.db import connection
+
+    _util.create_blog_models(_BLOGS_COUNT)
+
+    profiles = {
+        "default": _DEFAULT_PRAGMAS,
+        "tuned": settings.SQLITE_PRAGMAS,
+    }
+    rows = []
+    for profile, pragmas in profiles.items():
+        with mock.patch.object(settings, "SQLITE_PRAGMAS", pragmas):
+            connect_time = _util.median_time(_connect)
+            for readers in sorted(all_readers):
+                reads, writes = _run(readers)
+                rows.append(
+                    (profile, readers, reads, writes, connect_time)
+                )
+            connection.close()
+
+    _util.print_table(
+        ("profile", "readers", "reads/s", "writes/s", "connect, ms"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main([int(readers) for readers in sys.argv[1:]] or _DEFAULT_READERS)
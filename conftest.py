@@ -19,3 +19,40 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+from __future__ import annotations
+
+import pathlib
+import typing
+
+import pytest
+from django.core import cache
+
+
+@pytest.fixture(name="clear_cache", autouse=True)
+def _() -> typing.Iterator[None]:
+    # Database changes are rolled back after each test without
+    # sending any signals, so the cache has to be dropped too.
+    yield
+    cache.cache.clear()
+
+    from src.modules.blog.infrastructure import container
+
+    container.blog_container.blog_identity_map().clear()
+    container.blog_container.cache().clear()
+
+
+@pytest.fixture(name="artifact_store", autouse=True)
+def _isolate_artifact_store(
+    tmp_path: pathlib.Path,
+) -> typing.Iterator[typing.Any]:
+    # Files rendered in tests are kept apart from the project's.
+    from src.modules.blog.infrastructure import container
+    from src.modules.blog.infrastructure.persistence import (
+        blog_artifact_store,
+    )
+
+    store = blog_artifact_store.FileSystemBlogArtifactStore(
+        tmp_path / "artifacts"
+    )
+    with container.blog_container.blog_artifact_store.override(store):
+        yield store
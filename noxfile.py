@@ -28,9 +28,11 @@ __all__: typing.Sequence[str] = (
     "BASE_REQUIREMENTS",
     "DEV_REQUIREMENTS",
     "pytest",
+    "pytest_postgresql",
     "ruff",
 )
 
+import os
 import typing
 
 import nox
@@ -53,6 +55,23 @@ def pytest(session: nox.Session) -> None:
     session.run("pytest")
 
 
+@nox.session(python=["3.11"])
+def pytest_postgresql(session: nox.Session) -> None:
+    # Expects a server, e.g. `docker compose --profile postgres up db`.
+    session.install(*DEV_REQUIREMENTS)
+    session.install(*BASE_REQUIREMENTS)
+
+    session.run(
+        "pytest",
+        env={
+            "DJANGO_DATABASE_BACKEND": "postgresql",
+            "DJANGO_DATABASE_PASSWORD": os.environ.get(
+                "DJANGO_DATABASE_PASSWORD", "postgres"
+            ),
+        },
+    )
+
+
 @nox.session
 def ruff(session: nox.Session) -> None:
     session.install(*DEV_REQUIREMENTS)
@@ -29,49 +29,203 @@ concrete implementations to abstractions.
 # mypy: ignore-errors
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("BlogContainer", "PortfolioContainer")
+__all__: typing.Sequence[str] = (
+    "SharedContainer",
+    "BlogContainer",
+    "PortfolioContainer",
+)
 
 import typing
 
 from dependency_injector import containers
 from dependency_injector import providers
+from django.conf import settings
 
 from src.config import dirs
 from src.modules.blog.application.services import blog_streamer
+from src.modules.blog.infrastructure.persistence import (
+    blog_artifact_store as blog_artifact_store_impl,
+)
+from src.modules.blog.infrastructure.persistence import (
+    blog_identity_map as blog_identity_map_impl,
+)
+from src.modules.blog.infrastructure.persistence import (
+    blog_render_queue as blog_render_queue_impl,
+)
 from src.modules.blog.infrastructure.persistence import (
     blog_repository as blog_repository_impl,
 )
+from src.modules.blog.infrastructure.persistence import (
+    blog_search_index as blog_search_index_impl,
+)
+from src.modules.blog.infrastructure.rendering import epub_renderer
+from src.modules.blog.infrastructure.rendering import markdown_renderer
+from src.modules.blog.infrastructure.rendering import pdf_renderer
+from src.modules.blog.infrastructure.rendering import text_renderer
+from src.modules.portfolio.infrastructure.persistence import (
+    about_me_repository as about_me_repository_impl,
+)
 from src.modules.portfolio.infrastructure.persistence import (
     project_repository as project_repository_impl,
 )
+from src.shared.infrastructure import cache as cache_
+from src.shared.infrastructure import memory_cache
+from src.shared.infrastructure import sqlite_cache
 
 if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import (
+        blog_artifact_store as blog_artifact_store_,
+    )
+    from src.modules.blog.domain import (
+        blog_render_queue as blog_render_queue_,
+    )
+    from src.modules.blog.domain import blog_renderer as blog_renderer_
     from src.modules.blog.domain import (
         blog_repository as blog_repository_,
     )
+    from src.modules.blog.domain import (
+        blog_search_index as blog_search_index_,
+    )
+    from src.modules.portfolio.domain import (
+        about_me_repository as about_me_repository_,
+    )
     from src.modules.portfolio.domain import (
         project_repository as project_repository_,
     )
 
 
+class SharedContainer(containers.DeclarativeContainer):
+    cache: cache_.Cache = providers.Selector(
+        providers.Callable(
+            getattr, settings, "SHARED_CACHE_BACKEND", "memory"
+        ),
+        memory=providers.Singleton(
+            memory_cache.InMemoryCache,
+            max_entries=providers.Callable(
+                getattr, settings, "SHARED_CACHE_MAX_ENTRIES", 1024
+            ),
+        ),
+        sqlite=providers.Singleton(
+            sqlite_cache.SQLiteCache,
+            path=providers.Callable(
+                getattr,
+                settings,
+                "SHARED_CACHE_LOCATION",
+                dirs.BASE_DIR / ".cache" / "shared.sqlite3",
+            ),
+            max_entries=providers.Callable(
+                getattr, settings, "SHARED_CACHE_MAX_ENTRIES", 4096
+            ),
+        ),
+    )
+    """
+    A cache of aggregates and rendered fragments, either kept by
+    each process or shared by all the processes of a host.
+    """
+
+
 class BlogContainer(containers.DeclarativeContainer):
+    cache: cache_.Cache = providers.Dependency(instance_of=cache_.Cache)
+    """The cache shared with other modules (see `SharedContainer`)."""
+
+    blog_search_index: blog_search_index_.BlogSearchIndex = (
+        providers.Singleton(blog_search_index_impl.create_search_index)
+    )
+    """An inverted index used to search through blog content."""
+
+    blog_identity_map: blog_identity_map_impl.BlogIdentityMap = (
+        providers.Singleton(
+            blog_identity_map_impl.BlogIdentityMap,
+            max_size=providers.Callable(
+                getattr, settings, "BLOG_IDENTITY_MAP_SIZE", 256
+            ),
+            ttl=providers.Callable(
+                getattr, settings, "BLOG_IDENTITY_MAP_TTL", 300.0
+            ),
+        )
+    )
+    """A bounded map of the blogs recently loaded by the repository."""
+
     blog_repository: blog_repository_.BlogRepository = (
-        providers.Singleton(blog_repository_impl.DjangoBlogRepository)
+        providers.Singleton(
+            blog_repository_impl.DjangoBlogRepository,
+            search_index=blog_search_index,
+            identity_map=blog_identity_map,
+            cache=cache,
+        )
     )
     """A repository that uses the Blog aggregate as its model."""
 
+    blog_renderers: typing.Sequence[blog_renderer_.BlogRenderer] = (
+        providers.List(
+            providers.Singleton(pdf_renderer.PdfBlogRenderer),
+            providers.Singleton(epub_renderer.EpubBlogRenderer),
+            providers.Singleton(text_renderer.TextBlogRenderer),
+            providers.Singleton(markdown_renderer.MarkdownBlogRenderer),
+        )
+    )
+    """
+    The renderers that translate blogs into the supported export
+    formats, starting with the default one (PDF).
+    """
+
+    blog_artifact_store: blog_artifact_store_.BlogArtifactStore = (
+        providers.Singleton(
+            blog_artifact_store_impl.FileSystemBlogArtifactStore,
+            root=providers.Callable(
+                getattr,
+                settings,
+                "BLOG_ARTIFACTS_ROOT",
+                dirs.ARTIFACTS_DIR,
+            ),
+        )
+    )
+    """A store of files rendered from blogs, such as PDF exports."""
+
     blog_streamer: blog_streamer.BlogStreamerService = (
         providers.Factory(
-            blog_streamer.BlogStreamerService, root=dirs.BLOGS_DIR
+            blog_streamer.BlogStreamerService,
+            store=blog_artifact_store,
+            renderers=blog_renderers,
+            prewarmed_formats=providers.Callable(
+                getattr, settings, "BLOG_PREWARM_FORMATS", None
+            ),
+            sendfile_header=providers.Callable(
+                getattr, settings, "BLOG_SENDFILE_HEADER", None
+            ),
+            sendfile_root=providers.Callable(
+                getattr, settings, "BLOG_SENDFILE_ROOT", None
+            ),
+        )
+    )
+    """A service that allows exporting blogs into several formats."""
+
+    blog_render_queue: blog_render_queue_.BlogRenderQueue = (
+        providers.Singleton(
+            blog_render_queue_impl.DjangoBlogRenderQueue,
+            max_attempts=providers.Callable(
+                getattr, settings, "BLOG_RENDER_MAX_ATTEMPTS", 3
+            ),
         )
     )
-    """A service that allows creating blog views in PDF format."""
+    """A queue of blogs waiting to be rendered by a worker."""
 
 
 class PortfolioContainer(containers.DeclarativeContainer):
+    cache: cache_.Cache = providers.Dependency(instance_of=cache_.Cache)
+    """The cache shared with other modules (see `SharedContainer`)."""
+
     project_repository: project_repository_.ProjectRepository = (
         providers.Singleton(
             project_repository_impl.DjangoProjectRepository
         )
     )
     """A repository that uses the Project aggregate as its model."""
+
+    about_me_repository: about_me_repository_.AboutMeRepository = (
+        providers.Singleton(
+            about_me_repository_impl.DjangoAboutMeRepository,
+            cache=cache,
+        )
+    )
+    """A repository of the CV shown on the about page."""
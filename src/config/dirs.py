@@ -14,7 +14,11 @@
 
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("BLOGS_DIR", "BASE_DIR")
+__all__: typing.Sequence[str] = (
+    "BLOGS_DIR",
+    "BASE_DIR",
+    "ARTIFACTS_DIR",
+)
 
 import pathlib
 import typing
@@ -29,3 +33,9 @@ BLOGS_DIR = BASE_DIR / "modules" / "blog" / "application" / "sources"
 The directory where corresponding views in PDF format will be saved 
 or deleted when blog models are saved or deleted.
 """
+
+ARTIFACTS_DIR = ROOT_DIR / "artifacts"
+"""
+The default directory of files rendered from blogs (e.g., PDF exports),
+kept outside of the source tree.
+"""
@@ -21,124 +21,183 @@
 # SOFTWARE.
 """
 A module that contains a service linking specific logic of the domain
-aggregate Blog and infrastructure implementations for interacting with
-the file system.
+aggregate Blog and infrastructure implementations for rendering and
+storing its exports.
 """
 
 from __future__ import annotations
 
 __all__: typing.Sequence[str] = ("BlogStreamerService",)
 
-import os
+import contextlib
+import functools
+import posixpath
 import typing
 
 if typing.TYPE_CHECKING:
     from src.modules.blog.domain import blog as blog_
+    from src.modules.blog.domain import blog_artifact_store
+    from src.modules.blog.domain import blog_renderer
 
-
-def _create_blog_source_stub(
-    root: os.PathLike[str], stream_id: str
-) -> None:
-    # Creates a readable PDF placeholder file for a specific blog.
-    # TODO : Implement full translation of the blog text, taking
-    #        into account markdown.
-    # FIXME: The logic for translating the blog text into a specific
-    #        format should be handled by the corresponding implementation
-    #        in the infrastructure layer, not the application layer.
-
-    header = b"%PDF-1.0\n"
-    page = (
-        b"1 0 obj\n<</Type /Page\n/Parent 2 0 R\n"
-        b"/Resources << /Font << /F1 3 0 R >> >>\n"
-        b"/Contents 4 0 R\n>>\nendobj\n"
-    )
-    font = (
-        b"3 0 obj\n<</Type /Font\n/BaseFont /Helvetica\n"
-        b">>\nendobj\n"
-    )
-    content = (
-        b"4 0 obj\n"
-        b"<</Length " + str(len(stream_id)).encode() + b">>\n"
-        b"stream\n" + stream_id.encode() + b"\nendstream\n"
-        b"endobj\n"
-    )
-    page_tree = (
-        b"2 0 obj\n<</Type /Pages\n/Kids [1 0 R]\n"
-        b"/Count 1\n>>\nendobj\n"
-    )
-    catalog = (
-        b"1 0 obj\n<</Type /Catalog\n/Pages 2 0 R\n" b">>\nendobj\n"
-    )
-    xref_offset = sum(
-        map(len, (header, page, font, content, page_tree, catalog))
-    )
-    xref = (
-        b"xref\n0 " + str(6).encode() + b"\n"
-        b"0000000000 65535 f \n0000000000 65535 f \n"
-        b"0000000000 65535 f \n0000000000 65535 f \n"
-        b"0000000000 65535 f \n0000000000 65535 f \n"
-    )
-    trailer = (
-        b"trailer\n"
-        b"<</Size 6 /Root 1 0 R /Info 5 0 R>>\n"
-        b"startxref\n" + str(xref_offset).encode() + b"\n"
-        b"%%EOF\n"
-    )
-
-    with open(os.path.join(root, stream_id), "wb") as blog_source_stub:
-        blog_source_stub.write(
-            (
-                header
-                + page
-                + font
-                + content
-                + page_tree
-                + catalog
-                + xref
-                + trailer
-            )
-        )
+_SENDFILE_HEADERS: typing.Final[typing.AbstractSet[str]] = frozenset(
+    ("X-Accel-Redirect", "X-Sendfile")
+)
 
 
 class BlogStreamerService:
     """
     Service that interacts with the domain aggregate Blog,
     implementing the logic to translate blog content into
-    a file of the corresponding format (currently supports PDF).
+    files of the supported formats (e.g., PDF, EPUB).
+
+    Translations are keyed by the digest of the blog content
+    and the format, so a blog is only translated again once its
+    content has changed. Outdated translations are removed
+    afterwards.
 
     Parameters
     ----------
-    TODO: Should accept a specific implementation that
-          contains the logic for translating blog text into
-          the corresponding file type, and also refer to a
-          common abstraction.
+    store: BlogArtifactStore
+        The store where the translations are kept.
+    renderers: Iterable[BlogRenderer]
+        The implementations that translate the blog content into
+        the supported formats, one per format. The first one is
+        used by default.
+    prewarmed_formats: Optional[Iterable[str]]
+        The formats translated as soon as a blog is saved,
+        rather than on first request.
 
-    root: PathLike
-        The path to the directory where the blogs should
-        be translated.
+        Default `builtins.None`, the default format only.
+    sendfile_header: Optional[str]
+        If set, translations are not served by the application,
+        but by the front proxy that understands this header:
+        either `X-Accel-Redirect` (nginx) or `X-Sendfile`
+        (Apache, lighttpd).
+
+        Default `builtins.None`.
+    sendfile_root: Optional[str]
+        The location of the store as seen by the front proxy,
+        e.g. an internal nginx location such as `/protected/blogs`.
+        If `builtins.None`, the paths of the translations are
+        used, as `X-Sendfile` expects.
+
+        Default `builtins.None`.
 
     Raises
     ------
-    NotADirectoryError
-        If a non-existent directory is provided for blog
-        translation.
+    ValueError
+        If no renderers, several renderers of the same format,
+        an unsupported prewarmed format or an unsupported
+        sendfile header are provided.
     """
 
-    __slots__: typing.Sequence[str] = ("_root",)
+    __slots__: typing.Sequence[str] = (
+        "_store",
+        "_renderers",
+        "_prewarmed_formats",
+        "_sendfile_header",
+        "_sendfile_root",
+    )
+
+    def __init__(
+        self,
+        store: blog_artifact_store.BlogArtifactStore,
+        renderers: typing.Iterable[blog_renderer.BlogRenderer],
+        *,
+        prewarmed_formats: typing.Optional[typing.Iterable[str]] = None,
+        sendfile_header: typing.Optional[str] = None,
+        sendfile_root: typing.Optional[str] = None,
+    ) -> None:
+        self._renderers: typing.Dict[
+            str, blog_renderer.BlogRenderer
+        ] = {}
+        for renderer in renderers:
+            if renderer.format in self._renderers:
+                raise ValueError(
+                    f"Duplicate renderer for {renderer.format!r}."
+                )
+            self._renderers[renderer.format] = renderer
+        if not self._renderers:
+            raise ValueError("At least one renderer is required.")
 
-    def __init__(self, root: os.PathLike[str]) -> None:
-        if not os.path.exists(root):
-            raise NotADirectoryError(
-                f"The {root!r} directory does not exist."
+        if prewarmed_formats is None:
+            prewarmed_formats = self.formats[:1]
+        self._prewarmed_formats = tuple(prewarmed_formats)
+        for format_ in self._prewarmed_formats:
+            self.get_renderer(format_)
+
+        if sendfile_header and sendfile_header not in _SENDFILE_HEADERS:
+            raise ValueError(
+                f"Unsupported sendfile header {sendfile_header!r}."
             )
-        self._root = root
+        self._store = store
+        self._sendfile_header = sendfile_header or None
+        self._sendfile_root = sendfile_root or None
+
+    @property
+    def formats(self) -> typing.Sequence[str]:
+        """The supported formats, starting with the default one."""
+        return tuple(self._renderers)
+
+    @property
+    def prewarmed_formats(self) -> typing.Sequence[str]:
+        """The formats translated as soon as a blog is saved."""
+        return self._prewarmed_formats
+
+    @property
+    def sendfile_header(self) -> typing.Optional[str]:
+        """
+        The header used to delegate serving translations to the
+        front proxy, or `builtins.None` if they are served by the
+        application itself.
+        """
+        return self._sendfile_header
+
+    def get_renderer(
+        self, format_: typing.Optional[str] = None
+    ) -> blog_renderer.BlogRenderer:
+        """
+        Returns the renderer of a format.
+
+        Parameters
+        ----------
+        format_: Optional[str]
+            The name of the format, or `builtins.None` for the
+            default one.
 
-    @staticmethod
-    def _create_id(blog: blog_.Blog) -> str:
-        stream_id = f"{blog.id}-{blog.slug}.pdf"
+        Raises
+        ------
+        ValueError
+            If the format is not supported.
+        """
+        if format_ is None:
+            format_ = self.formats[0]
+        try:
+            return self._renderers[format_]
+        except KeyError:
+            raise ValueError(
+                f"Unsupported format {format_!r}."
+            ) from None
+
+    def _create_id(
+        self, blog: blog_.Blog, format_: typing.Optional[str] = None
+    ) -> str:
+        renderer = self.get_renderer(format_)
+        stream_id = f"{blog.content.digest}.{renderer.format}"
         return stream_id
 
-    def open(self, blog: blog_.Blog) -> typing.BinaryIO:
+    def _release(self, digest: str) -> None:
+        # Removes the translations of content no longer current
+        # for any blog.
+        if digest in self._store.get_index().values():
+            return
+        for format_ in self._renderers:
+            with contextlib.suppress(FileNotFoundError):
+                self._store.remove(f"{digest}.{format_}")
+
+    def open(
+        self, blog: blog_.Blog, format_: typing.Optional[str] = None
+    ) -> typing.BinaryIO:
         """
         Creates a file translation containing the blog content.
 
@@ -152,33 +211,192 @@ class BlogStreamerService:
         ----------
         blog: Blog
             The blog that needs to be translated.
+        format_: Optional[str]
+            The format of the translation, or `builtins.None`
+            for the default one.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the blog has not been translated yet.
+        """
+        return self._store.open(self._create_id(blog, format_))
+
+    def locate(
+        self, blog: blog_.Blog, format_: typing.Optional[str] = None
+    ) -> str:
+        """
+        Returns the path to the file translation of a blog.
+
+        Parameters
+        ----------
+        blog: Blog
+            The blog whose translation needs to be located.
+        format_: Optional[str]
+            The format of the translation, or `builtins.None`
+            for the default one.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the blog has not been translated yet.
+        """
+        return self._store.locate(self._create_id(blog, format_))
+
+    def sendfile_location(
+        self, blog: blog_.Blog, format_: typing.Optional[str] = None
+    ) -> typing.Optional[str]:
+        """
+        Returns the location of the file translation of a blog
+        as seen by the front proxy, or `builtins.None` if
+        translations are served by the application itself.
+
+        Parameters
+        ----------
+        blog: Blog
+            The blog whose translation needs to be served.
+        format_: Optional[str]
+            The format of the translation, or `builtins.None`
+            for the default one.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the blog has not been translated yet.
+        """
+        if self._sendfile_header is None:
+            return None
+
+        stream_id = self._create_id(blog, format_)
+        path = self._store.locate(stream_id)
+        if self._sendfile_root is None:
+            return path
+        return posixpath.join(
+            self._sendfile_root, self._store.location(stream_id)
+        )
+
+    def is_rendered(
+        self, blog: blog_.Blog, format_: typing.Optional[str] = None
+    ) -> bool:
+        """
+        Checks whether the current content of a blog has been
+        translated.
+
+        Parameters
+        ----------
+        blog: Blog
+            The blog to check.
+        format_: Optional[str]
+            The format of the translation, or `builtins.None`
+            for the default one.
         """
-        stream_id = self._create_id(blog)
-        stream = open(os.path.join(self._root, stream_id), "rb")
-        return stream
+        return self._store.contains(self._create_id(blog, format_))
+
+    def is_prewarmed(self, blog: blog_.Blog) -> bool:
+        """
+        Checks whether the current content of a blog has been
+        translated into every prewarmed format.
+
+        Parameters
+        ----------
+        blog: Blog
+            The blog to check.
+        """
+        return all(
+            self.is_rendered(blog, format_)
+            for format_ in self._prewarmed_formats
+        )
 
     def delete(self, blog: blog_.Blog) -> None:
         """
-        Deletes the already saved translation for a specific
-        blog, based on the previously set directory.
+        Deletes the saved translations for a specific blog.
 
         Parameters
         ----------
         blog: Blog
             The blog whose content needs to be deleted.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the blog has not been translated.
+        """
+        digest = self._store.set_index(blog.id, None)
+        if digest is None:
+            raise FileNotFoundError(
+                f"The blog {blog.id!r} has no sources."
+            )
+        self._release(digest)
+
+    def render(
+        self, blog: blog_.Blog, format_: typing.Optional[str] = None
+    ) -> bool:
+        """
+        Translates the current content of a blog, unless it has
+        already been translated, and removes the translations of
+        its previous content.
+
+        Parameters
+        ----------
+        blog: Blog
+            The blog whose content needs to be translated.
+        format_: Optional[str]
+            The format of the translation, or `builtins.None`
+            for the default one.
+
+        Returns
+        -------
+        bool
+            `builtins.True` if the blog has been translated,
+            `builtins.False` if the translation was up to date.
+        """
+        renderer = self.get_renderer(format_)
+        rendered = self._store.put(
+            self._create_id(blog, renderer.format),
+            functools.partial(renderer.render, blog),
+        )
+
+        digest = blog.content.digest
+        outdated_digest = self._store.set_index(blog.id, digest)
+        if outdated_digest is not None and outdated_digest != digest:
+            self._release(outdated_digest)
+
+        return rendered
+
+    def prewarm(self, blog: blog_.Blog) -> bool:
+        """
+        Translates the current content of a blog into every
+        prewarmed format it has not been translated into yet.
+
+        Parameters
+        ----------
+        blog: Blog
+            The blog whose content needs to be translated.
+
+        Returns
+        -------
+        bool
+            `builtins.True` if the blog has been translated into
+            any of the formats.
         """
-        stream_id = self._create_id(blog)
-        os.remove(os.path.join(self._root, stream_id))
+        rendered = False
+        for format_ in self._prewarmed_formats:
+            rendered |= self.render(blog, format_)
+        return rendered
 
-    def init(self, blog: blog_.Blog) -> None:
+    def init(
+        self, blog: blog_.Blog, format_: typing.Optional[str] = None
+    ) -> None:
         """
-        Initializes the blog content in the previously set
-        directory.
+        Initializes the blog content.
 
         Parameters
         ----------
         blog: Blog
             The blog whose content needs to be initialized.
+        format_: Optional[str]
+            The format of the translation, or `builtins.None`
+            for the default one.
 
         Raises
         ------
@@ -186,11 +404,46 @@ class BlogStreamerService:
             If content for this blog has already been
             initialized.
         """
-        stream_id = self._create_id(blog)
-        if os.path.exists(os.path.join(self._root, stream_id)):
+        if not self.render(blog, format_):
             raise FileExistsError(
-                f"The blog source {stream_id!r} already exists."
+                f"The blog source {self._create_id(blog, format_)!r} "
+                "already exists."
             )
 
-        # FIXME: stub
-        _create_blog_source_stub(self._root, stream_id)
+    def collect_garbage(
+        self, blogs: typing.Iterable[blog_.Blog]
+    ) -> typing.Sequence[str]:
+        """
+        Removes every translation that does not belong to the
+        current content of one of the given blogs, e.g. those
+        of deleted blogs or of formats no longer supported.
+
+        Parameters
+        ----------
+        blogs: Iterable[Blog]
+            All existing blogs.
+
+        Returns
+        -------
+        Sequence[str]
+            The keys of the removed translations.
+        """
+        live_digests = {blog.id: blog.content.digest for blog in blogs}
+        for blog_id in (
+            self._store.get_index().keys() - live_digests.keys()
+        ):
+            self._store.set_index(blog_id, None)
+
+        live_stream_ids = {
+            f"{digest}.{format_}"
+            for digest in live_digests.values()
+            for format_ in self._renderers
+        }
+        removed = []
+        for stream_id in list(self._store.keys()):
+            if stream_id not in live_stream_ids:
+                with contextlib.suppress(FileNotFoundError):
+                    self._store.remove(stream_id)
+                    removed.append(stream_id)
+
+        return removed
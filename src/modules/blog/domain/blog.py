@@ -26,6 +26,7 @@ from __future__ import annotations
 __all__: typing.Sequence[str] = ("Blog",)
 
 import datetime
+import hashlib
 import typing
 import unicodedata
 
@@ -152,6 +153,56 @@ class Blog:
         """The time when the blog was published."""
         return self._created_at
 
+    @property
+    def digest(self) -> str:
+        """
+        A hex-encoded SHA-256 digest of everything the blog is
+        presented from, see `Blog.compute_digest`.
+        """
+        return self.compute_digest(
+            self._content, self._asset, self._category
+        )
+
+    @staticmethod
+    def compute_digest(
+        content: blog_content.BlogContent,
+        asset: blog_asset.BlogAsset,
+        category: blog_category.BlogCategory,
+    ) -> str:
+        """
+        Computes a hex-encoded SHA-256 digest of the parts a blog
+        is presented from. It changes whenever any of them is
+        edited, and only then.
+
+        Parameters
+        ----------
+        content: BlogContent
+            The content contained in the blog.
+        asset: BlogAsset
+            The media representation of the blog.
+        category: BlogCategory
+            The category of the blog.
+
+        Returns
+        -------
+        str
+            The digest of the blog.
+        """
+        hasher = hashlib.sha256()
+        for part in (
+            content.title,
+            content.meta,
+            content.content,
+            asset.thumbnail_url or "",
+            category.value,
+        ):
+            # Each part is length-prefixed, so that moving text
+            # from one part to another changes the digest.
+            encoded = part.encode("utf-8")
+            hasher.update(len(encoded).to_bytes(8, "big"))
+            hasher.update(encoded)
+        return hasher.hexdigest()
+
     def contains_word(
         self, word: str, *, case_sensitive: bool = False
     ) -> bool:
@@ -204,10 +255,29 @@ class Blog:
         """
         # TODO: Is this a meaningful part of the Blog aggregate?
         #       See test_impl/blog/domain/blog.feature
+        return self.compute_slug(self._content.title)
+
+    @staticmethod
+    def compute_slug(title: str) -> blog_slug.BlogSlug:
+        """
+        Generates a slug from a title, see `Blog.make_slug`. It is
+        also used to store the slug along with the blog, so that
+        it is not generated again whenever the blog is loaded.
+
+        Parameters
+        ----------
+        title: str
+            The title of the blog.
+
+        Returns
+        -------
+        BlogSlug
+            The slug of the blog.
+        """
         slug = "-".join(
             _
             for _ in (
-                unicodedata.normalize("NFKD", self._content.title)
+                unicodedata.normalize("NFKD", title)
                 .encode("ascii", "ignore")
                 .decode("ascii")
                 .lower()
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""A module containing the implementation of a blog artifact store."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("BlogArtifactStore",)
+
+import abc
+import typing
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog_id as blog_id_
+
+
+class BlogArtifactStore(abc.ABC):
+    """
+    A content-addressed store of files rendered from blogs
+    (e.g., PDF exports). Every artifact is stored under a key
+    derived from the content it was rendered from, so an
+    artifact is never modified, only replaced by another one.
+
+    Alongside the artifacts, the store keeps an index of the
+    digest of the content that is current for each blog, which
+    the keys of its current artifacts are derived from.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    def open(self, key: str) -> typing.BinaryIO:
+        """
+        Opens a stored artifact for reading.
+
+        Parameters
+        ----------
+        key : str
+            The key of the artifact.
+
+        Raises
+        ------
+        FileNotFoundError
+            If there is no artifact with this key.
+        """
+        ...
+
+    @abc.abstractmethod
+    def locate(self, key: str) -> str:
+        """
+        Returns the path to a stored artifact.
+
+        Parameters
+        ----------
+        key : str
+            The key of the artifact.
+
+        Raises
+        ------
+        FileNotFoundError
+            If there is no artifact with this key.
+        """
+        ...
+
+    @abc.abstractmethod
+    def location(self, key: str) -> str:
+        """
+        Returns the location of an artifact relative to the root
+        of the store, using forward slashes. The artifact does
+        not have to exist.
+
+        Parameters
+        ----------
+        key : str
+            The key of the artifact.
+        """
+        ...
+
+    @abc.abstractmethod
+    def contains(self, key: str) -> bool:
+        """
+        Checks whether an artifact is stored.
+
+        Parameters
+        ----------
+        key : str
+            The key of the artifact.
+        """
+        ...
+
+    @abc.abstractmethod
+    def put(
+        self, key: str, write: typing.Callable[[typing.BinaryIO], None]
+    ) -> bool:
+        """
+        Stores an artifact, unless it is stored already. The
+        artifact only becomes visible once it has been written
+        completely.
+
+        Parameters
+        ----------
+        key : str
+            The key of the artifact.
+        write : Callable[[BinaryIO], None]
+            A function writing the artifact to a binary stream.
+
+        Returns
+        -------
+        bool
+            `builtins.True` if the artifact has been written,
+            `builtins.False` if it was stored already.
+        """
+        ...
+
+    @abc.abstractmethod
+    def remove(self, key: str) -> None:
+        """
+        Removes a stored artifact.
+
+        Parameters
+        ----------
+        key : str
+            The key of the artifact.
+
+        Raises
+        ------
+        FileNotFoundError
+            If there is no artifact with this key.
+        """
+        ...
+
+    @abc.abstractmethod
+    def keys(self) -> typing.Iterator[str]:
+        """Iterates over the keys of all stored artifacts."""
+        ...
+
+    @abc.abstractmethod
+    def get_index(self) -> typing.Mapping[blog_id_.BlogId, str]:
+        """
+        Returns the digest of the current content of every
+        indexed blog.
+        """
+        ...
+
+    @abc.abstractmethod
+    def set_index(
+        self, blog_id: blog_id_.BlogId, digest: typing.Optional[str]
+    ) -> typing.Optional[str]:
+        """
+        Sets the digest of the current content of a blog.
+
+        Parameters
+        ----------
+        blog_id : BlogId
+            The unique identifier of the blog.
+        digest : Optional[str]
+            The hex-encoded digest, or `builtins.None` to remove
+            the blog from the index.
+
+        Returns
+        -------
+        Optional[str]
+            The previous digest of the blog, if any.
+        """
+        ...
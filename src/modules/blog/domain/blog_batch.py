@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""A module containing the implementation of a batch of blogs."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("BlogBatch",)
+
+import dataclasses
+import typing
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog as blog_
+    from src.modules.blog.domain import blog_id as blog_id_
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BlogBatch:
+    """
+    The blogs requested at once by their identifiers (see
+    `BlogRepository.get_blogs`), along with the identifiers of
+    those that do not exist.
+    """
+
+    items: typing.Sequence[blog_.Blog]
+    """The blogs found, in the order they have been requested in."""
+
+    missing: typing.Sequence[blog_id_.BlogId]
+    """
+    The identifiers of the blogs not found, in the order they
+    have been requested in.
+    """
+
+    def __iter__(self) -> typing.Iterator[blog_.Blog]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
@@ -26,7 +26,9 @@ from __future__ import annotations
 __all__: typing.Sequence[str] = ("BlogContent",)
 
 import dataclasses
+import hashlib
 import typing
+import unicodedata
 
 
 @dataclasses.dataclass(frozen=True)
@@ -34,11 +36,78 @@ class BlogContent:
     """
     The content contained in the blog. This includes both
     meta-information about the blog and its title with text.
+
+    Along with the text, it keeps its case-insensitive and
+    accent-insensitive form (see `BlogContent.fold`) for
+    searching. It is computed on construction, unless it has
+    been stored with the blog and is provided explicitly.
     """
 
     title: str
     meta: str
     content: str
+    search_text: str = dataclasses.field(
+        default="", compare=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        if not self.search_text:
+            object.__setattr__(
+                self,
+                "search_text",
+                self.compute_search_text(
+                    self.title, self.meta, self.content
+                ),
+            )
+
+    @staticmethod
+    def fold(text: str) -> str:
+        """
+        Returns the case-insensitive and accent-insensitive form
+        of a text, so that "Café" and "cafe" are the same.
+
+        Parameters
+        ----------
+        text: str
+            The text to fold.
+        """
+        decomposed = unicodedata.normalize("NFKD", text.casefold())
+        return "".join(
+            c for c in decomposed if not unicodedata.combining(c)
+        )
+
+    @staticmethod
+    def compute_search_text(title: str, meta: str, content: str) -> str:
+        """
+        Computes the searchable form of blog content: its title,
+        meta and text folded (see `BlogContent.fold`), one per
+        line.
+
+        Parameters
+        ----------
+        title: str
+            The title of the blog.
+        meta: str
+            The meta-information of the blog.
+        content: str
+            The text of the blog.
+        """
+        return "\n".join(map(BlogContent.fold, (title, meta, content)))
+
+    @property
+    def digest(self) -> str:
+        """
+        A hex-encoded SHA-256 digest of the title, meta and text.
+        It changes whenever any of them is edited, and only then.
+        """
+        hasher = hashlib.sha256()
+        for part in (self.title, self.meta, self.content):
+            # Each part is length-prefixed, so that moving text
+            # from one part to another changes the digest.
+            encoded = part.encode("utf-8")
+            hasher.update(len(encoded).to_bytes(8, "big"))
+            hasher.update(encoded)
+        return hasher.hexdigest()
 
     def __contains__(self, item: typing.Any) -> bool:
         if not isinstance(item, str):
@@ -59,7 +128,8 @@ class BlogContent:
             The word to search for within the blog content.
         case_sensitive: bool
             If set to `builtins.True`, the search will be
-            case-sensitive for the given word.
+            case-sensitive for the given word. Otherwise, it is
+            accent-insensitive as well, using the search text.
             Default `builtins.False`.
 
         Returns
@@ -68,16 +138,10 @@ class BlogContent:
             A boolean value indicating whether the specific word
             is present in the blog content.
         """
-        contents: typing.Iterable[str] = (
-            self.title,
-            self.meta,
-            self.content,
-        )
         if not case_sensitive:
-            item = item.lower()
-            contents = map(str.lower, contents)
+            return self.fold(item) in self.search_text
 
-        for content in contents:
+        for content in (self.title, self.meta, self.content):
             if item in content:
                 return True
 
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""A module containing the implementation of a blog cursor."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("BlogCursor",)
+
+import dataclasses
+import datetime
+import typing
+
+from src.modules.blog.domain import blog_id as blog_id_
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog as blog_
+    from src.modules.blog.domain import blog_summary as blog_summary_
+
+_EPOCH: typing.Final[datetime.datetime] = datetime.datetime(
+    1970, 1, 1, tzinfo=datetime.timezone.utc
+)
+_MICROSECOND: typing.Final[datetime.timedelta] = datetime.timedelta(
+    microseconds=1
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class BlogCursor:
+    """
+    A position in the sequence of blogs ordered from the newest
+    to the oldest. Pages that start after a cursor are found
+    without skipping over all of the preceding blogs.
+
+    The string form of a cursor is URL-safe and can be parsed
+    back with `BlogCursor.parse`.
+    """
+
+    created_at: datetime.datetime
+    """The publication time of the last blog before the cursor."""
+
+    sno: blog_id_.BlogId
+    """
+    The identifier of the last blog before the cursor, which
+    disambiguates blogs published at the same time.
+    """
+
+    def __str__(self) -> str:
+        return (
+            f"{(self.created_at - _EPOCH) // _MICROSECOND}.{self.sno}"
+        )
+
+    @classmethod
+    def of(
+        cls, blog: typing.Union[blog_.Blog, blog_summary_.BlogSummary]
+    ) -> BlogCursor:
+        """
+        Creates a cursor pointing right after a specific blog.
+
+        Parameters
+        ----------
+        blog: Union[Blog, BlogSummary]
+            The last blog before the cursor.
+        """
+        return cls(created_at=blog.created_at, sno=blog.id)
+
+    @classmethod
+    def parse(cls, value: str) -> BlogCursor:
+        """
+        Parses the string form of a cursor.
+
+        Parameters
+        ----------
+        value: str
+            The string form of a cursor.
+
+        Raises
+        ------
+        ValueError
+            If the value is not a valid cursor.
+        """
+        microseconds, _, sno = value.partition(".")
+        try:
+            created_at = _EPOCH + int(microseconds) * _MICROSECOND
+        except OverflowError as exc:
+            raise ValueError(f"invalid cursor: {value!r}") from exc
+
+        return cls(created_at=created_at, sno=blog_id_.BlogId(int(sno)))
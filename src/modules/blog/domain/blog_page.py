@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""A module containing the implementation of a page of blogs."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("BlogPage", "BlogCursorPage")
+
+import dataclasses
+import math
+import typing
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog_cursor as blog_cursor_
+    from src.modules.blog.domain import blog_summary as blog_summary_
+
+
+@dataclasses.dataclass(frozen=True)
+class BlogPage:
+    """
+    A single page of a larger collection of blogs, along with
+    the information required to navigate between pages.
+    """
+
+    items: typing.Sequence[blog_summary_.BlogSummary]
+    """The summaries of the blogs on this page."""
+
+    number: int
+    """The 1-based number of this page."""
+
+    size: int
+    """The maximum number of blogs per page."""
+
+    total: int
+    """The number of blogs across all pages."""
+
+    def __iter__(self) -> typing.Iterator[blog_summary_.BlogSummary]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def num_pages(self) -> int:
+        """The number of pages, which is at least one."""
+        return max(1, math.ceil(self.total / self.size))
+
+    @property
+    def has_next(self) -> bool:
+        """Whether there is a page after this one."""
+        return self.number < self.num_pages
+
+    @property
+    def has_previous(self) -> bool:
+        """Whether there is a page before this one."""
+        return self.number > 1
+
+    @property
+    def next_page_number(self) -> int:
+        """The number of the page after this one."""
+        return self.number + 1
+
+    @property
+    def previous_page_number(self) -> int:
+        """The number of the page before this one."""
+        return self.number - 1
+
+
+@dataclasses.dataclass(frozen=True)
+class BlogCursorPage:
+    """
+    A single page of blogs next to a cursor. Unlike `BlogPage`,
+    it does not know its own number, as finding it would mean
+    counting all of the preceding blogs, and it leads to the
+    pages around it through cursors instead.
+    """
+
+    items: typing.Sequence[blog_summary_.BlogSummary]
+    """The summaries of the blogs on this page."""
+
+    next_cursor: typing.Optional[blog_cursor_.BlogCursor]
+    """
+    The cursor after which the next page starts (see
+    `BlogRepository.get_page_after`), or `builtins.None` if
+    this page is the last one.
+    """
+
+    previous_cursor: typing.Optional[blog_cursor_.BlogCursor]
+    """
+    The cursor before which the previous page ends (see
+    `BlogRepository.get_page_before`), or `builtins.None` if
+    this page is the first one.
+    """
+
+    size: int
+    """The maximum number of blogs per page."""
+
+    total: int
+    """The number of blogs across all pages."""
+
+    def __iter__(self) -> typing.Iterator[blog_summary_.BlogSummary]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def num_pages(self) -> int:
+        """The number of pages, which is at least one."""
+        return max(1, math.ceil(self.total / self.size))
+
+    @property
+    def has_next(self) -> bool:
+        """Whether there is a page after this one."""
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        """Whether there is a page before this one."""
+        return self.previous_cursor is not None
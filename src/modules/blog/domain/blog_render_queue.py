@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""A module containing the implementation of a blog render queue."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "BlogRenderJob",
+    "BlogRenderQueue",
+    "BlogRenderStatus",
+)
+
+import abc
+import dataclasses
+import enum
+import typing
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog_id as blog_id_
+
+
+class BlogRenderStatus(str, enum.Enum):
+    """The state of rendering a blog into a static file."""
+
+    PENDING = "pending"
+    """The blog is waiting for a worker (or for another attempt)."""
+
+    RUNNING = "running"
+    """The blog is being rendered by a worker."""
+
+    DONE = "done"
+    """The blog has been rendered."""
+
+    FAILED = "failed"
+    """Every attempt to render the blog has failed."""
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BlogRenderJob:
+    """
+    A request to render a blog, claimed by a worker.
+
+    Parameters
+    ----------
+    blog_id : BlogId
+        The unique identifier of the blog to be rendered.
+    attempts : int
+        The number of attempts made so far, including the
+        current one.
+    formats : Sequence[str]
+        The formats requested besides the prewarmed ones.
+
+        Default is an empty sequence.
+    """
+
+    blog_id: blog_id_.BlogId
+    attempts: int
+    formats: typing.Sequence[str] = ()
+
+
+class BlogRenderQueue(abc.ABC):
+    """
+    A persistent queue of blogs to be rendered into static
+    files (e.g., PDF), so that rendering happens in a worker
+    rather than in the request or signal that caused it.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    def enqueue(
+        self,
+        blog_id: blog_id_.BlogId,
+        formats: typing.Iterable[str] = (),
+    ) -> None:
+        """
+        Requests rendering of a specific blog. If the blog is
+        already waiting in the queue, only the formats are added
+        to its job; otherwise it is (re)queued regardless of its
+        previous status.
+
+        Parameters
+        ----------
+        blog_id : BlogId
+            The unique identifier of the blog to be rendered.
+        formats : Iterable[str]
+            The formats to be rendered besides the prewarmed
+            ones, e.g. those requested by a client.
+
+            Default is an empty iterable.
+        """
+        ...
+
+    @abc.abstractmethod
+    def status(
+        self, blog_id: blog_id_.BlogId
+    ) -> typing.Optional[BlogRenderStatus]:
+        """
+        Returns the rendering status of a specific blog.
+
+        Parameters
+        ----------
+        blog_id : BlogId
+            The unique identifier of the blog.
+
+        Returns
+        -------
+        Optional[BlogRenderStatus]
+            The status, or `builtins.None` if the blog has never
+            been queued.
+        """
+        ...
+
+    @abc.abstractmethod
+    def claim(self, limit: int) -> typing.Sequence[BlogRenderJob]:
+        """
+        Takes up to `limit` pending jobs for processing. A claimed
+        job is not handed out again until its lease expires, so
+        that jobs of a crashed worker are eventually retried.
+
+        Parameters
+        ----------
+        limit : int
+            The maximum number of jobs to claim.
+
+        Returns
+        -------
+        Sequence[BlogRenderJob]
+            The claimed jobs, oldest first. Empty if there is
+            nothing to do.
+        """
+        ...
+
+    @abc.abstractmethod
+    def complete(self, job: BlogRenderJob) -> None:
+        """
+        Marks a claimed job as successfully processed.
+
+        Parameters
+        ----------
+        job : BlogRenderJob
+            The job returned by `BlogRenderQueue.claim`.
+        """
+        ...
+
+    @abc.abstractmethod
+    def fail(self, job: BlogRenderJob, error: str) -> None:
+        """
+        Records a failed attempt of a claimed job. The job is
+        retried later, unless it has run out of attempts.
+
+        Parameters
+        ----------
+        job : BlogRenderJob
+            The job returned by `BlogRenderQueue.claim`.
+        error : str
+            A description of the failure.
+        """
+        ...
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""A module containing the implementation of a blog renderer."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("BlogRenderer",)
+
+import abc
+import typing
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog as blog_
+
+
+class BlogRenderer(abc.ABC):
+    """
+    Translates the content of a Blog aggregate into a document
+    of a specific format (e.g., PDF).
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @property
+    @abc.abstractmethod
+    def format(self) -> str:
+        """
+        The name of the format, which is also the extension of
+        the documents (e.g., `pdf`). It is used to select the
+        renderer, such as in `?format=pdf`.
+        """
+        ...
+
+    @property
+    @abc.abstractmethod
+    def media_type(self) -> str:
+        """The MIME type of the documents (e.g., `application/pdf`)."""
+        ...
+
+    @property
+    def content_type(self) -> str:
+        """
+        The value of the `Content-Type` header the documents are
+        served with. By default, the media type itself.
+        """
+        return self.media_type
+
+    @abc.abstractmethod
+    def render(self, blog: blog_.Blog, stream: typing.BinaryIO) -> None:
+        """
+        Writes the document translated from a blog into a binary
+        stream. The document is written as it is produced, so
+        memory usage does not grow with the length of the blog.
+
+        Parameters
+        ----------
+        blog : Blog
+            The Blog object whose content should be translated.
+        stream : BinaryIO
+            The stream to write the document to. It is neither
+            flushed nor closed.
+        """
+        ...
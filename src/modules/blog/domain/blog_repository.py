@@ -30,7 +30,15 @@ import typing
 
 if typing.TYPE_CHECKING:
     from src.modules.blog.domain import blog as blog_
+    from src.modules.blog.domain import blog_batch as blog_batch_
+    from src.modules.blog.domain import (
+        blog_category_stats as blog_category_stats_,
+    )
+    from src.modules.blog.domain import blog_cursor as blog_cursor_
     from src.modules.blog.domain import blog_id as blog_id_
+    from src.modules.blog.domain import blog_page as blog_page_
+    from src.modules.blog.domain import blog_summary as blog_summary_
+    from src.modules.blog.domain import blog_version as blog_version_
 
 
 class BlogRepository(abc.ABC):
@@ -64,6 +72,71 @@ class BlogRepository(abc.ABC):
         """
         ...
 
+    @abc.abstractmethod
+    def get_blogs(
+        self, blog_ids: typing.Iterable[blog_id_.BlogId]
+    ) -> blog_batch_.BlogBatch:
+        """
+        Returns many blog objects by their unique identifiers
+        at once, rather than with one query per blog.
+
+        Parameters
+        ----------
+        blog_ids : Iterable[BlogId]
+            The unique identifiers of the blogs to be searched
+            for. Repeated identifiers are only looked up once.
+
+        Returns
+        -------
+        BlogBatch
+            The Blog objects found, in the order of their
+            identifiers, and the identifiers of the blogs
+            that do not exist.
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_blog_version(
+        self, blog_id: blog_id_.BlogId
+    ) -> typing.Optional[blog_version_.BlogVersion]:
+        """
+        Returns the current version of a blog by its unique
+        identifier, without loading the blog itself.
+
+        Parameters
+        ----------
+        blog_id : BlogId
+            The unique identifier of the blog.
+
+        Returns
+        -------
+        Optional[BlogVersion]
+            The version of the blog if found, otherwise
+            `builtins.None`.
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_blog_versions(
+        self, blog_ids: typing.Iterable[blog_id_.BlogId]
+    ) -> typing.Mapping[blog_id_.BlogId, blog_version_.BlogVersion]:
+        """
+        Returns the current versions of many blogs at once,
+        rather than with one query per blog.
+
+        Parameters
+        ----------
+        blog_ids : Iterable[BlogId]
+            The unique identifiers of the blogs.
+
+        Returns
+        -------
+        Mapping[BlogId, BlogVersion]
+            The versions of the blogs by their identifiers.
+            Blogs that do not exist are left out.
+        """
+        ...
+
     @abc.abstractmethod
     def get_all_blogs(
         self,
@@ -101,6 +174,207 @@ class BlogRepository(abc.ABC):
         """
         ...
 
+    @abc.abstractmethod
+    def iter_blogs(
+        self, *, chunk_size: int = 100
+    ) -> typing.Iterator[blog_.Blog]:
+        """
+        Iterates over all blogs in the order of their identifiers.
+        Blogs are loaded in chunks as the iteration proceeds, so
+        memory usage does not grow with the number of blogs.
+
+        Parameters
+        ----------
+        chunk_size : int
+            How many blogs are loaded at once.
+
+            Default is 100.
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_latest(
+        self, n: int
+    ) -> typing.Sequence[blog_summary_.BlogSummary]:
+        """
+        Returns summaries of the most recently published blogs,
+        from the newest to the oldest. The cost does not depend
+        on the total number of blogs.
+
+        Parameters
+        ----------
+        n : int
+            The maximum number of blogs to return.
+
+        Returns
+        -------
+        Sequence[BlogSummary]
+            Summaries of at most `n` of the latest blogs.
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_page(
+        self,
+        page: int,
+        size: int,
+        *,
+        filter_: typing.Optional[
+            typing.Mapping[str, typing.Any]
+        ] = None,
+        order_by: typing.Optional[str] = None,
+    ) -> blog_page_.BlogPage:
+        """
+        Returns a single page of blog summaries, with options for
+        filtering and sorting based on specified parameters.
+        Only the blogs on the requested page are loaded.
+
+        Parameters
+        ----------
+        page : int
+            The 1-based number of the page to return. If it is
+            beyond the last page, the last page is returned.
+        size : int
+            The maximum number of blogs per page.
+        filter_ : Optional[Mapping[str, Any]]
+            A dictionary with filtering criteria, as in
+            `BlogRepository.get_all_blogs`.
+
+            Default is `builtins.None`.
+        order_by : Optional[str], optional
+            The field by which to sort the results. If
+            `builtins.None`, the newest blogs come first.
+
+            Default is `builtins.None`.
+
+        Returns
+        -------
+        BlogPage
+            The requested page of blogs, along with the total
+            number of blogs matching the filtering conditions.
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_page_after(
+        self,
+        cursor: typing.Optional[blog_cursor_.BlogCursor],
+        size: int,
+        *,
+        filter_: typing.Optional[
+            typing.Mapping[str, typing.Any]
+        ] = None,
+    ) -> blog_page_.BlogCursorPage:
+        """
+        Returns a single page of blog summaries, ordered from the
+        newest to the oldest, that starts right after a cursor.
+        Unlike `BlogRepository.get_page`, the cost of fetching a
+        page does not grow with the number of preceding blogs.
+
+        Parameters
+        ----------
+        cursor : Optional[BlogCursor]
+            The position after which the page starts. If
+            `builtins.None`, the first page is returned.
+        size : int
+            The maximum number of blogs per page.
+        filter_ : Optional[Mapping[str, Any]]
+            A dictionary with filtering criteria, as in
+            `BlogRepository.get_all_blogs`.
+
+            Default is `builtins.None`.
+
+        Returns
+        -------
+        BlogCursorPage
+            The requested page of blogs, along with the cursors
+            of the pages around it.
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_page_before(
+        self,
+        cursor: typing.Optional[blog_cursor_.BlogCursor],
+        size: int,
+        *,
+        filter_: typing.Optional[
+            typing.Mapping[str, typing.Any]
+        ] = None,
+    ) -> blog_page_.BlogCursorPage:
+        """
+        Returns a single page of blog summaries, ordered from the
+        newest to the oldest, that ends right before a cursor,
+        i.e. the page preceding the one that starts with the
+        blog of the cursor (see `BlogCursorPage.previous_cursor`).
+        As with `BlogRepository.get_page_after`, the cost of
+        fetching a page does not grow with the number of
+        preceding blogs.
+
+        Parameters
+        ----------
+        cursor : Optional[BlogCursor]
+            The position before which the page ends. If
+            `builtins.None`, the first page is returned.
+        size : int
+            The maximum number of blogs per page.
+        filter_ : Optional[Mapping[str, Any]]
+            A dictionary with filtering criteria, as in
+            `BlogRepository.get_all_blogs`.
+
+            Default is `builtins.None`.
+
+        Returns
+        -------
+        BlogCursorPage
+            The requested page of blogs, along with the cursors
+            of the pages around it.
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_category_stats(
+        self,
+    ) -> typing.Sequence[blog_category_stats_.BlogCategoryStats]:
+        """
+        Returns the categories that have at least one blog, along
+        with the number of blogs in each of them and the time of
+        the latest one. The cost depends on the number of
+        categories rather than on the number of blogs.
+
+        Returns
+        -------
+        Sequence[BlogCategoryStats]
+            The statistics of each category, sorted by category.
+        """
+        ...
+
+    @abc.abstractmethod
+    def search(
+        self, query: str, *, page: int, page_size: int
+    ) -> blog_page_.BlogPage:
+        """
+        Searches for blogs matching a query and returns a single
+        page of their summaries, ordered by relevance.
+
+        Parameters
+        ----------
+        query : str
+            The search query, consisting of one or more words.
+        page : int
+            The 1-based number of the page to return. If it is
+            beyond the last page, the last page is returned.
+        page_size : int
+            The maximum number of blogs per page.
+
+        Returns
+        -------
+        BlogPage
+            The requested page of matching blogs, along with the
+            total number of matches.
+        """
+        ...
+
     @abc.abstractmethod
     def save(self, blog: blog_.Blog) -> None:
         """
@@ -115,3 +389,29 @@ class BlogRepository(abc.ABC):
             repository.
         """
         ...
+
+    @abc.abstractmethod
+    def save_many(
+        self,
+        blogs: typing.Iterable[blog_.Blog],
+        *,
+        batch_size: int = 100,
+    ) -> None:
+        """
+        Saves many blog objects at once, within a single
+        transaction. Blogs that already exist are updated, the
+        others are created. Unlike `BlogRepository.save`, the
+        blogs are written in batches, and the follow-up work
+        (e.g., indexing) is done once for all of them.
+
+        Parameters
+        ----------
+        blogs : Iterable[Blog]
+            The Blog objects to be saved or updated in the
+            repository.
+        batch_size : int
+            How many blogs are written with a single statement.
+
+            Default is 100.
+        """
+        ...
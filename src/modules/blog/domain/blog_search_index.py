@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""A module containing the implementation of a blog search index."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("BlogSearchIndex",)
+
+import abc
+import typing
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog as blog_
+    from src.modules.blog.domain import blog_id as blog_id_
+
+
+class BlogSearchIndex(abc.ABC):
+    """
+    An inverted index over the text of Blog aggregates. Each
+    term found in a blog is mapped to the identifiers of the
+    blogs containing it (along with its positions), so that
+    queries are resolved without scanning the blog content.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    def index(self, blog: blog_.Blog) -> None:
+        """
+        Adds the content of a blog to the index. If the blog
+        has already been indexed, its previous terms are
+        replaced.
+
+        Parameters
+        ----------
+        blog : Blog
+            The Blog object whose content should be indexed.
+        """
+        ...
+
+    @abc.abstractmethod
+    def remove(self, blog_id: blog_id_.BlogId) -> None:
+        """
+        Removes all terms of a specific blog from the index.
+
+        Parameters
+        ----------
+        blog_id : BlogId
+            The unique identifier of the blog to be removed
+            from the index.
+        """
+        ...
+
+    @abc.abstractmethod
+    def lookup(
+        self,
+        query: str,
+        *,
+        offset: int = 0,
+        limit: typing.Optional[int] = None,
+    ) -> typing.Sequence[blog_id_.BlogId]:
+        """
+        Resolves a search query against the index. Every word
+        of the query is treated as a term prefix, and blogs
+        matching the query better are ranked higher.
+
+        Parameters
+        ----------
+        query : str
+            The search query, consisting of one or more words.
+        offset : int
+            The number of best matching blogs to skip.
+
+            Default is `0`.
+        limit : Optional[int]
+            The maximum number of identifiers to return. If
+            `builtins.None`, all matching blogs are returned.
+
+            Default is `builtins.None`.
+
+        Returns
+        -------
+        Sequence[BlogId]
+            Identifiers of the matching blogs, ordered by
+            relevance. Empty if nothing matches the query.
+        """
+        ...
+
+    @abc.abstractmethod
+    def count(self, query: str) -> int:
+        """
+        Returns the number of blogs matching a search query,
+        as resolved by `BlogSearchIndex.lookup`.
+
+        Parameters
+        ----------
+        query : str
+            The search query, consisting of one or more words.
+        """
+        ...
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""A module containing the implementation of a blog summary."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("BlogSummary",)
+
+import dataclasses
+import typing
+
+if typing.TYPE_CHECKING:
+    import datetime
+
+    from src.modules.blog.domain import blog_category
+    from src.modules.blog.domain import blog_id
+    from src.modules.blog.domain import blog_slug
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BlogSummary:
+    """
+    A read-only view of a blog that contains everything needed to
+    list it, but not the text of the blog itself. Unlike the Blog
+    aggregate, it is cheap to load many summaries at once, since
+    the potentially large text is never transferred nor allocated.
+    """
+
+    id: blog_id.BlogId
+    """The serial number of the blog."""
+
+    slug: blog_slug.BlogSlug
+    """A short label for the blog."""
+
+    title: str
+    """The title of the blog."""
+
+    meta: str
+    """A short description of the blog."""
+
+    thumbnail_url: typing.Optional[str]
+    """A link to the blog's thumbnail."""
+
+    category: blog_category.BlogCategory
+    """The category of the blog."""
+
+    created_at: datetime.datetime
+    """The time when the blog was published."""
@@ -26,5 +26,8 @@ __all__: typing.Sequence[str] = ("blog_container",)
 import typing
 
 from src.config import container
+from src.shared.infrastructure import container as shared_container_
 
-blog_container = container.BlogContainer()
+blog_container = container.BlogContainer(
+    cache=shared_container_.shared_container.cache
+)
@@ -63,6 +63,9 @@ class BlogConfig(apps.AppConfig):  # type: ignore[misc]
             modules=[
                 "src.modules.blog.infrastructure.django.views",
                 "src.modules.blog.infrastructure.django.callbacks",
+                "src.modules.blog.management.commands.export_blog",
+                "src.modules.blog.management.commands.reindex_blog",
+                "src.modules.blog.management.commands.render_blogs",
                 "src.modules.portfolio.infrastructure.django.views",
             ]
         )
@@ -21,7 +21,16 @@
 # SOFTWARE.
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("blog_created", "blog_deleted")
+__all__: typing.Sequence[str] = (
+    "blog_saved",
+    "blog_deleted",
+    "blog_indexed",
+    "blog_unindexed",
+    "blog_stats_invalidated",
+    "blog_pages_invalidated",
+    "blog_evicted",
+    "blogs_saved_in_bulk",
+)
 
 import contextlib
 import typing
@@ -31,47 +40,52 @@ from django.db.models import signals
 
 from src.config import container
 from src.modules.blog.application.services import blog_streamer
+from src.modules.blog.domain import blog as blog_
+from src.modules.blog.domain import blog_id
+from src.modules.blog.domain import blog_render_queue
+from src.modules.blog.domain import blog_search_index
 from src.modules.blog.infrastructure.persistence import blog_mapper
+from src.modules.blog.infrastructure.persistence import (
+    blog_repository as blog_repository_impl,
+)
 from src.modules.blog.infrastructure.persistence import models
+from src.modules.blog.infrastructure.persistence import (
+    signals as blog_signals,
+)
 from src.shared.infrastructure import ioc
+from src.shared.infrastructure.django import response_cache
 from src.shared.infrastructure.django import settings
 
 
 @dispatch.receiver(signals.post_save, sender=models.BlogModel)
 @ioc.inject
 @typing.no_type_check
-def blog_created(
+def blog_saved(
     instance: models.BlogModel,
-    created: bool,
+    queue: blog_render_queue.BlogRenderQueue = ioc.Provide[
+        container.BlogContainer.blog_render_queue,
+    ],
     streamer: blog_streamer.BlogStreamerService = ioc.Provide[
         container.BlogContainer.blog_streamer,
     ],
     **_: typing.Any,
 ) -> None:
     """
-    After creating a new blog model, it sends a corresponding
-    signal, upon which the blog content is rendered into a
-    static file of a specific format (e.g., PDF) using the
-    appropriate service.
-    """
-    if settings.TESTING:
-        # FIXME: Haven't come up with a better way to disable
-        #        this functionality temporarily for testing
-        #        purposes.
-        return
+    After saving a blog model (either created or edited), it
+    sends a corresponding signal, upon which the blog is queued
+    to be rendered into static files of the prewarmed formats
+    (see `BLOG_PREWARM_FORMATS`) by the `render_blogs` worker,
+    so that saving does not wait for the rendering. Other
+    formats are rendered on their first request.
 
-    if created:
-        mapper = blog_mapper.BlogMapper()
-        domain_model = mapper.model_to_entity(instance)
+    Blogs whose content has already been rendered, e.g. when
+    only their category has changed, are not queued.
+    """
+    mapper = blog_mapper.BlogMapper()
+    domain_model = mapper.model_to_entity(instance)
 
-        with contextlib.suppress(FileExistsError):
-            # Generally, `builtins.FileExistsError` should not
-            # be raised in this situation.
-            #
-            # `contextlib.suppress` is a precaution, as the
-            # blog content might have been created for
-            # some reason.
-            streamer.init(domain_model)
+    if not streamer.is_prewarmed(domain_model):
+        queue.enqueue(domain_model.id)
 
 
 @dispatch.receiver(signals.post_delete, sender=models.BlogModel)
@@ -106,3 +120,127 @@ def blog_deleted(
         # content might have been removed for some reason
         # after initialization.
         streamer.delete(domain_model)
+
+
+@dispatch.receiver(signals.post_save, sender=models.BlogModel)
+@ioc.inject
+@typing.no_type_check
+def blog_indexed(
+    instance: models.BlogModel,
+    index: blog_search_index.BlogSearchIndex = ioc.Provide[
+        container.BlogContainer.blog_search_index,
+    ],
+    **_: typing.Any,
+) -> None:
+    """
+    After saving a blog model (either created or edited), its
+    content is (re)indexed so that search results stay up to
+    date.
+    """
+    mapper = blog_mapper.BlogMapper()
+    index.index(mapper.model_to_entity(instance))
+
+
+@dispatch.receiver(signals.post_delete, sender=models.BlogModel)
+@ioc.inject
+@typing.no_type_check
+def blog_unindexed(
+    instance: models.BlogModel,
+    index: blog_search_index.BlogSearchIndex = ioc.Provide[
+        container.BlogContainer.blog_search_index,
+    ],
+    **_: typing.Any,
+) -> None:
+    """
+    When a blog model is deleted, its terms are removed from
+    the search index.
+    """
+    index.remove(blog_id.BlogId(instance.sno))
+
+
+@dispatch.receiver(
+    [signals.post_save, signals.post_delete], sender=models.BlogModel
+)
+@ioc.inject
+@typing.no_type_check
+def blog_stats_invalidated(
+    repository: blog_repository_impl.DjangoBlogRepository = ioc.Provide[
+        container.BlogContainer.blog_repository,
+    ],
+    **_: typing.Any,
+) -> None:
+    """
+    After saving or deleting a blog model, the cached statistics
+    of blog categories are invalidated once the change is
+    committed, as the blog might have been moved to another
+    category or removed from one.
+    """
+    repository.invalidate_category_stats()
+
+
+@dispatch.receiver(
+    [signals.post_save, signals.post_delete], sender=models.BlogModel
+)
+@typing.no_type_check
+def blog_pages_invalidated(**_: typing.Any) -> None:
+    """
+    After saving or deleting a blog model, the cached pages are
+    invalidated, as any of them might list or link to the blog.
+    """
+    response_cache.bump_content_version()
+
+
+@dispatch.receiver(
+    [signals.post_save, signals.post_delete], sender=models.BlogModel
+)
+@ioc.inject
+@typing.no_type_check
+def blog_evicted(
+    instance: models.BlogModel,
+    repository: blog_repository_impl.DjangoBlogRepository = ioc.Provide[
+        container.BlogContainer.blog_repository,
+    ],
+    **_: typing.Any,
+) -> None:
+    """
+    After saving or deleting a blog model, the blog is dropped
+    from the identity map of the repository and its version in
+    the shared cache is bumped once the change is committed, so
+    that no process serves it stale.
+    """
+    repository.evict(blog_id.BlogId(instance.sno))
+
+
+@dispatch.receiver(blog_signals.blogs_saved)
+@ioc.inject
+@typing.no_type_check
+def blogs_saved_in_bulk(
+    blogs: typing.Sequence[blog_.Blog],
+    index: blog_search_index.BlogSearchIndex = ioc.Provide[
+        container.BlogContainer.blog_search_index,
+    ],
+    queue: blog_render_queue.BlogRenderQueue = ioc.Provide[
+        container.BlogContainer.blog_render_queue,
+    ],
+    streamer: blog_streamer.BlogStreamerService = ioc.Provide[
+        container.BlogContainer.blog_streamer,
+    ],
+    repository: blog_repository_impl.DjangoBlogRepository = ioc.Provide[
+        container.BlogContainer.blog_repository,
+    ],
+    **_: typing.Any,
+) -> None:
+    """
+    After saving many blogs at once (see `BlogRepository.save_many`),
+    they are indexed and queued to be rendered in the transaction
+    that saves them, and the cached statistics and pages are
+    invalidated only once it is committed, rather than once per
+    blog.
+    """
+    for blog in blogs:
+        index.index(blog)
+        if not streamer.is_prewarmed(blog):
+            queue.enqueue(blog.id)
+
+    repository.invalidate_category_stats()
+    response_cache.bump_content_version()
@@ -29,37 +29,112 @@ __all__: typing.Sequence[str] = (
     "blogpost",
 )
 
-import operator
 import typing
 
 from django import http
 from django import shortcuts
-from django.core import paginator as paginator_
+from django.utils import cache as cache_utils
+from django.utils import http as http_utils
+from django.utils import translation
 
 from src.config import container
 from src.modules.blog.application.services import blog_streamer
+from src.modules.blog.domain import blog_cursor
 from src.modules.blog.domain import blog_id
+from src.modules.blog.domain import blog_page
+from src.modules.blog.domain import blog_render_queue
 from src.modules.blog.domain import blog_repository as blog_repository_
 from src.shared.infrastructure import ioc
+from src.shared.infrastructure.django import file_response
+from src.shared.infrastructure.django import response_cache
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog as blog_
+
+_RENDERING_RETRY_AFTER: typing.Final[int] = 5
+_HTML: typing.Final[str] = "html"
+
+
+def _page_number(request: http.HttpRequest) -> int:
+    # Invalid page numbers fall back to the first page, as with
+    # `django.core.paginator.Paginator.get_page`.
+    try:
+        return int(request.GET.get("page", 1))
+    except ValueError:
+        return 1
+
+
+def _cursor(
+    request: http.HttpRequest, name: str
+) -> typing.Optional[blog_cursor.BlogCursor]:
+    # Invalid cursors fall back to the first page as well.
+    try:
+        return blog_cursor.BlogCursor.parse(request.GET[name])
+    except (KeyError, ValueError):
+        return None
 
 
 @ioc.inject
+@response_cache.cached_response
 def blog(
     request: http.HttpRequest,
     repo: blog_repository_.BlogRepository = ioc.Provide[
         container.BlogContainer.blog_repository,
     ],
 ) -> http.HttpResponse:
-    paginator = paginator_.Paginator(repo.get_all_blogs(), 3)
-    blogs = paginator.get_page(request.GET.get("page"))
+    number = _page_number(request)
+    blogs: typing.Union[blog_page.BlogPage, blog_page.BlogCursorPage]
+    if "before" in request.GET:
+        blogs = repo.get_page_before(_cursor(request, "before"), 3)
+    elif "cursor" in request.GET:
+        blogs = repo.get_page_after(_cursor(request, "cursor"), 3)
+    else:
+        blogs = repo.get_page(number, 3)
+
+    next_cursor: typing.Optional[blog_cursor.BlogCursor]
+    previous_cursor: typing.Optional[blog_cursor.BlogCursor]
+    if isinstance(blogs, blog_page.BlogPage):
+        # A numbered page is in the order of cursors too, so the
+        # pages around it are found by the cursors of its blogs
+        # rather than by skipping over all others.
+        number = blogs.number
+        next_cursor = (
+            blog_cursor.BlogCursor.of(blogs.items[-1])
+            if blogs.has_next
+            else None
+        )
+        previous_cursor = (
+            blog_cursor.BlogCursor.of(blogs.items[0])
+            if blogs.has_previous
+            else None
+        )
+    else:
+        # Pages of cursors are numbered by the links leading to
+        # them, except at either end of the blogs.
+        next_cursor = blogs.next_cursor
+        previous_cursor = blogs.previous_cursor
+        if previous_cursor is None:
+            number = 1
+        elif next_cursor is None:
+            number = blogs.num_pages
+        else:
+            number = min(max(number, 2), blogs.num_pages - 1)
 
     response = shortcuts.render(
-        request, "blog/blog.html", {"blogs": blogs}
+        request,
+        "blog/blog.html",
+        {
+            "blogs": blogs,
+            "number": number,
+            "next_cursor": next_cursor,
+            "previous_cursor": previous_cursor,
+        },
     )
     return response
 
 
 @ioc.inject
+@response_cache.cached_response
 def category(
     request: http.HttpRequest,
     category: str,
@@ -67,10 +142,13 @@ def category(
         container.BlogContainer.blog_repository,
     ],
 ) -> http.HttpResponse:
-    posts = repo.get_all_blogs(
-        filter_=dict(category=category), order_by="-time"
+    posts = repo.get_page(
+        _page_number(request),
+        3,
+        filter_=dict(category=category),
+        order_by="-time",
     )
-    if not posts:
+    if not posts.total:
         response = shortcuts.render(
             request,
             "blog/category.html",
@@ -78,9 +156,6 @@ def category(
         )
         return response
 
-    paginator = paginator_.Paginator(posts, 3)
-    posts = paginator.get_page(request.GET.get("page"))
-
     response = shortcuts.render(
         request,
         "blog/category.html",
@@ -90,28 +165,24 @@ def category(
 
 
 @ioc.inject
+@response_cache.cached_response
 def categories(
     request: http.HttpRequest,
     repo: blog_repository_.BlogRepository = ioc.Provide[
         container.BlogContainer.blog_repository,
     ],
 ) -> http.HttpResponse:
-    all_categories = typing.cast(typing.List[str], [])
-    all_categories.extend(
-        set(b.category.value for b in repo.get_all_blogs())
-    )
-    all_categories.sort()
-
     response = shortcuts.render(
         request,
         "blog/categories.html",
-        {"all_categories": all_categories},
+        {"all_categories": repo.get_category_stats()},
     )
     return response
 
 
 @ioc.inject
 @typing.no_type_check
+@response_cache.cached_response
 def search(
     request,
     repo: blog_repository_.BlogRepository = ioc.Provide[
@@ -131,18 +202,9 @@ def search(
         )
         return response
 
-    blogs = repo.get_all_blogs()
-    results = []
-    for word in query.split():
-        matching_blogs = [
-            blog for blog in blogs if blog.contains_word(word)
-        ]
-        if matching_blogs:
-            matching_blogs.sort(key=operator.attrgetter("created_at"))
-            results.extend(matching_blogs)
-
-    paginator = paginator_.Paginator(results, 3)
-    results = paginator.get_page(request.GET.get("page"))
+    results = repo.search(
+        query, page=_page_number(request), page_size=3
+    )
 
     response = shortcuts.render(
         request,
@@ -153,14 +215,104 @@ def search(
             "message": (
                 ""
                 if results
-                else "Sorry, no results found for your search query.",
+                else "Sorry, no results found for your search query."
             ),
         },
     )
     return response
 
 
+def _not_found(
+    request: http.HttpRequest, message: str
+) -> http.HttpResponse:
+    response = shortcuts.render(
+        request, "404.html", {"message": message}, status=404
+    )
+    return response
+
+
+def _rendering(request: http.HttpRequest) -> http.HttpResponse:
+    response = shortcuts.render(
+        request, "blog/rendering.html", status=202
+    )
+    response.headers["Retry-After"] = str(_RENDERING_RETRY_AFTER)
+    return response
+
+
+def _representation(
+    request: http.HttpRequest,
+    streamer: blog_streamer.BlogStreamerService,
+) -> typing.Optional[str]:
+    # An explicit format takes precedence over the `Accept` header.
+    # Clients accepting none of the formats are sent HTML.
+    requested = request.GET.get("format")
+    if requested is not None:
+        if requested == _HTML or requested in streamer.formats:
+            return requested
+        return None
+
+    media_types = {"text/html": _HTML}
+    for format_ in streamer.formats:
+        media_types.setdefault(
+            streamer.get_renderer(format_).media_type, format_
+        )
+    preferred = request.get_preferred_type(list(media_types))
+    return _HTML if preferred is None else media_types[preferred]
+
+
+def _queue_rendering(
+    request: http.HttpRequest,
+    blog: blog_.Blog,
+    streamer: blog_streamer.BlogStreamerService,
+    queue: blog_render_queue.BlogRenderQueue,
+    format_: str,
+) -> http.HttpResponseBase:
+    status = queue.status(blog.id)
+    if status is blog_render_queue.BlogRenderStatus.FAILED:
+        return _not_found(request, "Blog post source not found")
+
+    formats = (
+        () if format_ in streamer.prewarmed_formats else (format_,)
+    )
+    # Blogs that were never rendered, or whose file has gone
+    # missing, are queued, and waiting jobs get the format added.
+    # A running job is left alone until it is done, as queueing
+    # it again would restart it on every retry of the client.
+    if status is not blog_render_queue.BlogRenderStatus.RUNNING:
+        queue.enqueue(blog.id, formats)
+    return _rendering(request)
+
+
+def _export_response(
+    request: http.HttpRequest,
+    blog: blog_.Blog,
+    streamer: blog_streamer.BlogStreamerService,
+    format_: str,
+    etag: str,
+    last_modified: int,
+) -> http.HttpResponseBase:
+    renderer = streamer.get_renderer(format_)
+    location = streamer.sendfile_location(blog, format_)
+    if location is not None:
+        # The proxy serves the file (and byte ranges of it) itself.
+        return file_response.sendfile_response(
+            typing.cast(str, streamer.sendfile_header),
+            location,
+            content_type=renderer.content_type,
+        )
+
+    return file_response.ranged_file_response(
+        request,
+        streamer.open(blog, format_),
+        content_type=renderer.content_type,
+        filename=f"{blog.slug}.{renderer.format}",
+        etag=etag,
+        last_modified=last_modified,
+    )
+
+
 @ioc.inject
+@response_cache.cached_response
 def blogpost(
     request: http.HttpRequest,
     id: int,
@@ -171,34 +323,74 @@ def blogpost(
     streamer: blog_streamer.BlogStreamerService = ioc.Provide[
         container.BlogContainer.blog_streamer,
     ],
-) -> typing.Union[http.HttpResponse, http.FileResponse]:
-    blog = repo.get_blog(blog_id.BlogId(id))
-    if blog is None:
-        response = shortcuts.render(
-            request,
-            "404.html",
-            {"message": "Blog post not found"},
-            status=404,
-        )
-        return response
+    queue: blog_render_queue.BlogRenderQueue = ioc.Provide[
+        container.BlogContainer.blog_render_queue,
+    ],
+) -> http.HttpResponseBase:
+    version = repo.get_blog_version(blog_id.BlogId(id))
+    if version is None:
+        return _not_found(request, "Blog post not found")
 
-    if request.GET.get("format", "html") == "html":
-        response = shortcuts.render(
-            request, "blog/blogpost.html", {"blog": blog}
-        )
-        return response
+    representation = _representation(request, streamer)
+    if representation is None:
+        return _not_found(request, "Export format not supported")
 
-    try:
-        response = http.FileResponse(
-            streamer.open(blog), content_type="application/pdf"
+    # All representations of a blog depend only on its version,
+    # so the client's copy can be validated without loading it.
+    # The page is translated as well, into the language chosen
+    # by `LocaleMiddleware`.
+    tag = f"{version.id}-{representation}-{version.digest}"
+    if representation == _HTML:
+        language = getattr(
+            request, "LANGUAGE_CODE", translation.get_language()
         )
-        return response
+        tag = f"{tag}-{language}"
+    etag = cache_utils.quote_etag(tag)
+    last_modified = int(version.modified_at.timestamp())
+
+    not_modified = cache_utils.get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    if not_modified is not None:
+        return typing.cast(http.HttpResponseBase, not_modified)
 
-    except FileNotFoundError:
+    blog = repo.get_blog(version.id)
+    if blog is None:
+        return _not_found(request, "Blog post not found")
+
+    response: http.HttpResponseBase
+    if representation == _HTML:
         response = shortcuts.render(
-            request,
-            "404.html",
-            {"message": "Blog post source not found"},
-            status=404,
+            request, "blog/blogpost.html", {"blog": blog}
         )
-        return response
+    else:
+        if (
+            representation not in streamer.prewarmed_formats
+            and not streamer.is_rendered(blog, representation)
+        ):
+            # Formats that are not prewarmed are rendered by the
+            # worker on their first request, as prewarmed ones are
+            # after each change.
+            return _queue_rendering(
+                request, blog, streamer, queue, representation
+            )
+        try:
+            response = _export_response(
+                request,
+                blog,
+                streamer,
+                representation,
+                etag,
+                last_modified,
+            )
+        except FileNotFoundError:
+            return _queue_rendering(
+                request, blog, streamer, queue, representation
+            )
+
+    response.headers["ETag"] = etag
+    response.headers["Last-Modified"] = http_utils.http_date(
+        last_modified
+    )
+    cache_utils.patch_vary_headers(response, ("Accept",))
+    return response
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("FileSystemBlogArtifactStore",)
+
+import contextlib
+import json
+import os
+import re
+import sys
+import tempfile
+import typing
+
+from src.modules.blog.domain import blog_artifact_store
+from src.modules.blog.domain import blog_id as blog_id_
+
+if sys.platform != "win32":
+    import fcntl
+
+# A hex-encoded digest, optionally followed by a file extension.
+_KEY_PATTERN: typing.Final[re.Pattern[str]] = re.compile(
+    r"^[0-9a-f]{8,}(?:\.[a-z0-9]+)?$"
+)
+_INDEX_NAME: typing.Final[str] = "index.json"
+_LOCK_NAME: typing.Final[str] = "index.lock"
+
+
+def _replace_atomically(
+    path: str, write: typing.Callable[[typing.BinaryIO], object]
+) -> None:
+    # Writes the file next to its destination first, so that
+    # readers see either the old or the new file, never a
+    # partially written one.
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(
+        prefix=".", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "wb") as stream:
+            write(stream)
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
+
+
+def _subdirectories(path: str) -> typing.Iterator[os.DirEntry[str]]:
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if len(entry.name) == 2 and entry.is_dir():
+                yield entry
+
+
+class FileSystemBlogArtifactStore(
+    blog_artifact_store.BlogArtifactStore
+):
+    """
+    An artifact store in a directory, which may be shared by
+    several processes or containers (e.g., a mounted volume).
+
+    Artifacts are spread over two levels of subdirectories named
+    after the first characters of their keys, such as
+    `ab/cd/abcd<...>.pdf`, so that no directory grows too large.
+    The index is a JSON file in the root, which is replaced as a
+    whole under a file lock.
+
+    Parameters
+    ----------
+    root : PathLike
+        The directory of the store. It is created if it does not
+        exist yet.
+
+    Raises
+    ------
+    NotADirectoryError
+        If the root exists, but is not a directory.
+    """
+
+    __slots__: typing.Sequence[str] = ("_root",)
+
+    def __init__(self, root: os.PathLike[str]) -> None:
+        if os.path.exists(root) and not os.path.isdir(root):
+            raise NotADirectoryError(
+                f"The {root!r} path is not a directory."
+            )
+        os.makedirs(root, exist_ok=True)
+        self._root = os.fspath(root)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._root, *self.location(key).split("/"))
+
+    @contextlib.contextmanager
+    def _locked(self) -> typing.Iterator[None]:
+        with open(os.path.join(self._root, _LOCK_NAME), "ab") as lock:
+            if sys.platform != "win32":
+                # Released when the file is closed.
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            yield
+
+    def _read_index(self) -> typing.Dict[str, str]:
+        try:
+            with open(
+                os.path.join(self._root, _INDEX_NAME), encoding="utf-8"
+            ) as index:
+                return typing.cast(
+                    typing.Dict[str, str], json.load(index)
+                )
+        except FileNotFoundError:
+            return {}
+
+    def open(self, key: str) -> typing.BinaryIO:
+        # << inherited docstring >>
+        return open(self._path(key), "rb")
+
+    def locate(self, key: str) -> str:
+        # << inherited docstring >>
+        path = self._path(key)
+        if not os.path.isfile(path):
+            raise FileNotFoundError(path)
+        return path
+
+    def location(self, key: str) -> str:
+        # << inherited docstring >>
+        if not _KEY_PATTERN.match(key):
+            raise ValueError(f"Invalid artifact key {key!r}.")
+        return f"{key[:2]}/{key[2:4]}/{key}"
+
+    def contains(self, key: str) -> bool:
+        # << inherited docstring >>
+        return os.path.isfile(self._path(key))
+
+    def put(
+        self, key: str, write: typing.Callable[[typing.BinaryIO], None]
+    ) -> bool:
+        # << inherited docstring >>
+        path = self._path(key)
+        if os.path.exists(path):
+            return False
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # If another process writes the same artifact at the same
+        # time, either of the (identical) files wins.
+        _replace_atomically(path, write)
+        return True
+
+    def remove(self, key: str) -> None:
+        # << inherited docstring >>
+        os.remove(self._path(key))
+
+    def keys(self) -> typing.Iterator[str]:
+        # << inherited docstring >>
+        for first in _subdirectories(self._root):
+            for second in _subdirectories(first.path):
+                with os.scandir(second.path) as entries:
+                    for entry in entries:
+                        if _KEY_PATTERN.match(entry.name):
+                            yield entry.name
+
+    def get_index(self) -> typing.Mapping[blog_id_.BlogId, str]:
+        # << inherited docstring >>
+        # Read under the lock the index is written under, so that
+        # an update in progress is waited for.
+        with self._locked():
+            index = self._read_index()
+
+        return {
+            blog_id_.BlogId(int(id)): digest
+            for id, digest in index.items()
+        }
+
+    def set_index(
+        self, blog_id: blog_id_.BlogId, digest: typing.Optional[str]
+    ) -> typing.Optional[str]:
+        # << inherited docstring >>
+        with self._locked():
+            index = self._read_index()
+            if digest is None:
+                previous = index.pop(str(blog_id), None)
+            else:
+                previous = index.get(str(blog_id))
+                index[str(blog_id)] = digest
+
+            if previous != digest:
+                content = json.dumps(index, sort_keys=True).encode()
+                _replace_atomically(
+                    os.path.join(self._root, _INDEX_NAME),
+                    lambda stream: stream.write(content),
+                )
+
+        return previous
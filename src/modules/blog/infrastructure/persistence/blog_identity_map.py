@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("BlogIdentityMap",)
+
+import collections
+import copy
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog as blog_
+    from src.modules.blog.domain import blog_id as blog_id_
+
+
+class BlogIdentityMap:
+    """
+    A bounded, in-process map of the blogs loaded by a repository,
+    so that the hottest blogs are not read from the database and
+    mapped again on every request.
+
+    The least recently used blog is dropped once the map is full,
+    and every blog is dropped once it gets older than the TTL. The
+    TTL bounds how long other processes may serve a blog that has
+    been changed or deleted elsewhere, unless the version of the
+    blog is shared between processes (see `BlogIdentityMap.get`).
+
+    Parameters
+    ----------
+    max_size : int
+        The number of blogs kept in the map. `0` disables it.
+
+        Default is `256`.
+    ttl : Optional[float]
+        How long (in seconds) a blog is kept in the map. If
+        `builtins.None`, blogs are only dropped when evicted.
+
+        Default is `300`.
+    clock : Callable[[], float]
+        The monotonic clock used to expire blogs.
+
+        Default is `time.monotonic`.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_max_size",
+        "_ttl",
+        "_clock",
+        "_entries",
+        "_lock",
+        "_generation",
+        "_hits",
+        "_misses",
+    )
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl: typing.Optional[float] = 300.0,
+        *,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 0:
+            raise ValueError("max_size must not be negative")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: collections.OrderedDict[
+            blog_id_.BlogId, typing.Tuple[blog_.Blog, float, int]
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_size(self) -> int:
+        """The number of blogs kept in the map."""
+        return self._max_size
+
+    @property
+    def ttl(self) -> typing.Optional[float]:
+        """
+        How long (in seconds) a blog is kept in the map, or
+        `builtins.None` if it is kept until it is evicted.
+        """
+        return self._ttl
+
+    @property
+    def hits(self) -> int:
+        """The number of lookups answered by the map."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups that missed the map."""
+        return self._misses
+
+    @property
+    def generation(self) -> int:
+        """
+        A counter increased whenever blogs are evicted. A blog
+        loaded while it changed is not put into the map (see
+        `BlogIdentityMap.put`).
+        """
+        return self._generation
+
+    def get(
+        self, blog_id: blog_id_.BlogId, *, version: int = 0
+    ) -> typing.Optional[blog_.Blog]:
+        """
+        Returns the blog with the given identifier, if present in
+        the map and not expired.
+
+        Parameters
+        ----------
+        blog_id : BlogId
+            The identifier of the blog.
+        version : int
+            The current version of the blog, e.g. as kept by a
+            cache shared between processes. A blog put into the
+            map with another version is dropped.
+
+            Default is `0`.
+
+        Returns
+        -------
+        Optional[Blog]
+            A copy of the blog, so that editing it does not change
+            the one kept in the map, or `builtins.None` if missing.
+        """
+        with self._lock:
+            entry = self._entries.get(blog_id)
+            if entry is not None:
+                blog, expires_at, blog_version = entry
+                if (
+                    blog_version == version
+                    and self._clock() < expires_at
+                ):
+                    self._entries.move_to_end(blog_id)
+                    self._hits += 1
+                    # The value objects of a blog are immutable, so
+                    # a shallow copy is enough.
+                    return copy.copy(blog)
+                del self._entries[blog_id]
+
+            self._misses += 1
+            return None
+
+    def put(
+        self,
+        blog: blog_.Blog,
+        *,
+        generation: typing.Optional[int] = None,
+        version: int = 0,
+    ) -> None:
+        """
+        Puts a copy of the blog into the map, dropping the least
+        recently used one if the map is full.
+
+        Parameters
+        ----------
+        blog : Blog
+            The blog loaded from the database.
+        generation : Optional[int]
+            The `BlogIdentityMap.generation` read before loading the
+            blog. If blogs have been evicted since, the blog might be
+            stale and is not put into the map.
+
+            Default is `builtins.None`.
+        version : int
+            The version of the blog (see `BlogIdentityMap.get`).
+
+            Default is `0`.
+        """
+        if self._max_size == 0:
+            return
+
+        expires_at = (
+            self._clock() + self._ttl
+            if self._ttl is not None
+            else float("inf")
+        )
+        with self._lock:
+            if (
+                generation is not None
+                and generation != self._generation
+            ):
+                return
+
+            self._entries[blog.id] = (
+                copy.copy(blog),
+                expires_at,
+                version,
+            )
+            self._entries.move_to_end(blog.id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def evict(self, blog_id: blog_id_.BlogId) -> None:
+        """
+        Drops the blog with the given identifier, e.g. after it has
+        been saved or deleted.
+
+        Parameters
+        ----------
+        blog_id : BlogId
+            The identifier of the blog.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(blog_id, None)
+
+    def clear(self) -> None:
+        """Drops all the blogs, keeping the counters."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
@@ -31,6 +31,7 @@ from src.modules.blog.domain import blog_category
 from src.modules.blog.domain import blog_content
 from src.modules.blog.domain import blog_id
 from src.modules.blog.domain import blog_slug
+from src.modules.blog.domain import blog_summary
 from src.modules.blog.infrastructure.persistence import models
 from src.shared.infrastructure import mapper
 
@@ -39,6 +40,18 @@ class BlogMapper(mapper.DataMapper[blog.Blog, models.BlogModel]):
     # << inherited docstring >>
     __slots__: typing.Sequence[str] = ()
 
+    # The fields loaded for a summary, in the order expected by
+    # `row_to_summary`. The text of the blog is left out on purpose.
+    summary_fields: typing.ClassVar[typing.Sequence[str]] = (
+        "sno",
+        "slug",
+        "title",
+        "meta",
+        "thumbnail_url",
+        "category",
+        "time",
+    )
+
     def entity_to_model(self, entity: blog.Blog) -> models.BlogModel:
         # << inherited docstring >>
         model = models.BlogModel(
@@ -59,12 +72,36 @@ class BlogMapper(mapper.DataMapper[blog.Blog, models.BlogModel]):
             sno=blog_id.BlogId(model.sno),
             asset=blog_asset.BlogAsset(model.thumbnail_url),
             category=blog_category.BlogCategory(model.category),
+            # The derived columns are read as they were stored, and
+            # only computed for blogs that have never been saved.
             content=blog_content.BlogContent(
                 title=model.title,
                 meta=model.meta,
                 content=model.content,
+                search_text=model.search_text,
             ),
             created_at=model.time,
-            slug=blog_slug.BlogSlug(model.slug),
+            slug=blog_slug.BlogSlug(model.slug) if model.slug else None,
         )
         return entity
+
+    def row_to_summary(
+        self, row: typing.Sequence[typing.Any]
+    ) -> blog_summary.BlogSummary:
+        sno, slug, title, meta, thumbnail_url, category, time = row
+        summary = blog_summary.BlogSummary(
+            id=blog_id.BlogId(sno),
+            slug=blog_slug.BlogSlug(slug),
+            title=title,
+            meta=meta,
+            thumbnail_url=thumbnail_url,
+            category=blog_category.BlogCategory(category),
+            created_at=time,
+        )
+        return summary
+
+    def rows_to_summaries(
+        self, rows: typing.Iterable[typing.Sequence[typing.Any]]
+    ) -> typing.Sequence[blog_summary.BlogSummary]:
+        summaries = [self.row_to_summary(r) for r in rows]
+        return summaries
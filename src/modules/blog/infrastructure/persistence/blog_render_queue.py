@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("DjangoBlogRenderQueue",)
+
+import datetime
+import typing
+
+from django.db import models as models_
+from django.utils import timezone
+
+from src.modules.blog.domain import blog_id as blog_id_
+from src.modules.blog.domain import blog_render_queue
+from src.modules.blog.infrastructure.persistence import models
+
+_DEFAULT_LEASE: typing.Final[datetime.timedelta] = datetime.timedelta(
+    minutes=5
+)
+_DEFAULT_RETRY_DELAY: typing.Final[datetime.timedelta] = (
+    datetime.timedelta(seconds=30)
+)
+
+
+def _join(formats: typing.Iterable[str]) -> str:
+    return " ".join(sorted(formats))
+
+
+class DjangoBlogRenderQueue(blog_render_queue.BlogRenderQueue):
+    """
+    A render queue stored in the database, one row per blog.
+
+    Jobs are claimed with a compare-and-swap update rather than
+    row locks, so that several workers can share the queue even
+    on SQLite.
+
+    Parameters
+    ----------
+    max_attempts : int
+        The number of attempts after which a job is given up.
+
+        Default is `3`.
+    lease : timedelta
+        How long a claimed job stays with its worker before it
+        is handed out again.
+
+        Default is 5 minutes.
+    retry_delay : timedelta
+        The delay before the first retry, doubled after every
+        further failed attempt.
+
+        Default is 30 seconds.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_max_attempts",
+        "_lease",
+        "_retry_delay",
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        lease: datetime.timedelta = _DEFAULT_LEASE,
+        retry_delay: datetime.timedelta = _DEFAULT_RETRY_DELAY,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be positive")
+        self._max_attempts = max_attempts
+        self._lease = lease
+        self._retry_delay = retry_delay
+
+    def enqueue(
+        self,
+        blog_id: blog_id_.BlogId,
+        formats: typing.Iterable[str] = (),
+    ) -> None:
+        # << inherited docstring >>
+        requested = frozenset(formats)
+        while True:
+            job = (
+                models.BlogRenderJobModel.objects.filter(
+                    blog_id=blog_id
+                )
+                .values_list("status", "attempts", "formats")
+                .first()
+            )
+            if job is None:
+                _, created = (
+                    models.BlogRenderJobModel.objects.get_or_create(
+                        blog_id=blog_id,
+                        defaults={"formats": _join(requested)},
+                    )
+                )
+                if created:
+                    return
+                continue
+
+            status, attempts, job_formats = job
+            changes: typing.Dict[str, typing.Any] = {}
+            if status in (
+                blog_render_queue.BlogRenderStatus.PENDING,
+                blog_render_queue.BlogRenderStatus.RUNNING,
+            ):
+                # The formats of an unfinished job are still due.
+                changes["formats"] = _join(
+                    requested.union(job_formats.split())
+                )
+            else:
+                changes["formats"] = _join(requested)
+            if status != blog_render_queue.BlogRenderStatus.PENDING:
+                changes.update(
+                    status=blog_render_queue.BlogRenderStatus.PENDING,
+                    attempts=0,
+                    available_at=timezone.now(),
+                    last_error="",
+                )
+            elif changes["formats"] == job_formats:
+                return
+
+            # As with claiming, the update only succeeds if no one
+            # else has moved the job on since it was read.
+            updated = models.BlogRenderJobModel.objects.filter(
+                blog_id=blog_id,
+                status=status,
+                attempts=attempts,
+                formats=job_formats,
+            ).update(**changes)
+            if updated:
+                return
+
+    def status(
+        self, blog_id: blog_id_.BlogId
+    ) -> typing.Optional[blog_render_queue.BlogRenderStatus]:
+        # << inherited docstring >>
+        status = (
+            models.BlogRenderJobModel.objects.filter(blog_id=blog_id)
+            .values_list("status", flat=True)
+            .first()
+        )
+        if status is None:
+            return None
+        return blog_render_queue.BlogRenderStatus(status)
+
+    def claim(
+        self, limit: int
+    ) -> typing.Sequence[blog_render_queue.BlogRenderJob]:
+        # << inherited docstring >>
+        now = timezone.now()
+        # Running jobs whose lease has expired were abandoned by
+        # a worker and are claimed again.
+        candidates = (
+            models.BlogRenderJobModel.objects.filter(
+                status__in=(
+                    blog_render_queue.BlogRenderStatus.PENDING,
+                    blog_render_queue.BlogRenderStatus.RUNNING,
+                ),
+                available_at__lte=now,
+            )
+            .order_by("available_at")
+            .values_list(
+                "blog_id", "attempts", "available_at", "formats"
+            )[:limit]
+        )
+
+        jobs = []
+        for id, attempts, available_at, formats in candidates:
+            # Only one worker succeeds in moving the job on from
+            # the state it has just read.
+            claimed = models.BlogRenderJobModel.objects.filter(
+                blog_id=id,
+                attempts=attempts,
+                available_at=available_at,
+                formats=formats,
+            ).update(
+                status=blog_render_queue.BlogRenderStatus.RUNNING,
+                attempts=attempts + 1,
+                available_at=now + self._lease,
+            )
+            if claimed:
+                jobs.append(
+                    blog_render_queue.BlogRenderJob(
+                        blog_id=blog_id_.BlogId(id),
+                        attempts=attempts + 1,
+                        formats=tuple(formats.split()),
+                    )
+                )
+
+        return jobs
+
+    def _claimed(
+        self, job: blog_render_queue.BlogRenderJob
+    ) -> models_.QuerySet[models.BlogRenderJobModel]:
+        # The job as claimed, unless it has been requeued since.
+        return models.BlogRenderJobModel.objects.filter(
+            blog_id=job.blog_id,
+            status=blog_render_queue.BlogRenderStatus.RUNNING,
+            attempts=job.attempts,
+        )
+
+    def complete(self, job: blog_render_queue.BlogRenderJob) -> None:
+        # << inherited docstring >>
+        self._claimed(job).update(
+            status=blog_render_queue.BlogRenderStatus.DONE,
+            last_error="",
+        )
+
+    def fail(
+        self, job: blog_render_queue.BlogRenderJob, error: str
+    ) -> None:
+        # << inherited docstring >>
+        if job.attempts >= self._max_attempts:
+            self._claimed(job).update(
+                status=blog_render_queue.BlogRenderStatus.FAILED,
+                last_error=error,
+            )
+            return
+
+        delay = self._retry_delay * 2 ** (job.attempts - 1)
+        self._claimed(job).update(
+            status=blog_render_queue.BlogRenderStatus.PENDING,
+            available_at=timezone.now() + delay,
+            last_error=error,
+        )
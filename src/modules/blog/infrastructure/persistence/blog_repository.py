@@ -23,38 +23,287 @@ from __future__ import annotations
 
 __all__: typing.Sequence[str] = ("DjangoBlogRepository",)
 
+import functools
+import math
 import typing
 
+from django.db import transaction
+from django.db.models import aggregates
+
+from src.modules.blog.domain import blog_batch
+from src.modules.blog.domain import blog_category
+from src.modules.blog.domain import blog_category_stats
+from src.modules.blog.domain import blog_cursor as blog_cursor_
+from src.modules.blog.domain import blog_id as blog_id_
+from src.modules.blog.domain import blog_page
 from src.modules.blog.domain import blog_repository
+from src.modules.blog.domain import blog_version
+from src.modules.blog.infrastructure.persistence import (
+    blog_identity_map as blog_identity_map_,
+)
 from src.modules.blog.infrastructure.persistence import blog_mapper
+from src.modules.blog.infrastructure.persistence import (
+    blog_search_index as blog_search_index_impl,
+)
 from src.modules.blog.infrastructure.persistence import models
+from src.modules.blog.infrastructure.persistence import signals
 
 if typing.TYPE_CHECKING:
+    from django.db import models as models_
+
     from src.modules.blog.domain import blog as blog_
-    from src.modules.blog.domain import blog_id as blog_id_
+    from src.modules.blog.domain import (
+        blog_search_index as blog_search_index_,
+    )
+    from src.modules.blog.domain import blog_summary as blog_summary_
+    from src.shared.infrastructure import cache as cache_
+
+_DEFAULT_ORDERING: typing.Final[typing.Sequence[str]] = (
+    "-time",
+    "-sno",
+)
+
+
+# The statistics are invalidated whenever a blog is saved or deleted
+# (see `callbacks`). The timeout only bounds staleness for caches
+# that are not shared between processes.
+_CATEGORY_STATS_NAMESPACE: typing.Final[str] = "blog:category-stats"
+_CATEGORY_STATS_CACHE_TIMEOUT: typing.Final[int] = 60 * 60
+
+
+# The columns overwritten when `save_many` updates an existing blog.
+# The time the blog has been published at is kept.
+_BULK_UPDATE_FIELDS: typing.Final[typing.Sequence[str]] = (
+    "title",
+    "meta",
+    "content",
+    "thumbnail_url",
+    "category",
+    "updated_at",
+    *models.BlogModel.derived_fields,
+)
+
+
+def _cache_namespace(blog_id: blog_id_.BlogId) -> str:
+    return f"blog:{blog_id}"
+
+
+def _clamp_page(page: int, size: int, total: int) -> int:
+    num_pages = max(1, math.ceil(total / size))
+    return min(max(1, page), num_pages)
 
 
 class DjangoBlogRepository(blog_repository.BlogRepository):
     # << inherited docstring >>
-    __slots__: typing.Sequence[str] = ("_mapper",)
+    __slots__: typing.Sequence[str] = (
+        "_mapper",
+        "_search_index",
+        "_identity_map",
+        "_cache",
+    )
 
     active_record = models.BlogModel
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        search_index: typing.Optional[
+            blog_search_index_.BlogSearchIndex
+        ] = None,
+        identity_map: typing.Optional[
+            blog_identity_map_.BlogIdentityMap
+        ] = None,
+        cache: typing.Optional[cache_.Cache] = None,
+    ) -> None:
         self._mapper = blog_mapper.BlogMapper()
+        self._search_index = search_index
+        self._identity_map = (
+            identity_map
+            if identity_map is not None
+            else blog_identity_map_.BlogIdentityMap()
+        )
+        self._cache = cache
+
+    @property
+    def search_index(self) -> blog_search_index_.BlogSearchIndex:
+        """
+        The index used to search blogs. Unless provided explicitly,
+        it is chosen on first use, as it depends on the database.
+        """
+        if self._search_index is None:
+            self._search_index = (
+                blog_search_index_impl.create_search_index()
+            )
+        return self._search_index
+
+    @property
+    def identity_map(self) -> blog_identity_map_.BlogIdentityMap:
+        """
+        The map of blogs recently loaded by `get_blog`, along with
+        its hit and miss counters.
+        """
+        return self._identity_map
+
+    def _summaries(
+        self, query_set: models_.QuerySet[models.BlogModel]
+    ) -> typing.Sequence[blog_summary_.BlogSummary]:
+        # Only the summary columns are selected, so that the text
+        # of the blogs is neither transferred nor allocated.
+        return self._mapper.rows_to_summaries(
+            query_set.values_list(*self._mapper.summary_fields)
+        )
+
+    def _cache_version(self, blog_id: blog_id_.BlogId) -> int:
+        # The version of the blog is shared with other processes
+        # through the cache, so that none of them keeps serving
+        # the blog once it has been changed.
+        if self._cache is None:
+            return 0
+        return self._cache.get_version(_cache_namespace(blog_id))
+
+    def _get_cached(
+        self, blog_id: blog_id_.BlogId, *, version: int, generation: int
+    ) -> typing.Optional[blog_.Blog]:
+        aggregate = self._identity_map.get(blog_id, version=version)
+        if aggregate is not None or self._cache is None:
+            return aggregate
+
+        aggregate = self._cache.get(
+            self._cache.versioned_key(
+                _cache_namespace(blog_id), "aggregate", version=version
+            )
+        )
+        if aggregate is not None:
+            self._identity_map.put(
+                aggregate, generation=generation, version=version
+            )
+        return typing.cast("typing.Optional[blog_.Blog]", aggregate)
+
+    def _remember(
+        self, aggregate: blog_.Blog, *, version: int, generation: int
+    ) -> None:
+        # Changes made within a transaction might still be rolled
+        # back, so only committed blogs are kept.
+        if transaction.get_connection().in_atomic_block:
+            return
+
+        self._identity_map.put(
+            aggregate, generation=generation, version=version
+        )
+        if self._cache is not None:
+            # The shared copy expires along with the ones of the
+            # identity maps, so that a blog cached while it was
+            # changed is not served for longer than a local one.
+            self._cache.set(
+                self._cache.versioned_key(
+                    _cache_namespace(aggregate.id),
+                    "aggregate",
+                    version=version,
+                ),
+                aggregate,
+                timeout=self._identity_map.ttl,
+            )
 
     def get_blog(
         self, blog_id: blog_id_.BlogId
     ) -> typing.Optional[blog_.Blog]:
         # << inherited docstring >>
+        version = self._cache_version(blog_id)
+        generation = self._identity_map.generation
+        aggregate = self._get_cached(
+            blog_id, version=version, generation=generation
+        )
+        if aggregate is not None:
+            return aggregate
+
         try:
             model = self.active_record.objects.get(sno=blog_id)
         except self.active_record.DoesNotExist:
             return None
 
         aggregate = self._mapper.model_to_entity(model)
+        self._remember(
+            aggregate, version=version, generation=generation
+        )
         return aggregate
 
+    def get_blogs(
+        self, blog_ids: typing.Iterable[blog_id_.BlogId]
+    ) -> blog_batch.BlogBatch:
+        # << inherited docstring >>
+        blog_ids = list(dict.fromkeys(blog_ids))
+        versions = {
+            blog_id: self._cache_version(blog_id)
+            for blog_id in blog_ids
+        }
+        generation = self._identity_map.generation
+
+        found: typing.Dict[blog_id_.BlogId, blog_.Blog] = {}
+        for blog_id in blog_ids:
+            aggregate = self._get_cached(
+                blog_id,
+                version=versions[blog_id],
+                generation=generation,
+            )
+            if aggregate is not None:
+                found[blog_id] = aggregate
+
+        # The blogs missing from the caches are loaded at once.
+        all_models = self.active_record.objects.in_bulk(
+            [blog_id for blog_id in blog_ids if blog_id not in found]
+        )
+        for model in all_models.values():
+            aggregate = self._mapper.model_to_entity(model)
+            self._remember(
+                aggregate,
+                version=versions[aggregate.id],
+                generation=generation,
+            )
+            found[aggregate.id] = aggregate
+
+        return blog_batch.BlogBatch(
+            items=[
+                found[blog_id]
+                for blog_id in blog_ids
+                if blog_id in found
+            ],
+            missing=[
+                blog_id for blog_id in blog_ids if blog_id not in found
+            ],
+        )
+
+    def get_blog_version(
+        self, blog_id: blog_id_.BlogId
+    ) -> typing.Optional[blog_version.BlogVersion]:
+        # << inherited docstring >>
+        row = (
+            self.active_record.objects.filter(sno=blog_id)
+            .values_list("content_hash", "updated_at")
+            .first()
+        )
+        if row is None:
+            return None
+
+        digest, updated_at = row
+        return blog_version.BlogVersion(
+            id=blog_id, digest=digest, modified_at=updated_at
+        )
+
+    def get_blog_versions(
+        self, blog_ids: typing.Iterable[blog_id_.BlogId]
+    ) -> typing.Mapping[blog_id_.BlogId, blog_version.BlogVersion]:
+        # << inherited docstring >>
+        rows = self.active_record.objects.filter(
+            sno__in=list(blog_ids)
+        ).values_list("sno", "content_hash", "updated_at")
+        return {
+            blog_id_.BlogId(sno): blog_version.BlogVersion(
+                id=blog_id_.BlogId(sno),
+                digest=digest,
+                modified_at=updated_at,
+            )
+            for sno, digest, updated_at in rows
+        }
+
     def get_all_blogs(
         self,
         *,
@@ -73,7 +322,285 @@ class DjangoBlogRepository(blog_repository.BlogRepository):
         blogs = self._mapper.models_to_entities(all_models)
         return blogs
 
+    def iter_blogs(
+        self, *, chunk_size: int = 100
+    ) -> typing.Iterator[blog_.Blog]:
+        # << inherited docstring >>
+        all_models = self.active_record.objects.order_by("sno")
+        return self._mapper.iter_entities(
+            all_models, chunk_size=chunk_size
+        )
+
+    def get_latest(
+        self, n: int
+    ) -> typing.Sequence[blog_summary_.BlogSummary]:
+        # << inherited docstring >>
+        latest_models = self.active_record.objects.order_by(
+            *_DEFAULT_ORDERING
+        )[:n]
+
+        summaries = self._summaries(latest_models)
+        return summaries
+
+    def get_page(
+        self,
+        page: int,
+        size: int,
+        *,
+        filter_: typing.Optional[
+            typing.Mapping[str, typing.Any]
+        ] = None,
+        order_by: typing.Optional[str] = None,
+    ) -> blog_page.BlogPage:
+        # << inherited docstring >>
+        all_models = self.active_record.objects.all()
+        if filter_ is not None:
+            all_models = all_models.filter(**filter_)
+        if order_by is not None:
+            # The identifier makes the order total, so that no blog
+            # shows up on two pages or is skipped between them.
+            all_models = all_models.order_by(order_by, "-sno")
+        else:
+            all_models = all_models.order_by(*_DEFAULT_ORDERING)
+
+        total = all_models.count()
+        page = _clamp_page(page, size, total)
+        offset = (page - 1) * size
+
+        summaries = self._summaries(all_models[offset : offset + size])
+        return blog_page.BlogPage(
+            items=summaries, number=page, size=size, total=total
+        )
+
+    def get_page_after(
+        self,
+        cursor: typing.Optional[blog_cursor_.BlogCursor],
+        size: int,
+        *,
+        filter_: typing.Optional[
+            typing.Mapping[str, typing.Any]
+        ] = None,
+    ) -> blog_page.BlogCursorPage:
+        # << inherited docstring >>
+        all_models = self.active_record.objects.all()
+        if filter_ is not None:
+            all_models = all_models.filter(**filter_)
+        older_models = all_models
+        if cursor is not None:
+            older_models = all_models.filter(
+                time__lte=cursor.created_at
+            ).exclude(time=cursor.created_at, sno__gte=cursor.sno)
+
+        # One extra row tells whether there is a next page.
+        summaries = self._summaries(
+            older_models.order_by(*_DEFAULT_ORDERING)[: size + 1]
+        )
+        items = summaries[:size]
+        return blog_page.BlogCursorPage(
+            items=items,
+            next_cursor=(
+                blog_cursor_.BlogCursor.of(items[-1])
+                if len(summaries) > size
+                else None
+            ),
+            # At least the blog of the cursor comes before.
+            previous_cursor=(
+                blog_cursor_.BlogCursor.of(items[0])
+                if cursor is not None and items
+                else None
+            ),
+            size=size,
+            total=all_models.count(),
+        )
+
+    def get_page_before(
+        self,
+        cursor: typing.Optional[blog_cursor_.BlogCursor],
+        size: int,
+        *,
+        filter_: typing.Optional[
+            typing.Mapping[str, typing.Any]
+        ] = None,
+    ) -> blog_page.BlogCursorPage:
+        # << inherited docstring >>
+        if cursor is None:
+            return self.get_page_after(None, size, filter_=filter_)
+
+        all_models = self.active_record.objects.all()
+        if filter_ is not None:
+            all_models = all_models.filter(**filter_)
+
+        # The newer blogs are read from the cursor on, and one
+        # extra row tells whether there is a previous page.
+        summaries = self._summaries(
+            all_models.filter(time__gte=cursor.created_at)
+            .exclude(time=cursor.created_at, sno__lte=cursor.sno)
+            .order_by("time", "sno")[: size + 1]
+        )
+        if len(summaries) <= size:
+            # Blogs published since the pages were linked might
+            # have left the first page short, so it is read anew.
+            return self.get_page_after(None, size, filter_=filter_)
+
+        items = summaries[size - 1 :: -1]
+        return blog_page.BlogCursorPage(
+            items=items,
+            # At least the blog of the cursor comes after.
+            next_cursor=blog_cursor_.BlogCursor.of(items[-1]),
+            previous_cursor=blog_cursor_.BlogCursor.of(items[0]),
+            size=size,
+            total=all_models.count(),
+        )
+
+    def _category_stats(
+        self,
+    ) -> typing.Sequence[blog_category_stats.BlogCategoryStats]:
+        rows = (
+            self.active_record.objects.values_list("category")
+            .annotate(
+                count=aggregates.Count("sno"),
+                latest_at=aggregates.Max("time"),
+            )
+            .order_by("category")
+        )
+        return [
+            blog_category_stats.BlogCategoryStats(
+                category=blog_category.BlogCategory(category),
+                count=count,
+                latest_at=latest_at,
+            )
+            for category, count, latest_at in rows
+        ]
+
+    def get_category_stats(
+        self,
+    ) -> typing.Sequence[blog_category_stats.BlogCategoryStats]:
+        # << inherited docstring >>
+        if self._cache is None:
+            return self._category_stats()
+
+        # As with blogs, the version is shared with the other
+        # processes, and stats computed before it was bumped are
+        # stored under the previous one.
+        key = self._cache.versioned_key(
+            _CATEGORY_STATS_NAMESPACE, "stats"
+        )
+        stats = self._cache.get(key)
+        if stats is None:
+            stats = self._category_stats()
+            # Changes made within a transaction might still be
+            # rolled back, so only committed stats are kept.
+            if not transaction.get_connection().in_atomic_block:
+                self._cache.set(
+                    key, stats, timeout=_CATEGORY_STATS_CACHE_TIMEOUT
+                )
+
+        return typing.cast(
+            typing.Sequence[blog_category_stats.BlogCategoryStats],
+            stats,
+        )
+
+    def invalidate_category_stats(self) -> None:
+        """
+        Invalidates the cached statistics of blog categories in
+        the shared cache, so that they are recomputed on the next
+        call to `DjangoBlogRepository.get_category_stats` by any
+        process.
+
+        Within a transaction, they are only invalidated once the
+        transaction is committed, as other processes might have
+        cached the statistics as they were until then.
+        """
+        if self._cache is not None:
+            transaction.on_commit(
+                functools.partial(
+                    self._cache.bump_version, _CATEGORY_STATS_NAMESPACE
+                ),
+                robust=True,
+            )
+
+    def search(
+        self, query: str, *, page: int, page_size: int
+    ) -> blog_page.BlogPage:
+        # << inherited docstring >>
+        total = self.search_index.count(query)
+        page = _clamp_page(page, page_size, total)
+
+        blog_ids = self.search_index.lookup(
+            query, offset=(page - 1) * page_size, limit=page_size
+        )
+        summaries = {
+            summary.id: summary
+            for summary in self._summaries(
+                self.active_record.objects.filter(sno__in=blog_ids)
+            )
+        }
+        return blog_page.BlogPage(
+            items=[
+                summaries[blog_id]
+                for blog_id in blog_ids
+                if blog_id in summaries
+            ],
+            number=page,
+            size=page_size,
+            total=total,
+        )
+
     def save(self, blog: blog_.Blog) -> None:
         # << inherited docstring >>
         model = self._mapper.entity_to_model(blog)
         self.active_record.save(model)
+        self.evict(blog.id)
+
+    def save_many(
+        self,
+        blogs: typing.Iterable[blog_.Blog],
+        *,
+        batch_size: int = 100,
+    ) -> None:
+        # << inherited docstring >>
+        blogs = tuple(blogs)
+        all_models = self._mapper.entities_to_models(blogs)
+        for model in all_models:
+            model.fill_derived_columns()
+
+        with transaction.atomic():
+            self.active_record.objects.bulk_create(
+                all_models,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=["sno"],
+                update_fields=_BULK_UPDATE_FIELDS,
+            )
+
+            for blog in blogs:
+                self.evict(blog.id)
+            # What the receivers write is committed along with the
+            # blogs, or not at all.
+            signals.blogs_saved.send(sender=type(self), blogs=blogs)
+
+    def _invalidate(self, blog_id: blog_id_.BlogId) -> None:
+        self._identity_map.evict(blog_id)
+        if self._cache is not None:
+            self._cache.bump_version(_cache_namespace(blog_id))
+
+    def evict(self, blog_id: blog_id_.BlogId) -> None:
+        """
+        Drops the blog from the identity map and invalidates it in
+        the shared cache, so that it is read from the database on
+        the next call to `get_blog` by any process.
+
+        Within a transaction, the blog is invalidated again once
+        the transaction is committed, as other processes might
+        have loaded (and cached) the blog as it was until then.
+
+        Parameters
+        ----------
+        blog_id : BlogId
+            The identifier of the blog that has been saved or
+            deleted.
+        """
+        self._identity_map.evict(blog_id)
+        transaction.on_commit(
+            functools.partial(self._invalidate, blog_id), robust=True
+        )
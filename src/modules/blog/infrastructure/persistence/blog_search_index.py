@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "DjangoBlogSearchIndex",
+    "PostgresBlogSearchIndex",
+    "SqliteBlogSearchIndex",
+    "create_search_index",
+    "tokenize",
+)
+
+import collections
+import functools
+import operator
+import re
+import typing
+
+from django.db import connection
+from django.db import models as models_
+from django.db import transaction
+from django.db.models import aggregates
+from django.utils import html
+
+from src.modules.blog.domain import blog_content
+from src.modules.blog.domain import blog_id as blog_id_
+from src.modules.blog.domain import blog_search_index
+from src.modules.blog.infrastructure.persistence import models
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog as blog_
+
+_WORD_PATTERN: typing.Final[re.Pattern[str]] = re.compile(r"\w+")
+_MAX_TERM_LENGTH: typing.Final[int] = 64
+_MAX_CHARACTER: typing.Final[str] = chr(0x10FFFF)
+
+
+def _prefix_of(term: str) -> models_.Q:
+    # A range condition instead of `startswith`: SQLite compiles the
+    # latter into a case-insensitive LIKE, which cannot use the
+    # (term, blog) index, while a range on the term can.
+    return models_.Q(term__gte=term, term__lt=term + _MAX_CHARACTER)
+
+
+def _terms(folded: str) -> typing.Iterator[str]:
+    for match in _WORD_PATTERN.finditer(html.strip_tags(folded)):
+        yield match.group()[:_MAX_TERM_LENGTH]
+
+
+def tokenize(text: str) -> typing.Iterator[str]:
+    """
+    Splits (possibly HTML) text into normalized index terms,
+    in the order in which they appear in the text. Terms are
+    case-insensitive and accent-insensitive, so that "Café" and
+    "cafe" are indexed as the same term.
+    """
+    return _terms(blog_content.BlogContent.fold(text))
+
+
+class DjangoBlogSearchIndex(blog_search_index.BlogSearchIndex):
+    """
+    A portable search index that keeps the postings of every term
+    in a regular table. Used on databases without full-text search.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    active_record = models.BlogTermModel
+
+    def index(self, blog: blog_.Blog) -> None:
+        # << inherited docstring >>
+        postings: typing.DefaultDict[str, typing.List[int]] = (
+            collections.defaultdict(list)
+        )
+        # The search text has been folded when the blog was saved.
+        terms = _terms(blog.content.search_text)
+        for position, term in enumerate(terms):
+            postings[term].append(position)
+
+        with transaction.atomic():
+            self.remove(blog.id)
+            self.active_record.objects.bulk_create(
+                self.active_record(
+                    term=term,
+                    blog_id=blog.id,
+                    occurrences=len(positions),
+                    positions=" ".join(map(str, positions)),
+                )
+                for term, positions in postings.items()
+            )
+
+    def remove(self, blog_id: blog_id_.BlogId) -> None:
+        # << inherited docstring >>
+        self.active_record.objects.filter(blog_id=blog_id).delete()
+
+    def _postings(
+        self, terms: typing.AbstractSet[str]
+    ) -> models_.QuerySet[models.BlogTermModel]:
+        condition = functools.reduce(
+            operator.or_, map(_prefix_of, terms)
+        )
+        return self.active_record.objects.filter(condition)
+
+    def _by_proximity(
+        self,
+        words: typing.Sequence[str],
+        blog_ids: models_.QuerySet[models.BlogTermModel],
+    ) -> typing.List[int]:
+        # Blogs containing every word of the query are ranked by the
+        # number of words directly followed by the next word of the
+        # query, then by the number of occurrences of their terms.
+        postings = self._postings(set(words)).filter(
+            blog_id__in=blog_ids
+        )
+        occurrences: typing.Counter[int] = collections.Counter()
+        positions: typing.DefaultDict[int, typing.List[typing.Set[int]]]
+        positions = collections.defaultdict(
+            lambda: [set() for _ in words]
+        )
+        for blog_id, term, term_positions in postings.values_list(
+            "blog_id", "term", "positions"
+        ):
+            parsed = [int(_) for _ in term_positions.split()]
+            occurrences[blog_id] += len(parsed)
+            for word, word_positions in zip(words, positions[blog_id]):
+                if term.startswith(word):
+                    word_positions.update(parsed)
+
+        def adjacent(blog_id: int) -> int:
+            pairs = zip(positions[blog_id], positions[blog_id][1:])
+            return sum(
+                len(following.intersection(_ + 1 for _ in preceding))
+                for preceding, following in pairs
+            )
+
+        return sorted(
+            occurrences,
+            key=lambda _: (adjacent(_), occurrences[_], _),
+            reverse=True,
+        )
+
+    def lookup(
+        self,
+        query: str,
+        *,
+        offset: int = 0,
+        limit: typing.Optional[int] = None,
+    ) -> typing.Sequence[blog_id_.BlogId]:
+        # << inherited docstring >>
+        words = list(dict.fromkeys(tokenize(query)))
+        if not words:
+            return []
+
+        # Blogs are ranked by the number of words of the query they
+        # contain, however many index terms a word matches as their
+        # prefix, then by the number of occurrences of these terms,
+        # then by their identifier, as the other indexes do.
+        matched_words = functools.reduce(
+            operator.add,
+            (
+                aggregates.Max(
+                    models_.Case(
+                        models_.When(_prefix_of(word), then=1),
+                        default=0,
+                    )
+                )
+                for word in words
+            ),
+        )
+        ranked = (
+            self._postings(set(words))
+            .values("blog_id")
+            .annotate(
+                matched_words=matched_words,
+                occurrences=aggregates.Sum("occurrences"),
+            )
+            .order_by("-matched_words", "-occurrences", "-blog_id")
+        )
+        stop = None if limit is None else offset + limit
+        if len(words) == 1:
+            blog_ids = ranked.values_list("blog_id", flat=True)
+            return [blog_id_.BlogId(_) for _ in blog_ids[offset:stop]]
+
+        # Among the blogs containing every word of the query, the
+        # ones containing the words as a phrase come first.
+        complete = self._by_proximity(
+            words,
+            ranked.filter(matched_words=len(words)).values("blog_id"),
+        )
+        blog_ids = complete[offset:stop]
+        if stop is None or stop > len(complete):
+            incomplete = ranked.filter(
+                matched_words__lt=len(words)
+            ).values_list("blog_id", flat=True)
+            blog_ids += incomplete[
+                max(offset - len(complete), 0) : (
+                    None if stop is None else stop - len(complete)
+                )
+            ]
+
+        return [blog_id_.BlogId(_) for _ in blog_ids]
+
+    def count(self, query: str) -> int:
+        # << inherited docstring >>
+        terms = set(tokenize(query))
+        if not terms:
+            return 0
+
+        return (
+            self._postings(terms).values("blog_id").distinct().count()
+        )
+
+
+class SqliteBlogSearchIndex(blog_search_index.BlogSearchIndex):
+    """
+    A search index backed by an SQLite FTS5 virtual table, which
+    ranks matching blogs with the bm25 function and paginates them
+    within SQL.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    table_name: typing.ClassVar[str] = "blog_blogfts"
+
+    # Weights of the title, meta and content columns for bm25.
+    _WEIGHTS: typing.ClassVar[str] = "10.0, 5.0, 1.0"
+
+    @staticmethod
+    def _match_expression(query: str) -> typing.Optional[str]:
+        # Every word becomes a quoted prefix query, so that the FTS5
+        # query syntax cannot be injected through the search query.
+        terms = dict.fromkeys(tokenize(query))
+        if not terms:
+            return None
+
+        return " OR ".join(f'"{term}"*' for term in terms)
+
+    def index(self, blog: blog_.Blog) -> None:
+        # << inherited docstring >>
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {self.table_name} WHERE rowid = %s",
+                [blog.id],
+            )
+            cursor.execute(
+                f"INSERT INTO {self.table_name} "
+                f"(rowid, title, meta, content) VALUES (%s, %s, %s, %s)",
+                [
+                    blog.id,
+                    html.strip_tags(blog.content.title),
+                    html.strip_tags(blog.content.meta),
+                    html.strip_tags(blog.content.content),
+                ],
+            )
+
+    def remove(self, blog_id: blog_id_.BlogId) -> None:
+        # << inherited docstring >>
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {self.table_name} WHERE rowid = %s",
+                [blog_id],
+            )
+
+    def lookup(
+        self,
+        query: str,
+        *,
+        offset: int = 0,
+        limit: typing.Optional[int] = None,
+    ) -> typing.Sequence[blog_id_.BlogId]:
+        # << inherited docstring >>
+        match = self._match_expression(query)
+        if match is None:
+            return []
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid FROM {self.table_name} "
+                f"WHERE {self.table_name} MATCH %s "
+                f"ORDER BY bm25({self.table_name}, {self._WEIGHTS}), "
+                f"rowid DESC LIMIT %s OFFSET %s",
+                [match, -1 if limit is None else limit, offset],
+            )
+            return [
+                blog_id_.BlogId(row[0]) for row in cursor.fetchall()
+            ]
+
+    def count(self, query: str) -> int:
+        # << inherited docstring >>
+        match = self._match_expression(query)
+        if match is None:
+            return 0
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {self.table_name} "
+                f"WHERE {self.table_name} MATCH %s",
+                [match],
+            )
+            (count,) = cursor.fetchone()
+            return typing.cast(int, count)
+
+
+class PostgresBlogSearchIndex(blog_search_index.BlogSearchIndex):
+    """
+    A search index backed by a table of PostgreSQL `tsvector`
+    documents with a GIN index, which ranks matching blogs with
+    the `ts_rank` function and paginates them within SQL.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    table_name: typing.ClassVar[str] = "blog_blogtsv"
+
+    # The text is folded beforehand, so that no language-specific
+    # stemming or unaccenting is needed.
+    _DOCUMENT: typing.ClassVar[str] = (
+        "setweight(to_tsvector('simple', %s), 'A') || "
+        "setweight(to_tsvector('simple', %s), 'B') || "
+        "setweight(to_tsvector('simple', %s), 'D')"
+    )
+
+    @staticmethod
+    def _ts_query(query: str) -> typing.Optional[str]:
+        # Terms only consist of word characters, so that the
+        # `tsquery` syntax cannot be injected through the query.
+        terms = dict.fromkeys(tokenize(query))
+        if not terms:
+            return None
+
+        return " | ".join(f"{term}:*" for term in terms)
+
+    def index(self, blog: blog_.Blog) -> None:
+        # << inherited docstring >>
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {self.table_name} (blog_id, document) "
+                f"VALUES (%s, {self._DOCUMENT}) "
+                f"ON CONFLICT (blog_id) "
+                f"DO UPDATE SET document = EXCLUDED.document",
+                [
+                    blog.id,
+                    *(
+                        blog_content.BlogContent.fold(
+                            html.strip_tags(text)
+                        )
+                        for text in (
+                            blog.content.title,
+                            blog.content.meta,
+                            blog.content.content,
+                        )
+                    ),
+                ],
+            )
+
+    def remove(self, blog_id: blog_id_.BlogId) -> None:
+        # << inherited docstring >>
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {self.table_name} WHERE blog_id = %s",
+                [blog_id],
+            )
+
+    def lookup(
+        self,
+        query: str,
+        *,
+        offset: int = 0,
+        limit: typing.Optional[int] = None,
+    ) -> typing.Sequence[blog_id_.BlogId]:
+        # << inherited docstring >>
+        ts_query = self._ts_query(query)
+        if ts_query is None:
+            return []
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT blog_id FROM {self.table_name}, "
+                f"to_tsquery('simple', %s) AS query "
+                f"WHERE document @@ query "
+                f"ORDER BY ts_rank(document, query) DESC, "
+                f"blog_id DESC LIMIT %s OFFSET %s",
+                [ts_query, limit, offset],
+            )
+            return [
+                blog_id_.BlogId(row[0]) for row in cursor.fetchall()
+            ]
+
+    def count(self, query: str) -> int:
+        # << inherited docstring >>
+        ts_query = self._ts_query(query)
+        if ts_query is None:
+            return 0
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {self.table_name} "
+                f"WHERE document @@ to_tsquery('simple', %s)",
+                [ts_query],
+            )
+            (count,) = cursor.fetchone()
+            return typing.cast(int, count)
+
+
+def create_search_index() -> blog_search_index.BlogSearchIndex:
+    """
+    Returns the most efficient search index supported by the
+    database: FTS5 on SQLite (if the virtual table could be
+    created by the migrations), `tsvector` documents on
+    PostgreSQL, the term index otherwise.
+    """
+    if connection.vendor == "postgresql":
+        return PostgresBlogSearchIndex()
+    if (
+        connection.vendor == "sqlite"
+        and SqliteBlogSearchIndex.table_name
+        in connection.introspection.table_names()
+    ):
+        return SqliteBlogSearchIndex()
+
+    return DjangoBlogSearchIndex()
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:15
+from __future__ import annotations
+
+import django.db.models.deletion
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [("blog", "0003_alter_blogmodel_slug")]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogTermModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("term", models.CharField(max_length=64)),
+                ("positions", models.TextField()),
+                (
+                    "blog",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="terms",
+                        to="blog.blogmodel",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("term", "blog"),
+                        name="blog_term_blog_unique",
+                    )
+                ]
+            },
+        )
+    ]
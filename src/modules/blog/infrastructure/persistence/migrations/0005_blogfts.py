@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:02
+from __future__ import annotations
+
+from django.db import migrations
+from django.db import utils
+from django.utils import html
+
+
+def create_search_table(apps, schema_editor):
+    # The FTS5 table is only created on SQLite builds that support it.
+    # Otherwise, the portable term index is used for search.
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    try:
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE blog_blogfts USING fts5("
+            "title, meta, content, "
+            "tokenize = 'unicode61 remove_diacritics 2')"
+        )
+    except utils.OperationalError:
+        return
+
+    blog_model = apps.get_model("blog", "BlogModel")
+    for blog in blog_model.objects.iterator():
+        schema_editor.execute(
+            "INSERT INTO blog_blogfts (rowid, title, meta, content) "
+            "VALUES (%s, %s, %s, %s)",
+            [
+                blog.sno,
+                html.strip_tags(blog.title),
+                html.strip_tags(blog.meta),
+                html.strip_tags(blog.content),
+            ],
+        )
+
+
+def drop_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute("DROP TABLE IF EXISTS blog_blogfts")
+
+
+class Migration(migrations.Migration):
+    dependencies = [("blog", "0004_blogtermmodel")]
+
+    operations = [
+        migrations.RunPython(create_search_table, drop_search_table)
+    ]
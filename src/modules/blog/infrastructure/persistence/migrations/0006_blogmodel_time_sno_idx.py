@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:40
+from __future__ import annotations
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [("blog", "0005_blogfts")]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="blogmodel",
+            index=models.Index(
+                fields=["time", "sno"], name="blog_time_sno_idx"
+            ),
+        )
+    ]
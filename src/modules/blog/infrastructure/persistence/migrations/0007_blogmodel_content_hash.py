@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:05
+from __future__ import annotations
+
+from django.db import migrations
+from django.db import models
+
+from src.modules.blog.domain import blog
+from src.modules.blog.domain import blog_asset
+from src.modules.blog.domain import blog_category
+from src.modules.blog.domain import blog_content
+
+
+def backfill_versions(apps, schema_editor):
+    BlogModel = apps.get_model("blog", "BlogModel")
+    for model in BlogModel.objects.all():
+        # The time of the last edit is unknown, so the time of the
+        # publication is used instead.
+        BlogModel.objects.filter(sno=model.sno).update(
+            content_hash=blog.Blog.compute_digest(
+                blog_content.BlogContent(
+                    title=model.title,
+                    meta=model.meta,
+                    content=model.content,
+                ),
+                blog_asset.BlogAsset(model.thumbnail_url),
+                blog_category.BlogCategory(model.category),
+            ),
+            updated_at=model.time,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [("blog", "0006_blogmodel_time_sno_idx")]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogmodel",
+            name="content_hash",
+            field=models.CharField(
+                default="", editable=False, max_length=64
+            ),
+        ),
+        migrations.AddField(
+            model_name="blogmodel",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(
+            backfill_versions, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,94 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:40
+from __future__ import annotations
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations
+from django.db import models
+
+import src.modules.blog.domain.blog_render_queue
+
+
+class Migration(migrations.Migration):
+    dependencies = [("blog", "0007_blogmodel_content_hash")]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogRenderJobModel",
+            fields=[
+                (
+                    "blog",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="render_job",
+                        serialize=False,
+                        to="blog.blogmodel",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            (
+                                src.modules.blog.domain.blog_render_queue.BlogRenderStatus[
+                                    "PENDING"
+                                ],
+                                src.modules.blog.domain.blog_render_queue.BlogRenderStatus[
+                                    "PENDING"
+                                ],
+                            ),
+                            (
+                                src.modules.blog.domain.blog_render_queue.BlogRenderStatus[
+                                    "RUNNING"
+                                ],
+                                src.modules.blog.domain.blog_render_queue.BlogRenderStatus[
+                                    "RUNNING"
+                                ],
+                            ),
+                            (
+                                src.modules.blog.domain.blog_render_queue.BlogRenderStatus[
+                                    "DONE"
+                                ],
+                                src.modules.blog.domain.blog_render_queue.BlogRenderStatus[
+                                    "DONE"
+                                ],
+                            ),
+                            (
+                                src.modules.blog.domain.blog_render_queue.BlogRenderStatus[
+                                    "FAILED"
+                                ],
+                                src.modules.blog.domain.blog_render_queue.BlogRenderStatus[
+                                    "FAILED"
+                                ],
+                            ),
+                        ],
+                        default=src.modules.blog.domain.blog_render_queue.BlogRenderStatus[
+                            "PENDING"
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                (
+                    "available_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(blank=True, default=""),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["status", "available_at"],
+                        name="blog_render_job_claim_idx",
+                    )
+                ]
+            },
+        )
+    ]
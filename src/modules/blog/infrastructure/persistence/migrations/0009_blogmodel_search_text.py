@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:55
+from __future__ import annotations
+
+from django.db import migrations
+from django.db import models
+
+from src.modules.blog.domain import blog
+from src.modules.blog.domain import blog_content
+
+
+def backfill_derived_columns(apps, schema_editor):
+    BlogModel = apps.get_model("blog", "BlogModel")
+    max_length = BlogModel._meta.get_field("slug").max_length
+    for model in BlogModel.objects.all():
+        # Only blogs without a slug get one, so that no link to an
+        # existing blog is broken.
+        BlogModel.objects.filter(sno=model.sno).update(
+            slug=model.slug
+            or blog.Blog.compute_slug(model.title)[:max_length],
+            search_text=blog_content.BlogContent.compute_search_text(
+                model.title, model.meta, model.content
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [("blog", "0008_blogrenderjobmodel")]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogmodel",
+            name="search_text",
+            field=models.TextField(default="", editable=False),
+        ),
+        migrations.RunPython(
+            backfill_derived_columns, migrations.RunPython.noop
+        ),
+    ]
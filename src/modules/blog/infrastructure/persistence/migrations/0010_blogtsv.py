@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:40
+from __future__ import annotations
+
+from django.db import migrations
+from django.utils import html
+
+from src.modules.blog.domain import blog_content
+
+
+def _fold(text):
+    return blog_content.BlogContent.fold(html.strip_tags(text))
+
+
+def create_search_table(apps, schema_editor):
+    # The tsvector table is only created on PostgreSQL. Other
+    # databases use FTS5 or the portable term index for search.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(
+        "CREATE TABLE blog_blogtsv ("
+        "blog_id bigint PRIMARY KEY, document tsvector NOT NULL)"
+    )
+    schema_editor.execute(
+        "CREATE INDEX blog_blogtsv_document_idx "
+        "ON blog_blogtsv USING GIN (document)"
+    )
+
+    blog_model = apps.get_model("blog", "BlogModel")
+    for blog in blog_model.objects.iterator():
+        schema_editor.execute(
+            "INSERT INTO blog_blogtsv (blog_id, document) VALUES (%s, "
+            "setweight(to_tsvector('simple', %s), 'A') || "
+            "setweight(to_tsvector('simple', %s), 'B') || "
+            "setweight(to_tsvector('simple', %s), 'D'))",
+            [
+                blog.sno,
+                _fold(blog.title),
+                _fold(blog.meta),
+                _fold(blog.content),
+            ],
+        )
+
+
+def drop_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute("DROP TABLE IF EXISTS blog_blogtsv")
+
+
+class Migration(migrations.Migration):
+    dependencies = [("blog", "0009_blogmodel_search_text")]
+
+    operations = [
+        migrations.RunPython(create_search_table, drop_search_table)
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:20
+from __future__ import annotations
+
+from django.db import migrations
+from django.db import models
+from django.db.models import functions
+
+
+def count_occurrences(apps, schema_editor):
+    # Positions were separated by single spaces.
+    BlogTermModel = apps.get_model("blog", "BlogTermModel")
+    BlogTermModel.objects.update(
+        occurrences=functions.Length("positions")
+        - functions.Length(
+            functions.Replace("positions", models.Value(" "))
+        )
+        + 1
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [("blog", "0010_blogtsv")]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogtermmodel",
+            name="occurrences",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.RunPython(
+            count_occurrences, migrations.RunPython.noop
+        ),
+        migrations.RemoveField(
+            model_name="blogtermmodel", name="positions"
+        ),
+        migrations.AddIndex(
+            model_name="blogtermmodel",
+            index=models.Index(
+                fields=["term", "blog", "occurrences"],
+                name="blog_term_occurrences_idx",
+            ),
+        ),
+    ]
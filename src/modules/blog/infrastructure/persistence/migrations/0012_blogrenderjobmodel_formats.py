@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:05
+from __future__ import annotations
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [("blog", "0011_blogtermmodel_occurrences")]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogrenderjobmodel",
+            name="formats",
+            field=models.CharField(
+                blank=True, default="", max_length=255
+            ),
+        )
+    ]
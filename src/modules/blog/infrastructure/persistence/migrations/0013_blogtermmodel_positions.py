@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:40
+from __future__ import annotations
+
+import collections
+
+from django.db import migrations
+from django.db import models
+
+from src.modules.blog.infrastructure.persistence import (
+    blog_search_index,
+)
+
+
+def backfill_positions(apps, schema_editor):
+    # Only blogs that are in the term index are indexed again, as
+    # it is not used on databases with full-text search.
+    BlogModel = apps.get_model("blog", "BlogModel")
+    BlogTermModel = apps.get_model("blog", "BlogTermModel")
+    indexed = BlogTermModel.objects.values("blog_id")
+    for sno, search_text in BlogModel.objects.filter(
+        sno__in=indexed
+    ).values_list("sno", "search_text"):
+        postings = collections.defaultdict(list)
+        for position, term in enumerate(
+            blog_search_index.tokenize(search_text)
+        ):
+            postings[term].append(position)
+
+        BlogTermModel.objects.filter(blog_id=sno).delete()
+        BlogTermModel.objects.bulk_create(
+            BlogTermModel(
+                term=term,
+                blog_id=sno,
+                occurrences=len(positions),
+                positions=" ".join(map(str, positions)),
+            )
+            for term, positions in postings.items()
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [("blog", "0012_blogrenderjobmodel_formats")]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogtermmodel",
+            name="positions",
+            field=models.TextField(default=""),
+        ),
+        migrations.RunPython(
+            backfill_positions, migrations.RunPython.noop
+        ),
+    ]
@@ -21,13 +21,22 @@
 # SOFTWARE.
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("BlogModel",)
+__all__: typing.Sequence[str] = (
+    "BlogModel",
+    "BlogTermModel",
+    "BlogRenderJobModel",
+)
 
 import typing
 
 from django.db import models
+from django.utils import timezone
 
+from src.modules.blog.domain import blog
+from src.modules.blog.domain import blog_asset
 from src.modules.blog.domain import blog_category
+from src.modules.blog.domain import blog_content
+from src.modules.blog.domain import blog_render_queue
 
 
 class BlogModel(models.Model):  # type: ignore[misc]
@@ -48,10 +57,131 @@ class BlogModel(models.Model):  # type: ignore[misc]
         max_length=40,
         unique=False,  # For identification, we use SNO.
     )
+    # See `Blog.digest`, kept up to date on every save.
+    content_hash = models.CharField(
+        max_length=64, editable=False, default=""
+    )
+    # See `BlogContent.search_text`, kept up to date on every save.
+    search_text = models.TextField(editable=False, default="")
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self) -> str:
         return self.title
 
+    # The columns computed from the others by `fill_derived_columns`.
+    derived_fields: typing.ClassVar[typing.Sequence[str]] = (
+        "slug",
+        "content_hash",
+        "search_text",
+    )
+
+    def save(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self.fill_derived_columns()
+        update_fields = kwargs.get("update_fields")
+        if update_fields:
+            kwargs["update_fields"] = {
+                *update_fields,
+                *self.derived_fields,
+            }
+        return super().save(*args, **kwargs)
+
+    def fill_derived_columns(self) -> None:
+        # Derived columns are computed once when saving, rather
+        # than whenever the blog is loaded. Bulk writes, which skip
+        # `save`, have to call this themselves.
+        if not self.slug:
+            self.slug = self.compute_slug()
+        # The content folds its text for searching on construction,
+        # so it is only constructed once.
+        content = blog_content.BlogContent(
+            title=self.title, meta=self.meta, content=self.content
+        )
+        self.content_hash = self.compute_digest(content)
+        self.search_text = content.search_text
+
+    def compute_slug(self) -> str:
+        max_length = self._meta.get_field("slug").max_length
+        return blog.Blog.compute_slug(self.title)[:max_length]
+
+    def compute_digest(self, content: blog_content.BlogContent) -> str:
+        return blog.Blog.compute_digest(
+            content,
+            blog_asset.BlogAsset(self.thumbnail_url),
+            blog_category.BlogCategory(self.category),
+        )
+
     class Meta:
-        indexes = [models.Index(fields=["sno"])]
+        indexes = [
+            models.Index(fields=["sno"]),
+            # Serves newest-first listings and keyset pagination.
+            models.Index(
+                fields=["time", "sno"], name="blog_time_sno_idx"
+            ),
+        ]
         get_latest_by = "time"
+
+
+class BlogTermModel(models.Model):  # type: ignore[misc]
+    term = models.CharField(max_length=64)
+    blog = models.ForeignKey(
+        BlogModel, on_delete=models.CASCADE, related_name="terms"
+    )
+    occurrences = models.PositiveIntegerField(default=1)
+    # Positions of the term in the search text of the blog,
+    # separated by single spaces.
+    positions = models.TextField(default="")
+
+    def __str__(self) -> str:
+        return self.term
+
+    class Meta:
+        constraints = [
+            # Also serves as the (term, blog) index for term lookups.
+            models.UniqueConstraint(
+                fields=["term", "blog"], name="blog_term_blog_unique"
+            )
+        ]
+        indexes = [
+            # Covers the ranking of blogs, which then needs no row
+            # of the table.
+            models.Index(
+                fields=["term", "blog", "occurrences"],
+                name="blog_term_occurrences_idx",
+            )
+        ]
+
+
+class BlogRenderJobModel(models.Model):  # type: ignore[misc]
+    blog = models.OneToOneField(
+        BlogModel,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="render_job",
+    )
+    status = models.CharField(
+        max_length=16,
+        default=blog_render_queue.BlogRenderStatus.PENDING,
+        choices=[
+            (_, _) for _ in list(blog_render_queue.BlogRenderStatus)
+        ],
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    # When a pending job may be claimed, or when the lease of a
+    # running one expires.
+    available_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default="")
+    # The formats requested besides the prewarmed ones, separated
+    # by spaces.
+    formats = models.CharField(max_length=255, blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.blog_id} ({self.status})"
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "available_at"],
+                name="blog_render_job_claim_idx",
+            )
+        ]
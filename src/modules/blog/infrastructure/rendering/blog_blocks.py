@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("Block", "BlockKind", "iter_blocks")
+
+import enum
+import io
+import re
+import typing
+from html import parser as html_parser
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog as blog_
+
+# How much of the blog text is parsed at once.
+_FEED_SIZE: typing.Final[int] = 64 * 1024
+
+_BLOCK_TAGS: typing.Final[typing.AbstractSet[str]] = frozenset(
+    (
+        "article",
+        "blockquote",
+        "div",
+        "footer",
+        "header",
+        "hr",
+        "li",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "table",
+        "tr",
+        "ul",
+    )
+)
+_HEADING_TAGS: typing.Final[typing.AbstractSet[str]] = frozenset(
+    ("h1", "h2", "h3", "h4", "h5", "h6")
+)
+_SKIPPED_TAGS: typing.Final[typing.AbstractSet[str]] = frozenset(
+    ("script", "style")
+)
+_TAG_PATTERN: typing.Final[re.Pattern[str]] = re.compile(
+    r"</?[a-zA-Z][^>]*>"
+)
+_MARKDOWN_HEADING: typing.Final[re.Pattern[str]] = re.compile(
+    r"^#{1,6}\s+(.*)$"
+)
+_MARKDOWN_ITEM: typing.Final[re.Pattern[str]] = re.compile(
+    r"^(?:[-*+]|\d+[.)])\s+(.*)$"
+)
+_MARKDOWN_LINK: typing.Final[re.Pattern[str]] = re.compile(
+    r"!?\[([^\]]*)\]\([^)]*\)"
+)
+_MARKDOWN_EMPHASIS: typing.Final[re.Pattern[str]] = re.compile(
+    r"\*\*|__|`"
+)
+
+
+class BlockKind(enum.Enum):
+    """The role of a block of text within a blog."""
+
+    TITLE = enum.auto()
+    META = enum.auto()
+    HEADING = enum.auto()
+    PARAGRAPH = enum.auto()
+    ITEM = enum.auto()
+    CODE = enum.auto()
+
+
+Block = typing.Tuple[BlockKind, str]
+"""
+A block of text with its role. The text of code blocks keeps
+its lines and whitespace, that of all others is normalized to
+single spaces.
+"""
+
+
+class _HtmlBlockParser(html_parser.HTMLParser):
+    # Splits HTML into blocks of text.
+
+    __slots__: typing.Sequence[str] = (
+        "_blocks",
+        "_text",
+        "_kind",
+        "_skipped",
+    )
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._blocks: typing.List[Block] = []
+        self._text: typing.List[str] = []
+        self._kind = BlockKind.PARAGRAPH
+        self._skipped = 0
+
+    def _flush(self) -> None:
+        text = "".join(self._text)
+        if self._kind is BlockKind.CODE:
+            text = text.strip("\n")
+        else:
+            text = " ".join(text.split())
+        if text.strip():
+            self._blocks.append((self._kind, text))
+        self._text.clear()
+
+    def pop_blocks(self) -> typing.List[Block]:
+        blocks, self._blocks = self._blocks, []
+        return blocks
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+    def handle_starttag(
+        self,
+        tag: str,
+        attrs: typing.List[typing.Tuple[str, typing.Optional[str]]],
+    ) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skipped += 1
+        elif tag == "br":
+            if self._kind is BlockKind.CODE:
+                self._text.append("\n")
+            else:
+                self._flush()
+        elif tag in _HEADING_TAGS or tag in _BLOCK_TAGS:
+            self._flush()
+            if tag in _HEADING_TAGS:
+                self._kind = BlockKind.HEADING
+            elif tag == "pre":
+                self._kind = BlockKind.CODE
+            elif tag == "li":
+                self._kind = BlockKind.ITEM
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skipped = max(self._skipped - 1, 0)
+        elif tag in _HEADING_TAGS or tag in _BLOCK_TAGS:
+            self._flush()
+            self._kind = BlockKind.PARAGRAPH
+
+    def handle_data(self, data: str) -> None:
+        if not self._skipped:
+            self._text.append(data)
+
+
+def _html_blocks(text: str) -> typing.Iterator[Block]:
+    parser = _HtmlBlockParser()
+    for start in range(0, len(text), _FEED_SIZE):
+        parser.feed(text[start : start + _FEED_SIZE])
+        yield from parser.pop_blocks()
+    parser.close()
+    yield from parser.pop_blocks()
+
+
+def _strip_markdown(text: str) -> str:
+    text = _MARKDOWN_LINK.sub(r"\1", text)
+    return _MARKDOWN_EMPHASIS.sub("", text)
+
+
+def _markdown_blocks(text: str) -> typing.Iterator[Block]:
+    kind = BlockKind.PARAGRAPH
+    paragraph: typing.List[str] = []
+    code: typing.Optional[typing.List[str]] = None
+
+    for line in io.StringIO(text):
+        line = line.rstrip("\r\n")
+        if line.lstrip().startswith("```"):
+            if code is None:
+                code = []
+            else:
+                yield BlockKind.CODE, "\n".join(code)
+                code = None
+            continue
+        if code is not None:
+            code.append(line)
+            continue
+
+        stripped = line.strip()
+        heading = _MARKDOWN_HEADING.match(stripped)
+        item = _MARKDOWN_ITEM.match(stripped)
+        if paragraph and (not stripped or heading or item):
+            yield kind, _strip_markdown(" ".join(paragraph))
+            kind, paragraph = BlockKind.PARAGRAPH, []
+
+        if heading:
+            yield BlockKind.HEADING, _strip_markdown(heading.group(1))
+        elif item:
+            kind, paragraph = BlockKind.ITEM, [item.group(1)]
+        elif stripped:
+            paragraph.append(stripped)
+
+    if code:
+        yield BlockKind.CODE, "\n".join(code)
+    if paragraph:
+        yield kind, _strip_markdown(" ".join(paragraph))
+
+
+def iter_blocks(blog: blog_.Blog) -> typing.Iterator[Block]:
+    """
+    Splits a blog into blocks of text, starting with its title
+    and meta-information. The post is parsed incrementally, so
+    blocks are produced before the whole post has been read.
+
+    The content is entered through a rich text editor, but
+    Markdown is supported for posts written by hand, and used
+    if the post contains no tags.
+
+    Parameters
+    ----------
+    blog : Blog
+        The blog to split.
+    """
+    yield BlockKind.TITLE, blog.content.title
+    if blog.content.meta:
+        yield BlockKind.META, blog.content.meta
+
+    if _TAG_PATTERN.search(blog.content.content):
+        yield from _html_blocks(blog.content.content)
+    else:
+        yield from _markdown_blocks(blog.content.content)
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("EpubBlogRenderer",)
+
+import datetime
+import html
+import re
+import typing
+import zipfile
+
+from src.modules.blog.domain import blog_renderer
+from src.modules.blog.infrastructure.rendering import blog_blocks
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog as blog_
+
+_MEDIA_TYPE: typing.Final[str] = "application/epub+zip"
+_LANGUAGE: typing.Final[str] = "en"
+_CONTAINER: typing.Final[str] = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<container version="1.0" '
+    'xmlns="urn:oasis:names:tc:opendocument:xmlns:container">\n'
+    "<rootfiles>\n"
+    '<rootfile full-path="OEBPS/content.opf" '
+    'media-type="application/oebps-package+xml"/>\n'
+    "</rootfiles>\n"
+    "</container>\n"
+)
+_XHTML_HEADER: typing.Final[str] = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    "<!DOCTYPE html>\n"
+    '<html xmlns="http://www.w3.org/1999/xhtml" '
+    'xmlns:epub="http://www.idpf.org/2007/ops" '
+    'xml:lang="{language}" lang="{language}">\n'
+    "<head><title>{title}</title></head>\n"
+    "<body>\n"
+)
+_XHTML_FOOTER: typing.Final[str] = "</body>\n</html>\n"
+_TAGS: typing.Final[typing.Mapping[blog_blocks.BlockKind, str]] = {
+    blog_blocks.BlockKind.TITLE: "h1",
+    blog_blocks.BlockKind.META: "p",
+    blog_blocks.BlockKind.HEADING: "h2",
+    blog_blocks.BlockKind.PARAGRAPH: "p",
+    blog_blocks.BlockKind.ITEM: "li",
+    blog_blocks.BlockKind.CODE: "pre",
+}
+# Characters that are not allowed in XML documents.
+_INVALID_CHARACTERS: typing.Final[re.Pattern[str]] = re.compile(
+    r"[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]"
+)
+
+
+def _escape(text: str) -> str:
+    return html.escape(_INVALID_CHARACTERS.sub("", text))
+
+
+def _entry(name: str) -> zipfile.ZipInfo:
+    # Entries have a fixed timestamp, so that the same blog is
+    # always translated into the same file.
+    entry = zipfile.ZipInfo(name)
+    entry.compress_type = zipfile.ZIP_DEFLATED
+    return entry
+
+
+def _package(blog: blog_.Blog) -> str:
+    modified = blog.created_at.astimezone(datetime.timezone.utc)
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<package xmlns="http://www.idpf.org/2007/opf" '
+        'version="3.0" unique-identifier="id">\n'
+        '<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">\n'
+        f'<dc:identifier id="id">urn:sha256:{blog.content.digest}'
+        "</dc:identifier>\n"
+        f"<dc:title>{_escape(blog.content.title)}</dc:title>\n"
+        f"<dc:language>{_LANGUAGE}</dc:language>\n"
+        '<meta property="dcterms:modified">'
+        f"{modified:%Y-%m-%dT%H:%M:%SZ}</meta>\n"
+        "</metadata>\n"
+        "<manifest>\n"
+        '<item id="nav" href="nav.xhtml" '
+        'media-type="application/xhtml+xml" properties="nav"/>\n'
+        '<item id="content" href="content.xhtml" '
+        'media-type="application/xhtml+xml"/>\n'
+        "</manifest>\n"
+        '<spine><itemref idref="content"/></spine>\n'
+        "</package>\n"
+    )
+
+
+def _content(
+    blog: blog_.Blog, headings: typing.List[str]
+) -> typing.Iterator[str]:
+    # Yields the document piece by piece and collects the text
+    # of its headings for the table of contents.
+    yield _XHTML_HEADER.format(
+        language=_LANGUAGE, title=_escape(blog.content.title)
+    )
+
+    in_list = False
+    for kind, text in blog_blocks.iter_blocks(blog):
+        if in_list and kind is not blog_blocks.BlockKind.ITEM:
+            yield "</ul>\n"
+        elif not in_list and kind is blog_blocks.BlockKind.ITEM:
+            yield "<ul>\n"
+        in_list = kind is blog_blocks.BlockKind.ITEM
+
+        tag = _TAGS[kind]
+        if kind is blog_blocks.BlockKind.HEADING:
+            headings.append(text)
+            yield f'<{tag} id="section-{len(headings)}">'
+        else:
+            yield f"<{tag}>"
+        yield _escape(text)
+        yield f"</{tag}>\n"
+
+    if in_list:
+        yield "</ul>\n"
+    yield _XHTML_FOOTER
+
+
+def _navigation(blog: blog_.Blog, headings: typing.List[str]) -> str:
+    items = "".join(
+        f'<li><a href="content.xhtml#section-{number}">'
+        f"{_escape(heading)}</a></li>\n"
+        for number, heading in enumerate(headings, 1)
+    )
+    return (
+        _XHTML_HEADER.format(
+            language=_LANGUAGE, title=_escape(blog.content.title)
+        )
+        + '<nav epub:type="toc">\n<ol>\n'
+        + '<li><a href="content.xhtml">'
+        + _escape(blog.content.title)
+        + "</a>"
+        + (f"\n<ol>\n{items}</ol>\n" if items else "")
+        + "</li>\n</ol>\n</nav>\n"
+        + _XHTML_FOOTER
+    )
+
+
+class EpubBlogRenderer(blog_renderer.BlogRenderer):
+    """
+    Translates blogs into EPUB 3 e-books with a single chapter
+    and a table of contents of its headings.
+
+    The chapter is compressed as it is produced, so the post
+    is never held in memory as a whole. The translation of a
+    blog is always the same file, as its entries carry no
+    timestamps.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @property
+    def format(self) -> str:
+        # << inherited docstring >>
+        return "epub"
+
+    @property
+    def media_type(self) -> str:
+        # << inherited docstring >>
+        return _MEDIA_TYPE
+
+    def render(self, blog: blog_.Blog, stream: typing.BinaryIO) -> None:
+        # << inherited docstring >>
+        headings: typing.List[str] = []
+        with zipfile.ZipFile(stream, "w") as archive:
+            # The media type comes first and uncompressed, so that
+            # the format can be recognized by its first bytes.
+            archive.writestr(
+                zipfile.ZipInfo("mimetype"),
+                _MEDIA_TYPE,
+                compress_type=zipfile.ZIP_STORED,
+            )
+            archive.writestr(
+                _entry("META-INF/container.xml"), _CONTAINER
+            )
+            archive.writestr(
+                _entry("OEBPS/content.opf"), _package(blog)
+            )
+            with archive.open(
+                _entry("OEBPS/content.xhtml"), "w"
+            ) as content:
+                for part in _content(blog, headings):
+                    content.write(part.encode("utf-8"))
+            archive.writestr(
+                _entry("OEBPS/nav.xhtml"), _navigation(blog, headings)
+            )
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("MarkdownBlogRenderer",)
+
+import re
+import typing
+
+from src.modules.blog.domain import blog_renderer
+from src.modules.blog.infrastructure.rendering import blog_blocks
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog as blog_
+
+# Characters that would otherwise be taken for markup.
+_SPECIAL_CHARACTERS: typing.Final[re.Pattern[str]] = re.compile(
+    r"([\\`*_\[\]<>#|])"
+)
+# Text that would otherwise start a list.
+_ORDERED_MARKER: typing.Final[re.Pattern[str]] = re.compile(
+    r"^(\d+)([.)])"
+)
+_BULLET_MARKER: typing.Final[re.Pattern[str]] = re.compile(r"^([-+])")
+_BACKTICKS: typing.Final[re.Pattern[str]] = re.compile(r"`+")
+_PREFIXES: typing.Final[typing.Mapping[blog_blocks.BlockKind, str]] = {
+    blog_blocks.BlockKind.TITLE: "# ",
+    blog_blocks.BlockKind.HEADING: "## ",
+    blog_blocks.BlockKind.ITEM: "- ",
+}
+
+
+def _escape(text: str) -> str:
+    text = _SPECIAL_CHARACTERS.sub(r"\\\1", text)
+    text = _ORDERED_MARKER.sub(r"\1\\\2", text)
+    return _BULLET_MARKER.sub(r"\\\1", text)
+
+
+def _fence(text: str) -> str:
+    # The fence is longer than any run of backticks in the code.
+    longest = max(map(len, _BACKTICKS.findall(text)), default=0)
+    return "`" * max(3, longest + 1)
+
+
+def _lines(
+    kind: blog_blocks.BlockKind, text: str
+) -> typing.Iterator[str]:
+    if kind is blog_blocks.BlockKind.CODE:
+        fence = _fence(text)
+        yield fence
+        yield from text.split("\n")
+        yield fence
+    elif kind is blog_blocks.BlockKind.META:
+        yield f"*{_escape(text)}*"
+    else:
+        yield _PREFIXES.get(kind, "") + _escape(text)
+
+
+class MarkdownBlogRenderer(blog_renderer.BlogRenderer):
+    """
+    Translates blogs into UTF-8 CommonMark documents. Inline
+    formatting of the post is not preserved, only its structure
+    of headings, paragraphs, lists and code blocks.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @property
+    def format(self) -> str:
+        # << inherited docstring >>
+        return "md"
+
+    @property
+    def media_type(self) -> str:
+        # << inherited docstring >>
+        return "text/markdown"
+
+    @property
+    def content_type(self) -> str:
+        # << inherited docstring >>
+        return "text/markdown; charset=utf-8"
+
+    def render(self, blog: blog_.Blog, stream: typing.BinaryIO) -> None:
+        # << inherited docstring >>
+        previous = None
+        for kind, text in blog_blocks.iter_blocks(blog):
+            # Blocks are separated by blank lines, except for the
+            # items of a list, which would be loose otherwise.
+            if previous is not None and not (
+                kind is previous is blog_blocks.BlockKind.ITEM
+            ):
+                stream.write(b"\n")
+            for line in _lines(kind, text):
+                stream.write(line.encode("utf-8") + b"\n")
+            previous = kind
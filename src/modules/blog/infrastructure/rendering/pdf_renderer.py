@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("PdfBlogRenderer",)
+
+import dataclasses
+import itertools
+import typing
+
+from src.modules.blog.domain import blog_renderer
+from src.modules.blog.infrastructure.rendering import blog_blocks
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog as blog_
+
+_Block = typing.Tuple["_Style", str]
+
+# A4, in points.
+_PAGE_WIDTH: typing.Final[int] = 595
+_PAGE_HEIGHT: typing.Final[int] = 842
+_MARGIN: typing.Final[int] = 72
+
+# Numbers of the objects every document consists of. Pages are
+# numbered from `_FIRST_PAGE` on, two objects per page.
+_CATALOG: typing.Final[int] = 1
+_PAGES: typing.Final[int] = 2
+_HELVETICA: typing.Final[int] = 3
+_COURIER: typing.Final[int] = 4
+_RESOURCES: typing.Final[int] = 5
+_INFO: typing.Final[int] = 6
+_FIRST_PAGE: typing.Final[int] = 7
+
+# Glyph widths of Helvetica for the printable ASCII characters
+# (32-126), in thousandths of the font size.
+_HELVETICA_WIDTHS: typing.Final[typing.Sequence[int]] = tuple(
+    map(
+        int,
+        (
+            "278 278 355 556 556 889 667 191 333 333 389 584 278 333 "
+            "278 278 556 556 556 556 556 556 556 556 556 556 278 278 "
+            "584 584 584 556 1015 667 667 722 722 667 611 778 722 278 "
+            "500 667 556 833 722 778 667 778 722 667 611 722 667 944 "
+            "667 667 611 278 278 278 469 556 333 556 556 500 556 556 "
+            "278 556 556 222 222 500 222 833 556 556 556 556 333 500 "
+            "278 556 500 722 500 500 500 334 260 334 584"
+        ).split(),
+    )
+)
+_DEFAULT_WIDTH: typing.Final[int] = 556
+_COURIER_WIDTH: typing.Final[int] = 600
+
+_BULLET: typing.Final[str] = "\N{BULLET} "
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Style:
+    font: bytes
+    size: int
+    # The distance between the baselines of two lines.
+    leading: int
+    space_before: int
+    gray: float = 0.0
+    monospace: bool = False
+
+
+_TITLE: typing.Final[_Style] = _Style(b"F1", 20, 26, 0)
+_META: typing.Final[_Style] = _Style(b"F1", 11, 15, 6, gray=0.4)
+_HEADING: typing.Final[_Style] = _Style(b"F1", 14, 19, 12)
+_PARAGRAPH: typing.Final[_Style] = _Style(b"F1", 11, 15, 8)
+_CODE: typing.Final[_Style] = _Style(b"F2", 9, 12, 8, monospace=True)
+_STYLES: typing.Final[typing.Mapping[blog_blocks.BlockKind, _Style]] = {
+    blog_blocks.BlockKind.TITLE: _TITLE,
+    blog_blocks.BlockKind.META: _META,
+    blog_blocks.BlockKind.HEADING: _HEADING,
+    blog_blocks.BlockKind.PARAGRAPH: _PARAGRAPH,
+    blog_blocks.BlockKind.CODE: _CODE,
+}
+
+
+def _glyph_width(character: str) -> int:
+    code = ord(character)
+    if 32 <= code <= 126:
+        return _HELVETICA_WIDTHS[code - 32]
+    return _DEFAULT_WIDTH
+
+
+def _text_width(text: str, style: _Style) -> float:
+    if style.monospace:
+        return len(text) * _COURIER_WIDTH * style.size / 1000
+    return sum(map(_glyph_width, text)) * style.size / 1000
+
+
+def _fit(word: str, style: _Style, width: float) -> int:
+    # The length of the longest prefix of the word that fits
+    # into a line, but at least one character.
+    used = 0.0
+    for length, character in enumerate(word):
+        used += _text_width(character, style)
+        if used > width:
+            return max(length, 1)
+    return len(word)
+
+
+def _wrap(
+    text: str, style: _Style, width: float
+) -> typing.Iterator[str]:
+    if style.monospace:
+        # Preformatted text keeps its lines and whitespace.
+        per_line = max(int(width // _text_width(" ", style)), 1)
+        for line in text.expandtabs(4).split("\n"):
+            for start in range(0, max(len(line), 1), per_line):
+                yield line[start : start + per_line]
+        return
+
+    space = _text_width(" ", style)
+    words: typing.List[str] = []
+    used = 0.0
+    for word in text.split():
+        word_width = _text_width(word, style)
+        if words and used + space + word_width <= width:
+            words.append(word)
+            used += space + word_width
+            continue
+
+        if words:
+            yield " ".join(words)
+        # Words longer than a line are broken up.
+        while word_width > width:
+            length = _fit(word, style, width)
+            yield word[:length]
+            word = word[length:]
+            word_width = _text_width(word, style)
+        words, used = [word], word_width
+
+    if words:
+        yield " ".join(words)
+
+
+def _styled(
+    blocks: typing.Iterable[blog_blocks.Block],
+) -> typing.Iterator[_Block]:
+    for kind, text in blocks:
+        if kind is blog_blocks.BlockKind.ITEM:
+            yield _PARAGRAPH, _BULLET + text
+        else:
+            yield _STYLES[kind], text
+
+
+def _encode(text: str) -> bytes:
+    # A literal string in the WinAnsi encoding of standard fonts.
+    encoded = text.encode("cp1252", errors="replace")
+    return (
+        encoded.replace(b"\\", b"\\\\")
+        .replace(b"(", b"\\(")
+        .replace(b")", b"\\)")
+        .replace(b"\r", b"\\r")
+    )
+
+
+def _show_text(style: _Style, y: float, text: str) -> bytes:
+    return b"BT /%s %d Tf %.2f g %d %.2f Td (%s) Tj ET\n" % (
+        style.font,
+        style.size,
+        style.gray,
+        _MARGIN,
+        y,
+        _encode(text),
+    )
+
+
+def _paginate(
+    blocks: typing.Iterable[_Block],
+) -> typing.Iterator[bytes]:
+    # Lays out the blocks line by line and yields the content
+    # stream of every page as soon as the page is full.
+    width = _PAGE_WIDTH - 2 * _MARGIN
+    top = _PAGE_HEIGHT - _MARGIN
+
+    operations: typing.List[bytes] = []
+    y = float(top)
+    for style, text in blocks:
+        for number, line in enumerate(_wrap(text, style, width)):
+            advance = style.leading
+            if number == 0 and operations:
+                advance += style.space_before
+            if y - advance < _MARGIN and operations:
+                yield b"".join(operations)
+                operations = []
+                y, advance = float(top), style.leading
+
+            y -= advance
+            operations.append(_show_text(style, y, line))
+
+    # Every document has at least one page.
+    yield b"".join(operations)
+
+
+class _PdfWriter:
+    # Writes objects to a stream as they are produced, keeping
+    # track of their offsets for the cross-reference table.
+
+    __slots__: typing.Sequence[str] = ("_stream", "_offset", "_offsets")
+
+    def __init__(self, stream: typing.BinaryIO) -> None:
+        self._stream = stream
+        self._offset = 0
+        self._offsets: typing.Dict[int, int] = {}
+
+    def _write(self, data: bytes) -> None:
+        self._stream.write(data)
+        self._offset += len(data)
+
+    def write_header(self) -> None:
+        # The binary comment marks the file as binary for tools
+        # that guess it from the first bytes.
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def write_object(self, number: int, body: bytes) -> None:
+        self.write_object_parts(number, (body,))
+
+    def write_object_parts(
+        self, number: int, parts: typing.Iterable[bytes]
+    ) -> None:
+        self._offsets[number] = self._offset
+        self._write(b"%d 0 obj\n" % number)
+        for part in parts:
+            self._write(part)
+        self._write(b"\nendobj\n")
+
+    def write_stream(self, number: int, content: bytes) -> None:
+        self._offsets[number] = self._offset
+        self._write(
+            b"%d 0 obj\n<< /Length %d >>\nstream\n"
+            % (number, len(content))
+        )
+        self._write(content)
+        self._write(b"\nendstream\nendobj\n")
+
+    def write_trailer(self, root: int, info: int) -> None:
+        size = max(self._offsets) + 1
+        xref_offset = self._offset
+
+        # Every entry is exactly 20 bytes long, including the
+        # two-character end of line.
+        self._write(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+        for number in range(1, size):
+            self._write(b"%010d 00000 n \n" % self._offsets[number])
+        self._write(
+            b"trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\n"
+            b"startxref\n%d\n%%%%EOF\n"
+            % (size, root, info, xref_offset)
+        )
+
+
+class PdfBlogRenderer(blog_renderer.BlogRenderer):
+    """
+    Translates blogs into paginated A4 PDF documents. The post
+    is expected to be HTML, or Markdown if it contains no tags.
+
+    Only the standard Helvetica and Courier fonts are used, so
+    no font files are embedded, but characters outside of the
+    Windows-1252 character set are replaced.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @property
+    def format(self) -> str:
+        # << inherited docstring >>
+        return "pdf"
+
+    @property
+    def media_type(self) -> str:
+        # << inherited docstring >>
+        return "application/pdf"
+
+    def render(self, blog: blog_.Blog, stream: typing.BinaryIO) -> None:
+        # << inherited docstring >>
+        writer = _PdfWriter(stream)
+        writer.write_header()
+        writer.write_object(
+            _HELVETICA,
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+            b"/Encoding /WinAnsiEncoding >>",
+        )
+        writer.write_object(
+            _COURIER,
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier "
+            b"/Encoding /WinAnsiEncoding >>",
+        )
+        writer.write_object(
+            _RESOURCES,
+            b"<< /Font << /F1 %d 0 R /F2 %d 0 R >> >>"
+            % (_HELVETICA, _COURIER),
+        )
+        writer.write_object(
+            _INFO, b"<< /Title (%s) >>" % _encode(blog.content.title)
+        )
+
+        number = _FIRST_PAGE
+        for content in _paginate(
+            _styled(blog_blocks.iter_blocks(blog))
+        ):
+            writer.write_stream(number, content)
+            writer.write_object(
+                number + 1,
+                b"<< /Type /Page /Parent %d 0 R "
+                b"/MediaBox [0 0 %d %d] /Resources %d 0 R "
+                b"/Contents %d 0 R >>"
+                % (
+                    _PAGES,
+                    _PAGE_WIDTH,
+                    _PAGE_HEIGHT,
+                    _RESOURCES,
+                    number,
+                ),
+            )
+            number += 2
+
+        # Pages are numbered consecutively, so their references
+        # are written without keeping them around.
+        pages = range(_FIRST_PAGE + 1, number, 2)
+        writer.write_object_parts(
+            _PAGES,
+            itertools.chain(
+                (b"<< /Type /Pages /Kids [",),
+                (b"%d 0 R " % page for page in pages),
+                (b"] /Count %d >>" % len(pages),),
+            ),
+        )
+        writer.write_object(
+            _CATALOG, b"<< /Type /Catalog /Pages %d 0 R >>" % _PAGES
+        )
+        writer.write_trailer(root=_CATALOG, info=_INFO)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("TextBlogRenderer",)
+
+import textwrap
+import typing
+
+from src.modules.blog.domain import blog_renderer
+from src.modules.blog.infrastructure.rendering import blog_blocks
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog as blog_
+
+_WIDTH: typing.Final[int] = 72
+_UNDERLINES: typing.Final[
+    typing.Mapping[blog_blocks.BlockKind, str]
+] = {
+    blog_blocks.BlockKind.TITLE: "=",
+    blog_blocks.BlockKind.HEADING: "-",
+}
+_CODE_INDENT: typing.Final[str] = " " * 4
+
+
+def _lines(kind: blog_blocks.BlockKind, text: str) -> typing.List[str]:
+    if kind is blog_blocks.BlockKind.CODE:
+        # Preformatted text keeps its lines and whitespace.
+        return [
+            (_CODE_INDENT + line).rstrip()
+            for line in text.expandtabs(4).split("\n")
+        ]
+    if kind is blog_blocks.BlockKind.ITEM:
+        return textwrap.wrap(
+            text,
+            _WIDTH,
+            initial_indent="  * ",
+            subsequent_indent="    ",
+        )
+
+    lines = textwrap.wrap(text, _WIDTH)
+    if kind in _UNDERLINES and lines:
+        lines.append(_UNDERLINES[kind] * max(map(len, lines)))
+    return lines
+
+
+class TextBlogRenderer(blog_renderer.BlogRenderer):
+    """
+    Translates blogs into UTF-8 plain text wrapped at 72 columns,
+    with underlined headings and indented code, in the manner of
+    plain text e-mails.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @property
+    def format(self) -> str:
+        # << inherited docstring >>
+        return "txt"
+
+    @property
+    def media_type(self) -> str:
+        # << inherited docstring >>
+        return "text/plain"
+
+    @property
+    def content_type(self) -> str:
+        # << inherited docstring >>
+        return "text/plain; charset=utf-8"
+
+    def render(self, blog: blog_.Blog, stream: typing.BinaryIO) -> None:
+        # << inherited docstring >>
+        previous = None
+        for kind, text in blog_blocks.iter_blocks(blog):
+            lines = _lines(kind, text)
+            if not lines:
+                # E.g. a heading of nothing but markup.
+                continue
+            # Blocks are separated by blank lines, except for the
+            # items of a list.
+            if previous is not None and not (
+                kind is previous is blog_blocks.BlockKind.ITEM
+            ):
+                stream.write(b"\n")
+            for line in lines:
+                stream.write(line.encode("utf-8") + b"\n")
+            previous = kind
@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("Command",)
+
+import contextlib
+import functools
+import itertools
+import json
+import os
+import tempfile
+import typing
+from concurrent import futures
+from xml.sax import saxutils
+
+import django
+from django.core.management import base
+from django.template import loader
+
+from src.config import container
+from src.modules.blog.application.services import blog_streamer
+from src.modules.blog.domain import blog_repository as blog_repository_
+from src.shared.infrastructure import ioc
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog as blog_
+    from src.modules.blog.domain import blog_renderer
+
+_MANIFEST_NAME: typing.Final[str] = "manifest.json"
+_SITEMAP_NAME: typing.Final[str] = "sitemap.xml"
+
+_Entry = typing.Dict[str, typing.Any]
+
+
+def _write_atomically(
+    path: str, write: typing.Callable[[typing.BinaryIO], object]
+) -> None:
+    # A file being served is replaced as a whole, never rewritten
+    # in place.
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(
+        prefix=".", suffix=".tmp", dir=os.path.dirname(path)
+    )
+    try:
+        with os.fdopen(fd, "wb") as stream:
+            write(stream)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
+
+
+def _files(
+    blog: blog_.Blog, formats: typing.Sequence[str]
+) -> typing.List[str]:
+    # The page is served for `/blogpost/<id>/<slug>` and the
+    # exports for `/blogpost/<id>/<slug>?format=<format>`, e.g.
+    # with nginx: `try_files $uri.$arg_format $uri/index.html`.
+    base_path = f"blogpost/{blog.id}/{blog.slug}"
+    return [f"{base_path}/index.html"] + [
+        f"{base_path}.{format_}" for format_ in formats
+    ]
+
+
+def _chunks(
+    blogs: typing.Iterable[blog_.Blog], size: int
+) -> typing.Iterator[typing.List[blog_.Blog]]:
+    iterator = iter(blogs)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _is_current(
+    entry: typing.Optional[_Entry],
+    blog: blog_.Blog,
+    files: typing.Sequence[str],
+    output: str,
+) -> bool:
+    # The digest covers everything the page is rendered from.
+    # Entries of earlier exports, which lack the time of the last
+    # change of their blog, are exported again.
+    return (
+        entry is not None
+        and "modified_at" in entry
+        and entry["digest"] == blog.digest
+        and entry["files"] == files
+        and all(
+            os.path.isfile(os.path.join(output, path)) for path in files
+        )
+    )
+
+
+def _export(
+    blog: blog_.Blog,
+    renderers: typing.Sequence[blog_renderer.BlogRenderer],
+    paths: typing.Sequence[str],
+) -> None:
+    # Runs in a worker process, without access to the database.
+    page = loader.render_to_string("blog/blogpost.html", {"blog": blog})
+    _write_atomically(
+        paths[0], lambda stream: stream.write(page.encode())
+    )
+    for renderer, path in zip(renderers, paths[1:], strict=True):
+        _write_atomically(
+            path, functools.partial(renderer.render, blog)
+        )
+
+
+def _sitemap(
+    base_url: str, entries: typing.Mapping[str, _Entry]
+) -> typing.Iterator[bytes]:
+    yield (
+        b'<?xml version="1.0" encoding="UTF-8"?>\n'
+        b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    )
+    for _, entry in sorted(
+        entries.items(), key=lambda item: int(item[0])
+    ):
+        location = (
+            base_url + "/" + entry["files"][0][: -len("/index.html")]
+        )
+        yield (
+            f"<url><loc>{saxutils.escape(location)}</loc>"
+            f"<lastmod>{entry['modified_at']}</lastmod></url>\n"
+        ).encode()
+    yield b"</urlset>\n"
+
+
+class Command(base.BaseCommand):  # type: ignore[misc]
+    help = (
+        "Exports every blog into a static mirror of HTML pages, "
+        "their exports and a sitemap, which can be served without "
+        "Django. Blogs that have not changed since the previous "
+        "export are skipped. The listing, category and other pages "
+        "are not exported and are still served by Django."
+    )
+
+    def add_arguments(self, parser: typing.Any) -> None:
+        parser.add_argument(
+            "output", help="The directory of the static mirror."
+        )
+        parser.add_argument(
+            "--base-url",
+            required=True,
+            help="The URL the mirror is served at, for the sitemap.",
+        )
+        parser.add_argument(
+            "--formats",
+            help=(
+                "Comma-separated export formats, in addition to HTML. "
+                "Defaults to the prewarmed formats."
+            ),
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="The number of blogs rendered at the same time.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=100,
+            help="How many blogs are loaded from the database at once.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Export every blog, even if it has not changed.",
+        )
+
+    def _read_manifest(self, output: str) -> typing.Dict[str, _Entry]:
+        try:
+            with open(
+                os.path.join(output, _MANIFEST_NAME), encoding="utf-8"
+            ) as manifest:
+                return typing.cast(
+                    typing.Dict[str, _Entry], json.load(manifest)
+                )
+        except FileNotFoundError:
+            return {}
+
+    def _remove(self, output: str, paths: typing.Iterable[str]) -> None:
+        for path in paths:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(output, path))
+
+    def _finish(
+        self,
+        future: futures.Future[None],
+        blog_id: str,
+        entry: _Entry,
+        output: str,
+        previous: typing.Mapping[str, _Entry],
+        manifest: typing.Dict[str, _Entry],
+    ) -> bool:
+        try:
+            future.result()
+        except Exception as exc:
+            # The previous export is kept, and retried next time.
+            if blog_id in previous:
+                manifest[blog_id] = previous[blog_id]
+            self.stderr.write(
+                f"Failed to export blog {blog_id}: {exc!r}"
+            )
+            return False
+
+        manifest[blog_id] = entry
+        outdated = previous.get(blog_id, {}).get("files", ())
+        self._remove(output, set(outdated) - set(entry["files"]))
+        return True
+
+    @ioc.inject
+    def handle(
+        self,
+        *args: typing.Any,
+        repo: blog_repository_.BlogRepository = ioc.Provide[
+            container.BlogContainer.blog_repository,
+        ],
+        streamer: blog_streamer.BlogStreamerService = ioc.Provide[
+            container.BlogContainer.blog_streamer,
+        ],
+        **options: typing.Any,
+    ) -> None:
+        processes = options["processes"]
+        if processes < 1:
+            raise base.CommandError("--processes must be positive.")
+        if options["chunk_size"] < 1:
+            raise base.CommandError("--chunk-size must be positive.")
+
+        formats = list(streamer.prewarmed_formats)
+        if options["formats"] is not None:
+            formats = [
+                format_.strip()
+                for format_ in options["formats"].split(",")
+                if format_.strip()
+            ]
+        try:
+            renderers = [streamer.get_renderer(f) for f in formats]
+        except ValueError as exc:
+            raise base.CommandError(str(exc)) from None
+
+        output = os.path.abspath(options["output"])
+        previous = self._read_manifest(output)
+        manifest: typing.Dict[str, _Entry] = {}
+        pending: typing.Dict[
+            futures.Future[None], typing.Tuple[str, _Entry]
+        ] = {}
+        exported = skipped = failed = 0
+
+        def finish(done: typing.Iterable[futures.Future[None]]) -> None:
+            nonlocal exported, failed
+            for future in done:
+                blog_id, entry = pending.pop(future)
+                if self._finish(
+                    future, blog_id, entry, output, previous, manifest
+                ):
+                    exported += 1
+                else:
+                    failed += 1
+
+        with futures.ProcessPoolExecutor(
+            processes, initializer=django.setup
+        ) as executor:
+            for chunk in _chunks(
+                repo.iter_blogs(chunk_size=options["chunk_size"]),
+                options["chunk_size"],
+            ):
+                changed = []
+                for blog in chunk:
+                    blog_id = str(blog.id)
+                    files = _files(blog, formats)
+                    if not options["force"] and _is_current(
+                        previous.get(blog_id), blog, files, output
+                    ):
+                        manifest[blog_id] = previous[blog_id]
+                        skipped += 1
+                    else:
+                        changed.append((blog, files))
+
+                # The times of the last changes are read along with
+                # the chunk, rather than one blog at a time.
+                versions = repo.get_blog_versions(
+                    blog.id for blog, _ in changed
+                )
+                for blog, files in changed:
+                    version = versions.get(blog.id)
+                    if version is None:
+                        # The blog has been deleted in the meantime.
+                        continue
+
+                    modified_at = version.modified_at.isoformat(
+                        timespec="seconds"
+                    )
+                    future = executor.submit(
+                        _export,
+                        blog,
+                        renderers,
+                        [os.path.join(output, path) for path in files],
+                    )
+                    pending[future] = (
+                        str(blog.id),
+                        {
+                            "digest": blog.digest,
+                            "files": files,
+                            "modified_at": modified_at,
+                        },
+                    )
+                    # The database is only accessed from this
+                    # process, and no more blogs than the workers can
+                    # take are waiting to be rendered.
+                    if len(pending) >= 2 * processes:
+                        done, _ = futures.wait(
+                            pending, return_when=futures.FIRST_COMPLETED
+                        )
+                        finish(done)
+
+            finish(futures.as_completed(list(pending)))
+
+        removed = previous.keys() - manifest.keys()
+        for blog_id in removed:
+            self._remove(output, previous[blog_id]["files"])
+
+        base_url = options["base_url"].rstrip("/")
+        _write_atomically(
+            os.path.join(output, _SITEMAP_NAME),
+            lambda stream: stream.writelines(
+                _sitemap(base_url, manifest)
+            ),
+        )
+        content = json.dumps(
+            manifest, indent=2, sort_keys=True
+        ).encode()
+        _write_atomically(
+            os.path.join(output, _MANIFEST_NAME),
+            lambda stream: stream.write(content),
+        )
+
+        self.stdout.write(
+            f"Exported {exported} blog(s), skipped {skipped} unchanged "
+            f"and removed {len(removed)} deleted blog(s)."
+        )
+        if failed:
+            raise base.CommandError(
+                f"Failed to export {failed} blog(s)."
+            )
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("Command",)
+
+import typing
+
+from django.core.management import base
+
+from src.config import container
+from src.modules.blog.domain import blog_repository as blog_repository_
+from src.modules.blog.domain import blog_search_index
+from src.shared.infrastructure import ioc
+
+
+class Command(base.BaseCommand):  # type: ignore[misc]
+    help = "Rebuilds the search index for all blogs."
+
+    @ioc.inject
+    def handle(
+        self,
+        *args: typing.Any,
+        repo: blog_repository_.BlogRepository = ioc.Provide[
+            container.BlogContainer.blog_repository,
+        ],
+        index: blog_search_index.BlogSearchIndex = ioc.Provide[
+            container.BlogContainer.blog_search_index,
+        ],
+        **options: typing.Any,
+    ) -> None:
+        count = 0
+        for blog in repo.iter_blogs():
+            index.index(blog)
+            count += 1
+
+        self.stdout.write(f"Indexed {count} blog(s).")
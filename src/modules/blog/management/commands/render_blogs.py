@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("Command",)
+
+import time
+import typing
+from concurrent import futures
+
+from django.core.management import base
+
+from src.config import container
+from src.modules.blog.application.services import blog_streamer
+from src.modules.blog.domain import blog_render_queue
+from src.modules.blog.domain import blog_repository as blog_repository_
+from src.shared.infrastructure import ioc
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import blog as blog_
+
+
+def _render(
+    streamer: blog_streamer.BlogStreamerService,
+    blog: blog_.Blog,
+    formats: typing.Sequence[str],
+) -> None:
+    streamer.prewarm(blog)
+    for format_ in formats:
+        # Formats may have been disabled since they were requested.
+        if format_ in streamer.formats:
+            streamer.render(blog, format_)
+
+
+class Command(base.BaseCommand):  # type: ignore[misc]
+    help = (
+        "Renders queued blogs into their prewarmed formats and the "
+        "formats requested by clients."
+    )
+
+    def add_arguments(self, parser: typing.Any) -> None:
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=2,
+            help="The number of blogs rendered at the same time.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait when the queue is empty.",
+        )
+        parser.add_argument(
+            "--collect-garbage",
+            action="store_true",
+            help="Remove outdated exports before rendering.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit as soon as the queue is empty.",
+        )
+
+    def _process(
+        self,
+        jobs: typing.Sequence[blog_render_queue.BlogRenderJob],
+        executor: futures.Executor,
+        repo: blog_repository_.BlogRepository,
+        queue: blog_render_queue.BlogRenderQueue,
+        streamer: blog_streamer.BlogStreamerService,
+    ) -> None:
+        # The database is only accessed from this thread, the
+        # workers are only concerned with rendering.
+        # The blogs are read from the database rather than through
+        # `get_blog`, whose caches this long-lived process is not
+        # told about changes to, unless the cache is shared.
+        blogs = {
+            blog.id: blog
+            for blog in repo.get_all_blogs(
+                filter_=dict(sno__in=[job.blog_id for job in jobs])
+            )
+        }
+        pending = {}
+        for job in jobs:
+            blog = blogs.get(job.blog_id)
+            if blog is None:
+                # The blog has been deleted in the meantime.
+                queue.complete(job)
+                continue
+            # Blogs that are already up to date are skipped.
+            pending[
+                executor.submit(_render, streamer, blog, job.formats)
+            ] = job
+
+        for future in futures.as_completed(pending):
+            job = pending[future]
+            try:
+                future.result()
+            except Exception as exc:
+                queue.fail(job, repr(exc))
+                self.stderr.write(
+                    f"Failed to render blog {job.blog_id} "
+                    f"(attempt {job.attempts}): {exc!r}"
+                )
+            else:
+                queue.complete(job)
+                self.stdout.write(f"Rendered blog {job.blog_id}.")
+
+    @ioc.inject
+    def handle(
+        self,
+        *args: typing.Any,
+        repo: blog_repository_.BlogRepository = ioc.Provide[
+            container.BlogContainer.blog_repository,
+        ],
+        queue: blog_render_queue.BlogRenderQueue = ioc.Provide[
+            container.BlogContainer.blog_render_queue,
+        ],
+        streamer: blog_streamer.BlogStreamerService = ioc.Provide[
+            container.BlogContainer.blog_streamer,
+        ],
+        **options: typing.Any,
+    ) -> None:
+        concurrency = options["concurrency"]
+        if concurrency < 1:
+            raise base.CommandError("--concurrency must be positive.")
+
+        if options["collect_garbage"]:
+            removed = streamer.collect_garbage(repo.iter_blogs())
+            self.stdout.write(
+                f"Removed {len(removed)} outdated file(s)."
+            )
+
+        with futures.ThreadPoolExecutor(concurrency) as executor:
+            while True:
+                jobs = queue.claim(concurrency)
+                if jobs:
+                    self._process(jobs, executor, repo, queue, streamer)
+                elif options["once"]:
+                    break
+                else:
+                    time.sleep(options["poll_interval"])
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("ProjectBatch",)
+
+import dataclasses
+import typing
+
+if typing.TYPE_CHECKING:
+    from src.modules.portfolio.domain import project as project_
+    from src.modules.portfolio.domain import (
+        project_title as project_title_,
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ProjectBatch:
+    """
+    The projects requested at once by their titles (see
+    `ProjectRepository.get_projects`), along with the titles of
+    those that do not exist.
+    """
+
+    items: typing.Sequence[project_.Project]
+    """The projects found, in the order they have been requested in."""
+
+    missing: typing.Sequence[project_title_.ProjectTitle]
+    """
+    The titles of the projects not found, in the order they have
+    been requested in.
+    """
+
+    def __iter__(self) -> typing.Iterator[project_.Project]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
@@ -28,6 +28,9 @@ import typing
 
 if typing.TYPE_CHECKING:
     from src.modules.portfolio.domain import project as project_
+    from src.modules.portfolio.domain import (
+        project_batch as project_batch_,
+    )
     from src.modules.portfolio.domain import (
         project_title as project_title_,
     )
@@ -64,6 +67,30 @@ class ProjectRepository(abc.ABC):
         """
         ...
 
+    @abc.abstractmethod
+    def get_projects(
+        self,
+        project_titles: typing.Iterable[project_title_.ProjectTitle],
+    ) -> project_batch_.ProjectBatch:
+        """
+        Returns many project objects by their unique identifiers
+        at once, rather than with one query per project.
+
+        Parameters
+        ----------
+        project_titles : Iterable[ProjectTitle]
+            The unique identifiers of the projects to be searched
+            for. Repeated identifiers are only looked up once.
+
+        Returns
+        -------
+        ProjectBatch
+            The Project objects found, in the order of their
+            identifiers, and the identifiers of the projects
+            that do not exist.
+        """
+        ...
+
     @abc.abstractmethod
     def get_all_projects(
         self,
@@ -115,3 +142,27 @@ class ProjectRepository(abc.ABC):
             repository.
         """
         ...
+
+    @abc.abstractmethod
+    def save_many(
+        self,
+        projects: typing.Iterable[project_.Project],
+        *,
+        batch_size: int = 100,
+    ) -> None:
+        """
+        Saves many project objects at once, within a single
+        transaction. Projects that already exist (by title) are
+        updated, the others are created.
+
+        Parameters
+        ----------
+        projects : Iterable[Project]
+            The Project objects to be saved or updated in the
+            repository.
+        batch_size : int
+            How many projects are written with a single statement.
+
+            Default is 100.
+        """
+        ...
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("Skill", "SkillGroup", "SkillsMatrix")
+
+import dataclasses
+import typing
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SkillGroup:
+    """A skill type or a skill category, which skills are grouped by."""
+
+    name: str
+    """The name of the group."""
+
+    description: str
+    """The description of the group, as HTML."""
+
+    gradient: str
+    """The CSS classes of the gradient the name is drawn with."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Skill:
+    """A skill along with how well it is mastered."""
+
+    name: str
+    """The name of the skill."""
+
+    tag: str
+    """A short label of the skill, used as its CSS class."""
+
+    rate: int
+    """The rate of the skill, out of 100."""
+
+    gradient: str
+    """The CSS classes of the gradient of the skill's bar."""
+
+
+SkillsMatrix: typing.TypeAlias = typing.Tuple[
+    typing.Tuple[
+        SkillGroup,
+        typing.Tuple[
+            typing.Tuple[SkillGroup, typing.Tuple[Skill, ...]], ...
+        ],
+    ],
+    ...,
+]
+"""
+Skills grouped by their type and then by their category, in the
+order the groups first appear in.
+"""
@@ -26,5 +26,8 @@ __all__: typing.Sequence[str] = ("portfolio_container",)
 import typing
 
 from src.config import container
+from src.shared.infrastructure import container as shared_container_
 
-portfolio_container = container.PortfolioContainer()
+portfolio_container = container.PortfolioContainer(
+    cache=shared_container_.shared_container.cache
+)
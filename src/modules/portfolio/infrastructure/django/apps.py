@@ -43,13 +43,17 @@ class PortfolioConfig(AppConfig):  # type: ignore[misc]
         importlib.import_module(
             "src.modules.portfolio.infrastructure.django.admin"
         )
+        importlib.import_module(
+            "src.modules.portfolio.infrastructure.django.callbacks"
+        )
 
     def ready(self) -> None:
         from src.modules.portfolio.infrastructure import container
 
         container.portfolio_container.wire(
             modules=[
-                "src.modules.portfolio.infrastructure.django.views"
+                "src.modules.portfolio.infrastructure.django.views",
+                "src.modules.portfolio.infrastructure.django.callbacks",
             ]
         )
         self._load_packages()
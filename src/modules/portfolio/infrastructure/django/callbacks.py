@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "project_pages_invalidated",
+    "about_pages_invalidated",
+    "about_me_invalidated",
+)
+
+import typing
+
+from django import dispatch
+from django.db import transaction
+from django.db.models import signals
+
+from src.config import container
+from src.modules.portfolio.infrastructure.persistence import (
+    about_me_repository as about_me_repository_impl,
+)
+from src.modules.portfolio.infrastructure.persistence import models
+from src.modules.portfolio.infrastructure.persistence import (
+    signals as portfolio_signals,
+)
+from src.shared.infrastructure import ioc
+from src.shared.infrastructure.django import response_cache
+
+
+@dispatch.receiver(
+    [signals.post_save, signals.post_delete], sender=models.ProjectModel
+)
+@dispatch.receiver(portfolio_signals.projects_saved)
+@typing.no_type_check
+def project_pages_invalidated(**_: typing.Any) -> None:
+    """
+    After saving or deleting a project model, or saving many
+    projects at once, the cached pages are invalidated, so that
+    the project list stays up to date.
+    """
+    response_cache.bump_content_version()
+
+
+@dispatch.receiver(
+    [signals.post_save, signals.post_delete], sender=models.AboutMeModel
+)
+@dispatch.receiver(
+    [signals.post_save, signals.post_delete], sender=models.SkillModel
+)
+@dispatch.receiver(
+    [signals.post_save, signals.post_delete], sender=models.SkillType
+)
+@dispatch.receiver(
+    [signals.post_save, signals.post_delete],
+    sender=models.SkillCategory,
+)
+@dispatch.receiver(
+    signals.m2m_changed, sender=models.AboutMeModel.skills.through
+)
+@typing.no_type_check
+def about_pages_invalidated(**_: typing.Any) -> None:
+    """
+    After changing the CV or any of the skills, the cached pages
+    are invalidated once the change is committed, so that the
+    about page stays up to date.
+    """
+    response_cache.bump_content_version()
+
+
+@dispatch.receiver(
+    [signals.post_save, signals.post_delete], sender=models.AboutMeModel
+)
+@dispatch.receiver(
+    [signals.post_save, signals.post_delete], sender=models.SkillModel
+)
+@dispatch.receiver(
+    [signals.post_save, signals.post_delete], sender=models.SkillType
+)
+@dispatch.receiver(
+    [signals.post_save, signals.post_delete],
+    sender=models.SkillCategory,
+)
+@dispatch.receiver(
+    signals.m2m_changed, sender=models.AboutMeModel.skills.through
+)
+@ioc.inject
+@typing.no_type_check
+def about_me_invalidated(
+    repository: about_me_repository_impl.DjangoAboutMeRepository = (
+        ioc.Provide[container.PortfolioContainer.about_me_repository]
+    ),
+    **_: typing.Any,
+) -> None:
+    """
+    After changing the CV or any of the skills, the cached snapshot
+    of the CV and the fragments rendered from it are invalidated for
+    all the processes sharing the cache, once the change is committed
+    (a CV read before would be cached as current otherwise).
+    """
+    transaction.on_commit(repository.invalidate, robust=True)
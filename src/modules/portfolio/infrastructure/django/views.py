@@ -27,17 +27,32 @@ import typing
 
 from django import http
 from django import shortcuts
+from django.template import loader
+from django.utils import safestring
 
 from src.config import container
 from src.modules.blog.domain import blog_repository as blog_repository_
+from src.modules.portfolio.domain import (
+    about_me_repository as about_me_repository_,
+)
 from src.modules.portfolio.domain import (
     project_repository as project_repository_,
 )
-from src.modules.portfolio.infrastructure.persistence import models
+from src.modules.portfolio.infrastructure.persistence import (
+    about_me_repository as about_me_repository_impl,
+)
+from src.shared.infrastructure import cache as cache_
 from src.shared.infrastructure import ioc
+from src.shared.infrastructure.django import response_cache
+
+if typing.TYPE_CHECKING:
+    from src.modules.portfolio.domain import about_me as about_me_
+
+_LATEST_BLOGS_COUNT: typing.Final[int] = 3
 
 
 @ioc.inject
+@response_cache.cached_response
 def index(
     request: http.HttpRequest,
     repo: blog_repository_.BlogRepository = ioc.Provide[
@@ -45,30 +60,69 @@ def index(
     ],
 ) -> http.HttpResponse:
     response = shortcuts.render(
-        request, "index.html", {"latest_blogs": repo.get_all_blogs()}
+        request,
+        "index.html",
+        {"latest_blogs": repo.get_latest(_LATEST_BLOGS_COUNT)},
     )
     return response
 
 
-def about(request: http.HttpRequest) -> http.HttpResponse:
-    cv = models.AboutMeModel.actual()
+def _skills_html(
+    cv: about_me_.AboutMe, cache: cache_.Cache, version: int
+) -> safestring.SafeString:
+    # The skills matrix outlives the page, which is dropped whenever
+    # any content of the site changes, e.g. a blog.
+    key = cache.versioned_key(
+        about_me_repository_impl.CACHE_NAMESPACE,
+        "skills-fragment",
+        version=version,
+    )
+    html = cache.get(key)
+    if html is None:
+        html = loader.render_to_string(
+            "portfolio/skills.html", {"cv_skills": cv.skills}
+        )
+        cache.set(
+            key, html, timeout=about_me_repository_impl.CACHE_TIMEOUT
+        )
+    return safestring.mark_safe(html)
+
+
+@ioc.inject
+@response_cache.cached_response
+def about(
+    request: http.HttpRequest,
+    repo: about_me_repository_.AboutMeRepository = ioc.Provide[
+        container.PortfolioContainer.about_me_repository,
+    ],
+    cache: cache_.Cache = ioc.Provide[
+        container.PortfolioContainer.cache,
+    ],
+) -> http.HttpResponse:
+    # The version is read before the CV, so that a fragment rendered
+    # from a CV that has just changed is never stored as current.
+    version = cache.get_version(
+        about_me_repository_impl.CACHE_NAMESPACE
+    )
+    cv = repo.get_about_me()
     if cv is None:
         empty_cv = shortcuts.render(request, "portfolio/about.html", {})
         return empty_cv
 
-    cv = shortcuts.render(
+    response = shortcuts.render(
         request,
         "portfolio/about.html",
         {
             "cv_text": cv.text,
             "cv_name": cv.name,
-            "cv_skills": cv.group_skills(),
+            "cv_skills_html": _skills_html(cv, cache, version),
         },
     )
-    return cv
+    return response
 
 
 @ioc.inject
+@response_cache.cached_response
 def projects(
     request: http.HttpRequest,
     repo: project_repository_.ProjectRepository = ioc.Provide[
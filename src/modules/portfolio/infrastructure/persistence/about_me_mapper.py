@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("AboutMeMapper",)
+
+import typing
+
+from src.modules.portfolio.domain import about_me
+from src.modules.portfolio.domain import skill
+from src.modules.portfolio.infrastructure.persistence import models
+from src.shared.infrastructure import mapper
+
+
+def _group(
+    model: typing.Union[models.SkillType, models.SkillCategory],
+) -> skill.SkillGroup:
+    return skill.SkillGroup(
+        name=model.name,
+        description=model.description,
+        gradient=model.gradient,
+    )
+
+
+class AboutMeMapper(
+    mapper.DataMapper[about_me.AboutMe, models.AboutMeModel]
+):
+    # << inherited docstring >>
+    __slots__: typing.Sequence[str] = ()
+
+    def model_to_entity(
+        self, model: models.AboutMeModel
+    ) -> about_me.AboutMe:
+        # << inherited docstring >>
+        # The skills are expected to be prefetched along with their
+        # types and categories (see `DjangoAboutMeRepository`),
+        # otherwise every skill costs further queries.
+        grouped: typing.Dict[
+            int,
+            typing.Tuple[
+                skill.SkillGroup,
+                typing.Dict[
+                    int,
+                    typing.Tuple[
+                        skill.SkillGroup, typing.List[skill.Skill]
+                    ],
+                ],
+            ],
+        ] = {}
+        for skill_model in model.skills.all():
+            skill_type, categories = grouped.setdefault(
+                skill_model.type_id, (_group(skill_model.type), {})
+            )
+            category, skills = categories.setdefault(
+                skill_model.category_id,
+                (_group(skill_model.category), []),
+            )
+            skills.append(
+                skill.Skill(
+                    name=skill_model.name,
+                    tag=skill_model.tag,
+                    rate=skill_model.rate,
+                    gradient=skill_model.gradient,
+                )
+            )
+
+        entity = about_me.AboutMe(
+            name=model.name,
+            text=model.text,
+            skills=tuple(
+                (
+                    skill_type,
+                    tuple(
+                        (category, tuple(skills))
+                        for category, skills in categories.values()
+                    ),
+                )
+                for skill_type, categories in grouped.values()
+            ),
+        )
+        return entity
+
+    def entity_to_model(
+        self, entity: about_me.AboutMe
+    ) -> models.AboutMeModel:
+        # << inherited docstring >>
+        # The skills are related through a many-to-many relation,
+        # which can only be set once the model has been saved.
+        model = models.AboutMeModel(name=entity.name, text=entity.text)
+        return model
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "CACHE_NAMESPACE",
+    "CACHE_TIMEOUT",
+    "DjangoAboutMeRepository",
+)
+
+import typing
+
+from django.db import models as models_
+from django.db import transaction
+
+from src.modules.portfolio.domain import about_me_repository
+from src.modules.portfolio.infrastructure.persistence import (
+    about_me_mapper,
+)
+from src.modules.portfolio.infrastructure.persistence import models
+
+if typing.TYPE_CHECKING:
+    from src.modules.portfolio.domain import about_me as about_me_
+    from src.shared.infrastructure import cache as cache_
+
+CACHE_NAMESPACE: typing.Final[str] = "portfolio:about"
+"""
+The cache namespace of the CV and of fragments rendered from it.
+Its version is bumped whenever the CV or any of the skills changes.
+"""
+CACHE_TIMEOUT: typing.Final[int] = 60 * 10
+"""
+How long (in seconds) the CV and fragments rendered from it are
+cached at most, even if their version is not bumped.
+"""
+
+
+class DjangoAboutMeRepository(about_me_repository.AboutMeRepository):
+    """
+    A repository that loads the CV with two queries, one for the
+    CV and one for its skills along with their types and
+    categories, however many skills there are.
+
+    Parameters
+    ----------
+    cache : Optional[Cache]
+        The cache the snapshot of the CV is kept in until the CV
+        or any of the skills changes (see `invalidate`).
+
+        Default is `builtins.None`.
+    """
+
+    __slots__: typing.Sequence[str] = ("_mapper", "_cache")
+
+    active_record = models.AboutMeModel
+
+    def __init__(
+        self, cache: typing.Optional[cache_.Cache] = None
+    ) -> None:
+        self._mapper = about_me_mapper.AboutMeMapper()
+        self._cache = cache
+
+    def _load(self) -> typing.Optional[about_me_.AboutMe]:
+        model = (
+            self.active_record.objects.prefetch_related(
+                models_.Prefetch(
+                    "skills",
+                    queryset=models.SkillModel.objects.select_related(
+                        "type", "category"
+                    ),
+                )
+            )
+            .order_by("pk")
+            .first()
+        )
+        if model is None:
+            return None
+
+        aggregate = self._mapper.model_to_entity(model)
+        return aggregate
+
+    def get_about_me(self) -> typing.Optional[about_me_.AboutMe]:
+        # << inherited docstring >>
+        # Changes made within a transaction might still be rolled
+        # back, so only the committed CV is cached.
+        if (
+            self._cache is None
+            or transaction.get_connection().in_atomic_block
+        ):
+            return self._load()
+
+        key = self._cache.versioned_key(CACHE_NAMESPACE, "snapshot")
+        return self._cache.get_or_set(
+            key, self._load, timeout=CACHE_TIMEOUT
+        )
+
+    def invalidate(self) -> None:
+        """
+        Drops the cached snapshot of the CV, along with any fragment
+        rendered from it, for all the processes sharing the cache.
+        """
+        if self._cache is not None:
+            self._cache.bump_version(CACHE_NAMESPACE)
@@ -30,7 +30,6 @@ __all__: typing.Sequence[str] = (
     "AboutMeModel",
 )
 
-import collections
 import reprlib
 import string
 import typing
@@ -139,30 +138,3 @@ class AboutMeModel(models.Model):  # type: ignore[misc]
     @classmethod
     def actual(cls) -> typing.Optional[AboutMeModel]:
         return cls.objects.first()
-
-    def group_skills(
-        self,
-    ) -> typing.ItemsView[
-        typing.Any,
-        typing.DefaultDict[typing.Any, typing.List[typing.Any]],
-    ]:
-        grouped: typing.DefaultDict[
-            SkillType,
-            typing.DefaultDict[SkillCategory, typing.List[SkillModel]],
-        ] = collections.defaultdict(
-            lambda: collections.defaultdict(list)
-        )
-        for skill in self.skills.all():
-            grouped[skill.type][skill.category].append(skill)
-
-        grouped = typing.cast(
-            typing.DefaultDict[
-                typing.Any,
-                typing.DefaultDict[typing.Any, typing.List[typing.Any]],
-            ],
-            {
-                k: v.items()  # SkillType  # [SkillCategory, List[Skill]]
-                for k, v in grouped.items()
-            },
-        )
-        return grouped.items()
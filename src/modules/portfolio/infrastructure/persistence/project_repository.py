@@ -25,11 +25,15 @@ __all__: typing.Sequence[str] = ("DjangoProjectRepository",)
 
 import typing
 
+from django.db import transaction
+
+from src.modules.portfolio.domain import project_batch
 from src.modules.portfolio.domain import project_repository
 from src.modules.portfolio.infrastructure.persistence import models
 from src.modules.portfolio.infrastructure.persistence import (
     project_mapper,
 )
+from src.modules.portfolio.infrastructure.persistence import signals
 
 if typing.TYPE_CHECKING:
     from src.modules.portfolio.domain import project as project_
@@ -38,6 +42,18 @@ if typing.TYPE_CHECKING:
     )
 
 
+# The columns overwritten when `save_many` updates an existing
+# project. The date the project has been added at is kept.
+_BULK_UPDATE_FIELDS: typing.Final[typing.Sequence[str]] = (
+    "description",
+    "features",
+    "thumbnail_url",
+    "technologies",
+    "demo_url",
+    "github_url",
+)
+
+
 class DjangoProjectRepository(project_repository.ProjectRepository):
     # << inherited docstring >>
     __slots__: typing.Sequence[str] = ("_mapper",)
@@ -59,6 +75,26 @@ class DjangoProjectRepository(project_repository.ProjectRepository):
         aggregate = self._mapper.model_to_entity(model)
         return aggregate
 
+    def get_projects(
+        self,
+        project_titles: typing.Iterable[project_title_.ProjectTitle],
+    ) -> project_batch.ProjectBatch:
+        # << inherited docstring >>
+        project_titles = list(dict.fromkeys(project_titles))
+        found = self.active_record.objects.in_bulk(
+            project_titles, field_name="title"
+        )
+        return project_batch.ProjectBatch(
+            items=[
+                self._mapper.model_to_entity(found[title])
+                for title in project_titles
+                if title in found
+            ],
+            missing=[
+                title for title in project_titles if title not in found
+            ],
+        )
+
     def get_all_projects(
         self,
         *,
@@ -81,3 +117,25 @@ class DjangoProjectRepository(project_repository.ProjectRepository):
         # << inherited docstring >>
         model = self._mapper.entity_to_model(project)
         self.active_record.save(model)
+
+    def save_many(
+        self,
+        projects: typing.Iterable[project_.Project],
+        *,
+        batch_size: int = 100,
+    ) -> None:
+        # << inherited docstring >>
+        projects = tuple(projects)
+        all_models = self._mapper.entities_to_models(projects)
+        with transaction.atomic():
+            self.active_record.objects.bulk_create(
+                all_models,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=["title"],
+                update_fields=_BULK_UPDATE_FIELDS,
+            )
+
+        signals.projects_saved.send(
+            sender=type(self), projects=projects
+        )
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("Cache",)
+
+import abc
+import typing
+
+_T = typing.TypeVar("_T")
+
+
+class Cache(abc.ABC):
+    """
+    A cache of picklable values, such as aggregates and rendered
+    fragments, shared by the code of one or more processes.
+
+    Values are invalidated in bulk with version counters: a value
+    is stored under a key that includes the current version of its
+    namespace (see `Cache.versioned_key`), so bumping the version
+    makes every value of the namespace unreachable for all the
+    processes sharing the cache. Unreachable values are dropped
+    once they expire or the cache is full.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    def get(self, key: str) -> typing.Optional[typing.Any]:
+        """
+        Returns the value stored under the key.
+
+        Parameters
+        ----------
+        key : str
+            The key of the value.
+
+        Returns
+        -------
+        Optional[Any]
+            A copy of the value, or `builtins.None` if missing or
+            expired.
+        """
+        ...
+
+    @abc.abstractmethod
+    def set(
+        self,
+        key: str,
+        value: typing.Any,
+        timeout: typing.Optional[float] = None,
+    ) -> None:
+        """
+        Stores a copy of the value under the key.
+
+        Parameters
+        ----------
+        key : str
+            The key of the value.
+        value : Any
+            The value to store. It must be picklable.
+        timeout : Optional[float]
+            How long (in seconds) the value is kept. If
+            `builtins.None`, it is kept until evicted.
+
+            Default is `builtins.None`.
+        """
+        ...
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Removes the value stored under the key, if any.
+
+        Parameters
+        ----------
+        key : str
+            The key of the value.
+        """
+        ...
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """
+        Removes all the values. Versions are kept, so that values
+        held elsewhere under an older version are never taken for
+        current ones.
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_version(self, namespace: str) -> int:
+        """
+        Returns the current version of the namespace, `0` if it
+        has never been bumped.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace, e.g. `"blog:1"` for a single blog.
+        """
+        ...
+
+    @abc.abstractmethod
+    def bump_version(self, namespace: str) -> int:
+        """
+        Increments the version of the namespace atomically, which
+        invalidates all of its values.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace, e.g. `"blog:1"` for a single blog.
+
+        Returns
+        -------
+        int
+            The new version of the namespace.
+        """
+        ...
+
+    def versioned_key(
+        self,
+        namespace: str,
+        key: str,
+        *,
+        version: typing.Optional[int] = None,
+    ) -> str:
+        """
+        Returns the key under which a value of the namespace is
+        stored for its current version.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace of the value.
+        key : str
+            The key of the value within the namespace.
+        version : Optional[int]
+            The version of the namespace, if already known.
+
+            Default is the current version.
+        """
+        if version is None:
+            version = self.get_version(namespace)
+        return f"{namespace}:{version}:{key}"
+
+    def get_or_set(
+        self,
+        key: str,
+        default: typing.Callable[[], _T],
+        timeout: typing.Optional[float] = None,
+    ) -> _T:
+        """
+        Returns the value stored under the key, computing and
+        storing it first if missing.
+
+        Parameters
+        ----------
+        key : str
+            The key of the value.
+        default : Callable[[], T]
+            Computes the value if missing.
+        timeout : Optional[float]
+            How long (in seconds) a computed value is kept.
+
+            Default is `builtins.None`.
+        """
+        value = self.get(key)
+        if value is None:
+            value = default()
+            self.set(key, value, timeout)
+        return typing.cast(_T, value)
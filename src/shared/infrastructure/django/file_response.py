@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "ranged_file_response",
+    "sendfile_response",
+)
+
+import os
+import re
+import typing
+
+from django import http
+from django.utils import http as http_utils
+
+_RANGE_PATTERN: typing.Final[typing.Pattern[str]] = re.compile(
+    r"^bytes=(\d*)-(\d*)$"
+)
+_CHUNK_SIZE: typing.Final[int] = 64 * 1024
+
+
+def _byte_range(
+    header: str, size: int
+) -> typing.Optional[typing.Tuple[int, int]]:
+    # Returns the first and the last (inclusive) byte of a single
+    # range, or `builtins.None` if the header should be ignored,
+    # which includes requests for multiple ranges. Raises
+    # `builtins.ValueError` if the range cannot be satisfied.
+    match = _RANGE_PATTERN.match(header.strip())
+    if match is None:
+        return None
+
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        # A suffix range, e.g. "bytes=-500" for the last 500 bytes.
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError("unsatisfiable range")
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError("unsatisfiable range")
+    end = int(last) if last else size - 1
+    return start, min(end, size - 1)
+
+
+def _if_range_matches(
+    request: http.HttpRequest,
+    etag: typing.Optional[str],
+    last_modified: typing.Optional[int],
+) -> bool:
+    # A range is only served if the client's partial copy is still
+    # current. Otherwise, the whole file is sent instead.
+    if_range = request.headers.get("If-Range")
+    if if_range is None:
+        return True
+    if if_range.startswith('"'):
+        return etag is not None and if_range == etag
+    if if_range.startswith("W/"):
+        # Weak validators are never used for ranges.
+        return False
+
+    date = http_utils.parse_http_date_safe(if_range)
+    return date is not None and date == last_modified
+
+
+def _read_range(
+    file: typing.BinaryIO, start: int, length: int
+) -> typing.Iterator[bytes]:
+    try:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
+def ranged_file_response(
+    request: http.HttpRequest,
+    file: typing.BinaryIO,
+    *,
+    content_type: str,
+    filename: str = "",
+    etag: typing.Optional[str] = None,
+    last_modified: typing.Optional[int] = None,
+) -> http.HttpResponseBase:
+    """
+    Streams a file, or a single byte range of it if requested with
+    a `Range` header (and an optional `If-Range` precondition).
+
+    Parameters
+    ----------
+    request: HttpRequest
+        The request to respond to.
+    file: BinaryIO
+        The file to stream, opened in binary mode. The response
+        takes ownership of it and closes it when done.
+    content_type: str
+        The MIME type of the file.
+    filename: str
+        The name the file is presented under. If empty, the name
+        of the file itself is used.
+    etag: Optional[str]
+        The quoted ETag of the file, used for `If-Range`.
+    last_modified: Optional[int]
+        The modification time of the file, as a POSIX timestamp,
+        used for `If-Range`.
+
+    Returns
+    -------
+    HttpResponseBase
+        Either the whole file (200), the requested range (206) or
+        an error if the range cannot be satisfied (416).
+    """
+    size = os.fstat(file.fileno()).st_size
+    range_header = request.headers.get("Range")
+
+    byte_range = None
+    if (
+        range_header is not None
+        and request.method == "GET"
+        and _if_range_matches(request, etag, last_modified)
+    ):
+        try:
+            byte_range = _byte_range(range_header, size)
+        except ValueError:
+            file.close()
+            response = http.HttpResponse(
+                status=416, content_type=content_type
+            )
+            response.headers["Content-Range"] = f"bytes */{size}"
+            return response
+
+    if byte_range is None:
+        response = http.FileResponse(
+            file, content_type=content_type, filename=filename
+        )
+        response.headers["Accept-Ranges"] = "bytes"
+        return response
+
+    start, end = byte_range
+    response = http.StreamingHttpResponse(
+        _read_range(file, start, end - start + 1),
+        status=206,
+        content_type=content_type,
+    )
+    response.headers["Accept-Ranges"] = "bytes"
+    response.headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    response.headers["Content-Length"] = str(end - start + 1)
+    disposition = http_utils.content_disposition_header(
+        False, filename or os.path.basename(file.name)
+    )
+    if disposition is not None:
+        response.headers["Content-Disposition"] = disposition
+    return response
+
+
+def sendfile_response(
+    header: str, location: str, *, content_type: str
+) -> http.HttpResponse:
+    """
+    Delegates serving a file to the front proxy, which also takes
+    care of byte ranges. No Python worker is involved in sending
+    the file itself.
+
+    Parameters
+    ----------
+    header: str
+        The header understood by the proxy, `X-Accel-Redirect`
+        (nginx) or `X-Sendfile` (Apache, lighttpd).
+    location: str
+        The internal URI (for `X-Accel-Redirect`) or the path
+        (for `X-Sendfile`) of the file.
+    content_type: str
+        The MIME type of the file.
+    """
+    response = http.HttpResponse(content_type=content_type)
+    response.headers[header] = location
+    return response
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "cached_response",
+    "content_version",
+    "bump_content_version",
+)
+
+import functools
+import time
+import typing
+
+from django import http
+from django.conf import settings
+from django.core import cache
+from django.db import transaction
+from django.utils import cache as cache_utils
+from django.utils import http as http_utils
+
+from src.shared.infrastructure import container as shared_container_
+
+if typing.TYPE_CHECKING:
+    from src.shared.infrastructure import cache as cache_
+
+_ViewT = typing.TypeVar(
+    "_ViewT", bound=typing.Callable[..., typing.Any]
+)
+
+_CONTENT_NAMESPACE: typing.Final[str] = "response"
+_CONTENT_VERSION_KEY: typing.Final[str] = "response:content-version"
+_CACHEABLE_METHODS: typing.Final[typing.AbstractSet[str]] = frozenset(
+    ("GET", "HEAD")
+)
+
+
+@typing.no_type_check
+def _shared_cache() -> cache_.Cache:
+    return shared_container_.shared_container.cache()
+
+
+def content_version() -> typing.Tuple[int, int]:
+    """
+    Returns the current version of the site content. Cached
+    responses are only served for the version they were
+    rendered with.
+
+    The version is made of a counter kept in the shared cache
+    (see `SHARED_CACHE_BACKEND`), so that a change made by one
+    process is seen by all the processes of the host even if
+    each of them caches its own responses, and of a counter
+    kept along with the responses themselves.
+    """
+    shared_version = _shared_cache().get_version(_CONTENT_NAMESPACE)
+    # The version starts from the current time rather than from 1,
+    # so that versions are not reused if the counter is evicted.
+    version = cache.cache.get_or_set(
+        _CONTENT_VERSION_KEY, time.time_ns, None
+    )
+    return shared_version, typing.cast(int, version)
+
+
+def _bump_content_version() -> None:
+    _shared_cache().bump_version(_CONTENT_NAMESPACE)
+    try:
+        cache.cache.incr(_CONTENT_VERSION_KEY)
+    except ValueError:
+        # The version has not been set yet or has been evicted.
+        cache.cache.add(_CONTENT_VERSION_KEY, time.time_ns(), None)
+
+
+def bump_content_version() -> None:
+    """
+    Increments the version of the site content, which makes all
+    previously cached responses unreachable. They are evicted
+    by the cache backend later on.
+
+    Within a transaction, the version is only incremented once
+    the transaction is committed, so that a response rendered
+    from the content as it was until then is not cached under
+    the new version.
+    """
+    transaction.on_commit(_bump_content_version, robust=True)
+
+
+def _key_prefix() -> str:
+    # The language is added to the key by Django itself.
+    shared_version, version = content_version()
+    return f"response:{shared_version}:{version}"
+
+
+def _conditional_response(
+    request: http.HttpRequest, response: http.HttpResponseBase
+) -> http.HttpResponseBase:
+    # A cached response is only sent in full if the client does
+    # not already have it, as told by its validators.
+    last_modified = response.get("Last-Modified")
+    return typing.cast(
+        http.HttpResponseBase,
+        cache_utils.get_conditional_response(
+            request,
+            etag=response.get("ETag"),
+            last_modified=(
+                http_utils.parse_http_date_safe(last_modified)
+                if last_modified is not None
+                else None
+            ),
+            response=response,
+        ),
+    )
+
+
+def cached_response(view: _ViewT) -> _ViewT:
+    """
+    Caches successful responses of a read-only view. A response
+    is cached per URL (including the query string), language
+    and content version, so it is never served once the content
+    has changed (see `bump_content_version`). Responses that
+    vary on request headers, such as `Accept`, are cached per
+    value of these headers as well, as told by their `Vary`
+    header.
+
+    Streaming responses, such as files, are never cached. Cached
+    responses honour conditional requests (`If-None-Match` and
+    `If-Modified-Since`) based on their own validators.
+    """
+
+    @functools.wraps(view)
+    def wrapper(
+        request: http.HttpRequest,
+        *args: typing.Any,
+        **kwargs: typing.Any,
+    ) -> http.HttpResponseBase:
+        if request.method not in _CACHEABLE_METHODS:
+            return typing.cast(
+                http.HttpResponseBase, view(request, *args, **kwargs)
+            )
+
+        key_prefix = _key_prefix()
+        # The key is only known once the headers the response of
+        # this URL varies on have been learned.
+        key = cache_utils.get_cache_key(
+            request, key_prefix, request.method, cache.cache
+        )
+        response = cache.cache.get(key) if key is not None else None
+        if response is not None:
+            return _conditional_response(request, response)
+
+        response = view(request, *args, **kwargs)
+        if response.status_code == 200 and not response.streaming:
+            key = cache_utils.learn_cache_key(
+                request,
+                response,
+                settings.VIEW_CACHE_TIMEOUT,
+                key_prefix,
+                cache.cache,
+            )
+            cache.cache.set(key, response, settings.VIEW_CACHE_TIMEOUT)
+        return typing.cast(http.HttpResponseBase, response)
+
+    return typing.cast(_ViewT, wrapper)
@@ -49,6 +49,7 @@ ALLOWED_HOSTS = ["*"]
 
 # Application definition
 INSTALLED_APPS = [
+    "src.shared.infrastructure.django.apps.SharedConfig",
     "src.modules.portfolio.infrastructure.django.apps.PortfolioConfig",
     "src.modules.blog.infrastructure.django.apps.BlogConfig",
     "django.contrib.admin",
@@ -72,7 +73,7 @@ TAILWIND_CSS_PATH = "theme/static_src/src/styles.css"
 
 INTERNAL_IPS = ["127.0.0.1"]
 
-#NPM_BIN_PATH = "C:/Program Files/nodejs/npm.cmd"
+# NPM_BIN_PATH = "C:/Program Files/nodejs/npm.cmd"
 
 MIDDLEWARE = [
     "django.middleware.locale.LocaleMiddleware",
@@ -116,13 +117,177 @@ WSGI_APPLICATION = "src.shared.infrastructure.django.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
 
-DATABASES = {
-    "default": {
+# Either "sqlite" (a file of the project) or "postgresql".
+DATABASE_BACKEND = os.environ.get("DJANGO_DATABASE_BACKEND", "sqlite")
+# How long (in seconds) each process keeps its connection, instead
+# of opening one for every request. 0 closes it at the end of each
+# request.
+DATABASE_CONN_MAX_AGE = int(
+    os.environ.get("DJANGO_DATABASE_CONN_MAX_AGE", 600)
+)
+# The maximum number of connections pooled by each process on
+# PostgreSQL. 0 disables the pool, e.g. behind PgBouncer, in which
+# case connections are kept for `DATABASE_CONN_MAX_AGE` instead.
+DATABASE_POOL_SIZE = int(os.environ.get("DJANGO_DATABASE_POOL_SIZE", 4))
+
+DATABASE_PROFILES = {
+    "sqlite": {
         "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "NAME": os.environ.get(
+            "DJANGO_DATABASE_NAME", BASE_DIR / "db.sqlite3"
+        ),
+        "CONN_MAX_AGE": DATABASE_CONN_MAX_AGE,
+        "OPTIONS": {
+            # Writers take the lock when their transaction begins,
+            # so that they wait for each other (see `busy_timeout`)
+            # instead of failing when upgrading a read lock.
+            "transaction_mode": "IMMEDIATE"
+        },
+    },
+    "postgresql": {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": os.environ.get("DJANGO_DATABASE_NAME", "me"),
+        "USER": os.environ.get("DJANGO_DATABASE_USER", "postgres"),
+        "PASSWORD": os.environ.get("DJANGO_DATABASE_PASSWORD", ""),
+        "HOST": os.environ.get("DJANGO_DATABASE_HOST", "localhost"),
+        "PORT": os.environ.get("DJANGO_DATABASE_PORT", "5432"),
+        # Pooled connections go back to the pool after each request.
+        "CONN_MAX_AGE": (
+            0 if DATABASE_POOL_SIZE else DATABASE_CONN_MAX_AGE
+        ),
+        # Kept connections are checked before a request reuses them,
+        # so that one closed by the server does not fail it.
+        "CONN_HEALTH_CHECKS": True,
+        # Server-side cursors (of `QuerySet.iterator`) do not work
+        # with the transaction pooling of PgBouncer.
+        "DISABLE_SERVER_SIDE_CURSORS": not DATABASE_POOL_SIZE,
+        "OPTIONS": (
+            {
+                "pool": {
+                    "min_size": 1,
+                    "max_size": DATABASE_POOL_SIZE,
+                    # How long (in seconds) a request waits for
+                    # a free connection.
+                    "timeout": 10,
+                }
+            }
+            if DATABASE_POOL_SIZE
+            else {}
+        ),
+    },
+}
+
+DATABASES = {"default": DATABASE_PROFILES[DATABASE_BACKEND]}
+
+# Applied to every new SQLite connection. The write-ahead log lets
+# readers go on while a blog is being saved, and is only synced to
+# disk at checkpoints ("NORMAL"), which is still safe against
+# corruption.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    # The size (in bytes) of the database read through memory
+    # mapping rather than system calls.
+    "mmap_size": int(
+        os.environ.get("DJANGO_SQLITE_MMAP_SIZE", 256 * 1024 * 1024)
+    ),
+    # The size of the page cache of each connection, in pages, or
+    # in KiB if negative.
+    "cache_size": int(
+        os.environ.get("DJANGO_SQLITE_CACHE_SIZE", -16000)
+    ),
+    # How long (in milliseconds) a connection waits for a lock.
+    "busy_timeout": int(
+        os.environ.get("DJANGO_SQLITE_BUSY_TIMEOUT", 5000)
+    ),
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+}
+CACHE_BACKEND = os.environ.get("DJANGO_CACHE_BACKEND", "locmem")
+
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": os.environ.get(
+            "DJANGO_CACHE_LOCATION",
+            os.path.join(BASE_DIR, ".cache")
+            if CACHE_BACKEND == "file"
+            else "",
+        ),
     }
 }
 
+# The cache of aggregates and rendered fragments, kept either by each
+# process ("memory") or in a file shared by all the processes of the
+# host ("sqlite"), e.g. the workers of gunicorn. Changes are only seen
+# by the processes that share it, along with the versions of cached
+# pages, so it must be "sqlite" if there are several workers.
+SHARED_CACHE_BACKEND = os.environ.get(
+    "DJANGO_SHARED_CACHE_BACKEND", "memory"
+)
+SHARED_CACHE_LOCATION = os.environ.get(
+    "DJANGO_SHARED_CACHE_LOCATION",
+    os.path.join(BASE_DIR, ".cache", "shared.sqlite3"),
+)
+SHARED_CACHE_MAX_ENTRIES = int(
+    os.environ.get("DJANGO_SHARED_CACHE_MAX_ENTRIES", 4096)
+)
+
+# How long (in seconds) rendered pages are cached. Pages are also
+# invalidated as soon as their content changes.
+VIEW_CACHE_TIMEOUT = int(
+    os.environ.get("DJANGO_VIEW_CACHE_TIMEOUT", 600)
+)
+
+
+# Keeping recently loaded blogs in memory
+# The number of blogs kept by each process. 0 disables the map.
+BLOG_IDENTITY_MAP_SIZE = int(
+    os.environ.get("DJANGO_BLOG_IDENTITY_MAP_SIZE", 256)
+)
+# How long (in seconds) a process may serve a blog changed by another
+# one. Blogs saved by the process itself are dropped immediately.
+BLOG_IDENTITY_MAP_TTL = float(
+    os.environ.get("DJANGO_BLOG_IDENTITY_MAP_TTL", 300)
+)
+
+# Storing exports of blogs (PDF, EPUB, plain text, Markdown)
+# The directory may be shared by several processes or containers.
+BLOG_ARTIFACTS_ROOT = os.environ.get(
+    "DJANGO_BLOG_ARTIFACTS_ROOT", dirs.ARTIFACTS_DIR
+)
+
+# Serving exports of blogs
+# Set to "X-Accel-Redirect" (nginx) or "X-Sendfile" (Apache, lighttpd)
+# to let the front proxy send the files, instead of a Python worker.
+BLOG_SENDFILE_HEADER = os.environ.get("DJANGO_BLOG_SENDFILE_HEADER")
+# The location of the exports as seen by the front proxy, e.g. an
+# internal nginx location. Defaults to their directory.
+BLOG_SENDFILE_ROOT = os.environ.get("DJANGO_BLOG_SENDFILE_ROOT")
+# How many times the `render_blogs` worker tries to render a blog
+# before giving up on it.
+BLOG_RENDER_MAX_ATTEMPTS = int(
+    os.environ.get("DJANGO_BLOG_RENDER_MAX_ATTEMPTS", 3)
+)
+# The comma-separated formats rendered by the `render_blogs` worker
+# as soon as a blog is saved. Other formats are rendered on their
+# first request.
+BLOG_PREWARM_FORMATS = tuple(
+    format_.strip()
+    for format_ in os.environ.get(
+        "DJANGO_BLOG_PREWARM_FORMATS", "pdf"
+    ).split(",")
+    if format_.strip()
+)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("tune_sqlite_connection",)
+
+import typing
+
+from django.conf import settings
+
+if typing.TYPE_CHECKING:
+    from django.db.backends.base import base
+
+
+def tune_sqlite_connection(
+    sender: typing.Any,
+    connection: base.BaseDatabaseWrapper,
+    **_: typing.Any,
+) -> None:
+    """
+    Applies the pragmas of `SQLITE_PRAGMAS` to every new SQLite
+    connection, e.g. the write-ahead log, which lets the workers
+    read while a blog is being saved, and a memory-mapped file.
+    Connections to other databases are left as they are.
+
+    It is connected to `connection_created` by the app.
+    """
+    if connection.vendor != "sqlite":
+        return
+
+    pragmas: typing.Mapping[str, typing.Union[str, int]] = getattr(
+        settings, "SQLITE_PRAGMAS", {}
+    )
+    for name, value in pragmas.items():
+        # Pragmas cannot be passed as query parameters. Some of
+        # them, e.g. `journal_mode`, return a row.
+        connection.connection.execute(
+            f"PRAGMA {name} = {value}"
+        ).fetchall()
@@ -26,9 +26,13 @@ __all__: typing.Sequence[str] = ("DataMapper",)
 import abc
 import typing
 
+from django.db import models as models_
+
 _EntityT = typing.TypeVar("_EntityT")
 _ModelT = typing.TypeVar("_ModelT")
 
+_DEFAULT_CHUNK_SIZE: typing.Final[int] = 100
+
 
 class DataMapper(typing.Generic[_EntityT, _ModelT], abc.ABC):
     __slots__: typing.Sequence[str] = ()
@@ -45,6 +49,32 @@ class DataMapper(typing.Generic[_EntityT, _ModelT], abc.ABC):
         entities = [self.model_to_entity(m) for m in models]
         return entities
 
+    def iter_entities(
+        self,
+        models: typing.Iterable[_ModelT],
+        *,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+    ) -> typing.Iterator[_EntityT]:
+        """
+        Maps models to entities lazily. A query set is read from the
+        database in chunks, rather than all at once, so the memory
+        needed does not grow with the number of rows. Lookups passed
+        to `QuerySet.prefetch_related` are made once per chunk.
+
+        Parameters
+        ----------
+        models : Iterable[ModelT]
+            The models to map, e.g. a query set.
+        chunk_size : int
+            How many rows of a query set are read at once.
+
+            Default is 100.
+        """
+        if isinstance(models, models_.QuerySet):
+            models = models.iterator(chunk_size=chunk_size)
+        for model in models:
+            yield self.model_to_entity(model)
+
     def entities_to_models(
         self, entities: typing.Iterable[_EntityT]
     ) -> typing.Sequence[_ModelT]:
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("InMemoryCache",)
+
+import collections
+import pickle
+import threading
+import time
+import typing
+
+from src.shared.infrastructure import cache
+
+
+class InMemoryCache(cache.Cache):
+    """
+    A cache kept in the memory of the current process. Values are
+    pickled, so that they cannot be changed through the objects
+    handed out, just like with a cache shared between processes.
+
+    Parameters
+    ----------
+    max_entries : int
+        The number of values kept. The least recently used value
+        is dropped first.
+
+        Default is `1024`.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_max_entries",
+        "_entries",
+        "_versions",
+        "_lock",
+    )
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+
+        self._max_entries = max_entries
+        self._entries: collections.OrderedDict[
+            str, typing.Tuple[bytes, float]
+        ] = collections.OrderedDict()
+        self._versions: typing.Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> typing.Optional[typing.Any]:
+        # << inherited docstring >>
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            data, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+
+        return pickle.loads(data)
+
+    def set(
+        self,
+        key: str,
+        value: typing.Any,
+        timeout: typing.Optional[float] = None,
+    ) -> None:
+        # << inherited docstring >>
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        expires_at = (
+            time.monotonic() + timeout
+            if timeout is not None
+            else float("inf")
+        )
+        with self._lock:
+            self._entries[key] = (data, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        # << inherited docstring >>
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        # << inherited docstring >>
+        with self._lock:
+            self._entries.clear()
+
+    def get_version(self, namespace: str) -> int:
+        # << inherited docstring >>
+        return self._versions.get(namespace, 0)
+
+    def bump_version(self, namespace: str) -> int:
+        # << inherited docstring >>
+        with self._lock:
+            version = self._versions.get(namespace, 0) + 1
+            self._versions[namespace] = version
+        return version
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("SQLiteCache",)
+
+import os
+import pathlib
+import pickle
+import sqlite3
+import threading
+import time
+import typing
+
+from src.shared.infrastructure import cache
+
+_SCHEMA: typing.Final[str] = """
+CREATE TABLE IF NOT EXISTS cache_entry (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_entry_accessed_at
+    ON cache_entry (accessed_at);
+CREATE TABLE IF NOT EXISTS cache_version (
+    namespace TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+"""
+# Expired and least recently used values are dropped once in this
+# many writes, rather than on every one of them.
+_CULL_FREQUENCY: typing.Final[int] = 64
+
+
+class _Local(threading.local):
+    connection: typing.Optional[sqlite3.Connection] = None
+    pid: int = 0
+    writes: int = 0
+
+
+class SQLiteCache(cache.Cache):
+    """
+    A cache stored in an SQLite file, shared by all the processes
+    of a host (e.g., the workers of an application server).
+
+    The file is opened in WAL mode, so that readers are never
+    blocked by a writer. Every thread of every process has its
+    own connection, which is opened again after a fork.
+
+    Parameters
+    ----------
+    path : PathLike
+        The path to the file, created if missing.
+    max_entries : int
+        The number of values kept. The least recently used values
+        are dropped first.
+
+        Default is `4096`.
+    timeout : float
+        How long (in seconds) a write waits for another one.
+
+        Default is `5`.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_path",
+        "_max_entries",
+        "_timeout",
+        "_local",
+    )
+
+    def __init__(
+        self,
+        path: typing.Union[str, os.PathLike[str]],
+        max_entries: int = 4096,
+        timeout: float = 5.0,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+
+        self._path = pathlib.Path(path)
+        self._max_entries = max_entries
+        self._timeout = timeout
+        self._local = _Local()
+
+    def _connect(self) -> sqlite3.Connection:
+        local = self._local
+        pid = os.getpid()
+        if local.connection is None or local.pid != pid:
+            # Connections must not be shared with a forked child.
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self._path,
+                timeout=self._timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            local.connection = connection
+            local.pid = pid
+            local.writes = 0
+        return local.connection
+
+    def get(self, key: str) -> typing.Optional[typing.Any]:
+        # << inherited docstring >>
+        connection = self._connect()
+        now = time.time()
+        # Rows are fetched at once, so that the statement is reset
+        # and does not keep a read transaction open.
+        rows = connection.execute(
+            "SELECT value, accessed_at FROM cache_entry "
+            "WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, now),
+        ).fetchall()
+        if not rows:
+            return None
+
+        ((data, accessed_at),) = rows
+        # The access time is only refreshed coarsely, so that hot
+        # values do not turn every read into a write.
+        if now - accessed_at > 1:
+            connection.execute(
+                "UPDATE cache_entry SET accessed_at = ? WHERE key = ?",
+                (now, key),
+            )
+        return pickle.loads(data)
+
+    def set(
+        self,
+        key: str,
+        value: typing.Any,
+        timeout: typing.Optional[float] = None,
+    ) -> None:
+        # << inherited docstring >>
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        expires_at = now + timeout if timeout is not None else None
+
+        connection = self._connect()
+        connection.execute(
+            "INSERT OR REPLACE INTO cache_entry "
+            "(key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, data, expires_at, now),
+        )
+
+        self._local.writes += 1
+        if self._local.writes % _CULL_FREQUENCY == 0:
+            self._cull(connection, now)
+
+    def _cull(self, connection: sqlite3.Connection, now: float) -> None:
+        connection.execute(
+            "DELETE FROM cache_entry WHERE expires_at <= ?", (now,)
+        )
+        connection.execute(
+            "DELETE FROM cache_entry WHERE key IN ("
+            "SELECT key FROM cache_entry ORDER BY accessed_at DESC "
+            "LIMIT -1 OFFSET ?)",
+            (self._max_entries,),
+        )
+
+    def delete(self, key: str) -> None:
+        # << inherited docstring >>
+        self._connect().execute(
+            "DELETE FROM cache_entry WHERE key = ?", (key,)
+        )
+
+    def clear(self) -> None:
+        # << inherited docstring >>
+        self._connect().execute("DELETE FROM cache_entry")
+
+    def get_version(self, namespace: str) -> int:
+        # << inherited docstring >>
+        rows = (
+            self._connect()
+            .execute(
+                "SELECT version FROM cache_version WHERE namespace = ?",
+                (namespace,),
+            )
+            .fetchall()
+        )
+        return int(rows[0][0]) if rows else 0
+
+    def bump_version(self, namespace: str) -> int:
+        # << inherited docstring >>
+        rows = (
+            self._connect()
+            .execute(
+                "INSERT INTO cache_version (namespace, version) "
+                "VALUES (?, 1) ON CONFLICT (namespace) "
+                "DO UPDATE SET version = version + 1 "
+                "RETURNING version",
+                (namespace,),
+            )
+            .fetchall()
+        )
+        return int(rows[0][0])
@@ -21,7 +21,11 @@
 # SOFTWARE.
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("entity_from_id",)
+__all__: typing.Sequence[str] = (
+    "entity_from_id",
+    "entity_from_content",
+    "entity_from_title_without_slug",
+)
 
 import datetime
 import typing
@@ -59,3 +63,17 @@ def entity_from_title_without_slug(title: str) -> blog.Blog:
         created_at=datetime.datetime.utcnow(),
     )
     return entity
+
+
+def entity_from_content(id_: blog_id.BlogId, content: str) -> blog.Blog:
+    entity = blog.Blog(
+        sno=id_,
+        content=blog_content.BlogContent(
+            title="1", meta="1", content=content
+        ),
+        asset=blog_asset.BlogAsset(thumbnail_url="https://1.jpg"),
+        category=blog_category.BlogCategory.UNCATEGORIZED,
+        slug=blog_slug.BlogSlug("1"),
+        created_at=datetime.datetime.utcnow(),
+    )
+    return entity
@@ -23,89 +23,211 @@ from __future__ import annotations
 
 __all__: typing.Sequence[str] = ("TestBlogStreamerService",)
 
-import contextlib
 import io
-import os
-import pathlib
 import typing
 
 import pytest
 
-from src.config import dirs
 from src.modules.blog.application.services import (
     blog_streamer as blog_streamer_,
 )
 from src.modules.blog.domain import blog_id as blog_id_
-from src.shared.infrastructure.django import settings
+from src.modules.blog.infrastructure.persistence import (
+    blog_artifact_store as blog_artifact_store_impl,
+)
+from src.modules.blog.infrastructure.rendering import pdf_renderer
+from src.modules.blog.infrastructure.rendering import text_renderer
 from test_impl.blog import _util
 
 
-@contextlib.contextmanager
-def simulate_production_mode_for_blog_streams(
-    blogs_root: os.PathLike,
-) -> typing.Iterator[None]:
-    settings.TESTING = False
-    yield
-    settings.TESTING = True
-
-    for source in os.listdir(blogs_root):
-        if source.endswith(".pdf"):
-            file_path = os.path.join(blogs_root, source)
-            if os.path.exists(file_path):
-                os.remove(file_path)
-
-
 @pytest.fixture(name="blog_streamer")
-def _() -> blog_streamer_.BlogStreamerService:
-    streamer = blog_streamer_.BlogStreamerService(root=dirs.BLOGS_DIR)
+def _(
+    artifact_store: blog_artifact_store_impl.FileSystemBlogArtifactStore,
+) -> blog_streamer_.BlogStreamerService:
+    streamer = blog_streamer_.BlogStreamerService(
+        store=artifact_store, renderers=[pdf_renderer.PdfBlogRenderer()]
+    )
     return streamer
 
 
 class TestBlogStreamerService:
     __slots__: typing.Sequence[str] = ()
 
-    def test_raises_if_root_dir_does_not_exist(self) -> None:
-        with pytest.raises(NotADirectoryError):
+    def test_raises_if_sendfile_header_is_unsupported(
+        self,
+        artifact_store: blog_artifact_store_impl.FileSystemBlogArtifactStore,
+    ) -> None:
+        with pytest.raises(ValueError):
             blog_streamer_.BlogStreamerService(
-                root=pathlib.Path("/does/not/exist")
+                store=artifact_store,
+                renderers=[pdf_renderer.PdfBlogRenderer()],
+                sendfile_header="X-Unsupported",
             )
 
-    def test_init_and_open_stream(
-        self, blog_streamer: blog_streamer_.BlogStreamerService
+    def test_raises_if_renderers_are_invalid(
+        self,
+        artifact_store: blog_artifact_store_impl.FileSystemBlogArtifactStore,
     ) -> None:
-        with simulate_production_mode_for_blog_streams(
-            blog_streamer._root
+        for renderers, prewarmed_formats in (
+            ([], None),
+            ([pdf_renderer.PdfBlogRenderer()] * 2, None),
+            ([pdf_renderer.PdfBlogRenderer()], ["txt"]),
         ):
-            blog_id = blog_id_.BlogId(1)
-            entity = _util.entity_from_id(blog_id)
-
-            stream_id = blog_streamer._create_id(entity)
+            with pytest.raises(ValueError):
+                blog_streamer_.BlogStreamerService(
+                    store=artifact_store,
+                    renderers=renderers,
+                    prewarmed_formats=prewarmed_formats,
+                )
 
-            source = os.path.join(blog_streamer._root, stream_id)
-            assert not os.path.exists(source)
+    def test_init_and_open_stream(
+        self, blog_streamer: blog_streamer_.BlogStreamerService
+    ) -> None:
+        blog_id = blog_id_.BlogId(1)
+        entity = _util.entity_from_id(blog_id)
 
-            blog_streamer.init(entity)
-            assert os.path.exists(source)
+        with pytest.raises(FileNotFoundError):
+            blog_streamer.open(entity)
 
-            stream = blog_streamer.open(entity)
+        blog_streamer.init(entity)
+        with blog_streamer.open(entity) as stream:
             assert isinstance(stream, io.BufferedReader)
-
-            # We are not in the Django env and no one will close it for us.
-            stream.close()
+            assert stream.read(5) == b"%PDF-"
 
     def test_delete_stream(
-        self, blog_streamer: blog_streamer_.BlogStreamerService
+        self,
+        blog_streamer: blog_streamer_.BlogStreamerService,
+        artifact_store: blog_artifact_store_impl.FileSystemBlogArtifactStore,
     ) -> None:
         blog_id = blog_id_.BlogId(1)
         entity = _util.entity_from_id(blog_id)
 
-        stream_id = blog_streamer._create_id(entity)
-
-        source = os.path.join(blog_streamer._root, stream_id)
-        assert not os.path.exists(source)
-
         blog_streamer.init(entity)
-        assert os.path.exists(source)
+        assert blog_streamer.is_rendered(entity)
+        assert artifact_store.get_index() == {
+            blog_id: entity.content.digest
+        }
 
         blog_streamer.delete(entity)
-        assert not os.path.exists(source)
+        assert not blog_streamer.is_rendered(entity)
+        assert not artifact_store.get_index()
+        with pytest.raises(FileNotFoundError):
+            blog_streamer.delete(entity)
+
+    def test_render_is_keyed_by_content(
+        self,
+        blog_streamer: blog_streamer_.BlogStreamerService,
+        artifact_store: blog_artifact_store_impl.FileSystemBlogArtifactStore,
+    ) -> None:
+        blog_id = blog_id_.BlogId(1)
+        entity = _util.entity_from_content(blog_id, "1")
+
+        assert not blog_streamer.is_rendered(entity)
+        assert blog_streamer.render(entity)
+        assert blog_streamer.is_rendered(entity)
+        # Nothing to do until the content changes.
+        assert not blog_streamer.render(entity)
+        with pytest.raises(FileExistsError):
+            blog_streamer.init(entity)
+
+        edited = _util.entity_from_content(blog_id, "2")
+        assert not blog_streamer.is_rendered(edited)
+        assert blog_streamer.render(edited)
+        # The outdated source is removed.
+        assert list(artifact_store.keys()) == [
+            blog_streamer._create_id(edited)
+        ]
+
+    def test_shared_sources_are_kept(
+        self,
+        blog_streamer: blog_streamer_.BlogStreamerService,
+        artifact_store: blog_artifact_store_impl.FileSystemBlogArtifactStore,
+    ) -> None:
+        first = _util.entity_from_content(blog_id_.BlogId(1), "1")
+        second = _util.entity_from_content(blog_id_.BlogId(2), "1")
+        blog_streamer.render(first)
+        blog_streamer.render(second)
+
+        # Both blogs have the same content, and so the same source.
+        blog_streamer.delete(first)
+        assert blog_streamer.is_rendered(second)
+
+    def test_sendfile_location(
+        self,
+        artifact_store: blog_artifact_store_impl.FileSystemBlogArtifactStore,
+    ) -> None:
+        entity = _util.entity_from_id(blog_id_.BlogId(1))
+        stream_id = f"{entity.content.digest}.pdf"
+
+        def create(
+            sendfile_root: typing.Optional[str],
+        ) -> blog_streamer_.BlogStreamerService:
+            return blog_streamer_.BlogStreamerService(
+                store=artifact_store,
+                renderers=[pdf_renderer.PdfBlogRenderer()],
+                sendfile_header="X-Sendfile",
+                sendfile_root=sendfile_root,
+            )
+
+        with pytest.raises(FileNotFoundError):
+            create(None).sendfile_location(entity)
+
+        create(None).render(entity)
+        assert create(None).sendfile_location(
+            entity
+        ) == artifact_store.locate(stream_id)
+        assert create("/protected").sendfile_location(entity) == (
+            f"/protected/{artifact_store.location(stream_id)}"
+        )
+
+    def test_collect_garbage(
+        self,
+        blog_streamer: blog_streamer_.BlogStreamerService,
+        artifact_store: blog_artifact_store_impl.FileSystemBlogArtifactStore,
+    ) -> None:
+        first = _util.entity_from_id(blog_id_.BlogId(1))
+        second = _util.entity_from_content(blog_id_.BlogId(2), "2")
+        blog_streamer.render(first)
+        blog_streamer.render(second)
+
+        removed = blog_streamer.collect_garbage([first])
+        assert removed == [blog_streamer._create_id(second)]
+        assert blog_streamer.is_rendered(first)
+        assert artifact_store.get_index().keys() == {first.id}
+
+    def test_formats_are_rendered_separately(
+        self,
+        artifact_store: blog_artifact_store_impl.FileSystemBlogArtifactStore,
+    ) -> None:
+        blog_streamer = blog_streamer_.BlogStreamerService(
+            store=artifact_store,
+            renderers=[
+                pdf_renderer.PdfBlogRenderer(),
+                text_renderer.TextBlogRenderer(),
+            ],
+        )
+        assert blog_streamer.formats == ("pdf", "txt")
+        assert blog_streamer.prewarmed_formats == ("pdf",)
+        with pytest.raises(ValueError):
+            blog_streamer.render(
+                _util.entity_from_id(blog_id_.BlogId(1)), "epub"
+            )
+
+        blog_id = blog_id_.BlogId(1)
+        entity = _util.entity_from_content(blog_id, "1")
+        assert blog_streamer.prewarm(entity)
+        assert blog_streamer.is_prewarmed(entity)
+        assert not blog_streamer.is_rendered(entity, "txt")
+
+        assert blog_streamer.render(entity, "txt")
+        with blog_streamer.open(entity, "txt") as stream:
+            assert stream.read().startswith(b"1\n=\n")
+        assert not blog_streamer.prewarm(entity)
+
+        # Every format of the outdated content is removed.
+        edited = _util.entity_from_content(blog_id, "2")
+        assert not blog_streamer.is_prewarmed(edited)
+        blog_streamer.prewarm(edited)
+        assert sorted(artifact_store.keys()) == [
+            f"{edited.content.digest}.pdf"
+        ]
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("TestBlogCursor",)
+
+import datetime
+import typing
+
+import pytest
+
+from src.modules.blog.domain import blog_cursor
+from src.modules.blog.domain import blog_id
+from test_impl.blog import _util
+
+
+class TestBlogCursor:
+    __slots__: typing.Sequence[str] = ()
+
+    def test_parse(self) -> None:
+        cursor = blog_cursor.BlogCursor(
+            created_at=datetime.datetime(
+                2024, 5, 17, 12, 30, 1, 250, tzinfo=datetime.UTC
+            ),
+            sno=blog_id.BlogId(42),
+        )
+        assert blog_cursor.BlogCursor.parse(str(cursor)) == cursor
+
+    def test_of(self) -> None:
+        blog = _util.entity_from_id(blog_id.BlogId(7))
+        cursor = blog_cursor.BlogCursor.of(blog)
+        assert cursor.sno == blog.id
+        assert cursor.created_at == blog.created_at
+
+    @pytest.mark.parametrize(
+        "value", ["", "abc", "1715949001", "1.x", "9" * 30 + ".1"]
+    )
+    def test_parse_invalid(self, value: str) -> None:
+        with pytest.raises(ValueError):
+            blog_cursor.BlogCursor.parse(value)
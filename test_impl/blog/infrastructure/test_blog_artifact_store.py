@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("TestFileSystemBlogArtifactStore",)
+
+import os
+import pathlib
+import typing
+
+import pytest
+
+from src.modules.blog.domain import blog_id as blog_id_
+from src.modules.blog.infrastructure.persistence import (
+    blog_artifact_store as blog_artifact_store_impl,
+)
+
+_DIGEST: typing.Final[str] = "0123456789abcdef"
+_KEY: typing.Final[str] = f"{_DIGEST}.pdf"
+
+
+@pytest.fixture(name="store")
+def _(
+    tmp_path: pathlib.Path,
+) -> blog_artifact_store_impl.FileSystemBlogArtifactStore:
+    return blog_artifact_store_impl.FileSystemBlogArtifactStore(
+        tmp_path / "store"
+    )
+
+
+class TestFileSystemBlogArtifactStore:
+    __slots__: typing.Sequence[str] = ()
+
+    def test_raises_if_root_is_not_a_directory(
+        self, tmp_path: pathlib.Path
+    ) -> None:
+        (tmp_path / "file").touch()
+        with pytest.raises(NotADirectoryError):
+            blog_artifact_store_impl.FileSystemBlogArtifactStore(
+                tmp_path / "file"
+            )
+
+    def test_put_and_open(
+        self,
+        store: blog_artifact_store_impl.FileSystemBlogArtifactStore,
+    ) -> None:
+        assert not store.contains(_KEY)
+        with pytest.raises(FileNotFoundError):
+            store.open(_KEY)
+        with pytest.raises(FileNotFoundError):
+            store.locate(_KEY)
+
+        assert store.put(_KEY, lambda stream: stream.write(b"1"))
+        # Artifacts are never overwritten.
+        assert not store.put(_KEY, lambda stream: stream.write(b"2"))
+
+        assert store.contains(_KEY)
+        with store.open(_KEY) as stream:
+            assert stream.read() == b"1"
+        assert store.location(_KEY) == f"01/23/{_KEY}"
+        assert store.locate(_KEY).endswith(
+            os.path.join("01", "23", _KEY)
+        )
+        assert list(store.keys()) == [_KEY]
+
+        store.remove(_KEY)
+        assert not store.contains(_KEY)
+        assert not list(store.keys())
+
+    def test_failed_put_leaves_nothing_behind(
+        self,
+        store: blog_artifact_store_impl.FileSystemBlogArtifactStore,
+        tmp_path: pathlib.Path,
+    ) -> None:
+        def write(stream: typing.BinaryIO) -> None:
+            stream.write(b"partial")
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            store.put(_KEY, write)
+
+        assert not store.contains(_KEY)
+        assert not os.listdir(tmp_path / "store" / "01" / "23")
+
+    def test_rejects_invalid_keys(
+        self,
+        store: blog_artifact_store_impl.FileSystemBlogArtifactStore,
+    ) -> None:
+        for key in ("../../etc/passwd", "ab", "0123456789ABCDEF"):
+            with pytest.raises(ValueError):
+                store.location(key)
+
+    def test_index(
+        self,
+        store: blog_artifact_store_impl.FileSystemBlogArtifactStore,
+        tmp_path: pathlib.Path,
+    ) -> None:
+        first, second = blog_id_.BlogId(1), blog_id_.BlogId(2)
+        assert not store.get_index()
+
+        assert store.set_index(first, _DIGEST) is None
+        assert store.set_index(second, "fedcba9876543210") is None
+        assert store.set_index(first, _DIGEST) == _DIGEST
+        assert store.set_index(second, None) == "fedcba9876543210"
+        assert store.set_index(second, None) is None
+
+        # The index is shared by every store with the same root.
+        other = blog_artifact_store_impl.FileSystemBlogArtifactStore(
+            tmp_path / "store"
+        )
+        assert other.get_index() == {first: _DIGEST}
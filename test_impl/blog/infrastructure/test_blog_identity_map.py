@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("TestBlogIdentityMap",)
+
+import pathlib
+import threading
+import typing
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.db import transaction
+from django.test import utils
+
+from src.modules.blog.domain import blog_id as blog_id_
+from src.modules.blog.infrastructure import container
+from src.modules.blog.infrastructure.persistence import (
+    blog_identity_map as blog_identity_map_impl,
+)
+from src.modules.blog.infrastructure.persistence import (
+    blog_repository as blog_repository_impl,
+)
+from src.modules.blog.infrastructure.persistence import models
+from src.shared.infrastructure import memory_cache
+from src.shared.infrastructure import sqlite_cache
+from test_impl.blog import _util
+
+
+class _Clock:
+    __slots__: typing.Sequence[str] = ("now",)
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestBlogIdentityMap:
+    __slots__: typing.Sequence[str] = ()
+
+    def test_raises_if_bounds_are_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            blog_identity_map_impl.BlogIdentityMap(max_size=-1)
+        with pytest.raises(ValueError):
+            blog_identity_map_impl.BlogIdentityMap(ttl=0)
+
+    def test_get_and_put(self) -> None:
+        identity_map = blog_identity_map_impl.BlogIdentityMap()
+        blog = _util.entity_from_id(blog_id_.BlogId(1))
+
+        assert identity_map.get(blog.id) is None
+        identity_map.put(blog)
+
+        cached = identity_map.get(blog.id)
+        assert cached == blog
+        assert cached is not blog
+        assert (identity_map.hits, identity_map.misses) == (1, 1)
+
+    def test_least_recently_used_is_dropped(self) -> None:
+        identity_map = blog_identity_map_impl.BlogIdentityMap(
+            max_size=2
+        )
+        blogs = [
+            _util.entity_from_id(blog_id_.BlogId(i)) for i in (1, 2, 3)
+        ]
+
+        identity_map.put(blogs[0])
+        identity_map.put(blogs[1])
+        identity_map.get(blogs[0].id)
+        identity_map.put(blogs[2])
+
+        assert len(identity_map) == 2
+        assert identity_map.get(blogs[1].id) is None
+        assert identity_map.get(blogs[0].id) is not None
+
+    def test_expired_blogs_are_dropped(self) -> None:
+        clock = _Clock()
+        identity_map = blog_identity_map_impl.BlogIdentityMap(
+            ttl=10, clock=clock
+        )
+        blog = _util.entity_from_id(blog_id_.BlogId(1))
+
+        identity_map.put(blog)
+        clock.now = 9.9
+        assert identity_map.get(blog.id) is not None
+        clock.now = 10
+        assert identity_map.get(blog.id) is None
+        assert len(identity_map) == 0
+
+    def test_stale_blogs_are_not_put(self) -> None:
+        identity_map = blog_identity_map_impl.BlogIdentityMap()
+        blog = _util.entity_from_id(blog_id_.BlogId(1))
+
+        generation = identity_map.generation
+        identity_map.evict(blog.id)
+        identity_map.put(blog, generation=generation)
+        assert identity_map.get(blog.id) is None
+
+    @pytest.mark.django_db(transaction=True)
+    def test_repository_uses_map(self) -> None:
+        blog_repository = container.blog_container.blog_repository()
+        identity_map = blog_repository.identity_map
+        hits, misses = identity_map.hits, identity_map.misses
+
+        blog_id = blog_id_.BlogId(1)
+        blog_repository.save(_util.entity_from_id(blog_id))
+        blog_repository.get_blog(blog_id)
+        blog_repository.get_blog(blog_id)
+        assert identity_map.hits - hits == 1
+        assert identity_map.misses - misses == 1
+
+        # Saving the model directly evicts the blog through signals.
+        model = models.BlogModel.objects.get(sno=blog_id)
+        model.title = "2"
+        model.save()
+        blog = blog_repository.get_blog(blog_id)
+        assert blog is not None
+        assert blog.content.title == "2"
+
+    @pytest.mark.django_db(transaction=True)
+    def test_blogs_are_evicted_on_commit(self) -> None:
+        blog_repository = container.blog_container.blog_repository()
+        blog_id = blog_id_.BlogId(1)
+        blog_repository.save(_util.entity_from_id(blog_id))
+        committed_model = models.BlogModel.objects.get(sno=blog_id)
+
+        def read() -> None:
+            # Another worker still reads the committed blog, as
+            # the change below is not committed yet.
+            with mock.patch.object(
+                models.BlogModel.objects,
+                "get",
+                return_value=committed_model,
+            ):
+                blog_repository.get_blog(blog_id)
+
+        with transaction.atomic():
+            model = models.BlogModel.objects.get(sno=blog_id)
+            model.title = "2"
+            model.save()
+            thread = threading.Thread(target=read)
+            thread.start()
+            thread.join()
+
+        blog = blog_repository.get_blog(blog_id)
+        assert blog is not None
+        assert blog.content.title == "2"
+
+    @pytest.mark.django_db(transaction=True)
+    def test_shared_blogs_expire(self) -> None:
+        shared_cache = mock.Mock(wraps=memory_cache.InMemoryCache())
+        blog_repository = blog_repository_impl.DjangoBlogRepository(
+            identity_map=blog_identity_map_impl.BlogIdentityMap(ttl=5),
+            cache=shared_cache,
+        )
+        blog_id = blog_id_.BlogId(1)
+        blog_repository.save(_util.entity_from_id(blog_id))
+
+        blog_repository.get_blog(blog_id)
+        assert shared_cache.set.call_args.kwargs["timeout"] == 5
+
+    @pytest.mark.django_db(transaction=True)
+    def test_get_blogs_uses_map(self) -> None:
+        blog_repository = container.blog_container.blog_repository()
+        for sno in (1, 2, 3):
+            blog_repository.save(
+                _util.entity_from_id(blog_id_.BlogId(sno))
+            )
+
+        blog_repository.get_blog(blog_id_.BlogId(1))
+        blog_ids = [blog_id_.BlogId(i) for i in (2, 1, 3)]
+        with utils.CaptureQueriesContext(connection) as queries:
+            batch = blog_repository.get_blogs(blog_ids)
+        # Only the blogs that are not cached yet are queried.
+        assert len(queries) == 1
+        assert "IN (2, 3)" in queries[0]["sql"]
+        assert [blog.id for blog in batch] == [2, 1, 3]
+
+        with utils.CaptureQueriesContext(connection) as queries:
+            blog_repository.get_blogs(blog_ids)
+        assert len(queries) == 0
+
+    @pytest.mark.django_db(transaction=True)
+    def test_processes_share_versions(
+        self, tmp_path: pathlib.Path
+    ) -> None:
+        # Two repositories with a cache file in common stand for
+        # the workers of an application server.
+        shared_cache = sqlite_cache.SQLiteCache(
+            tmp_path / "cache.sqlite3"
+        )
+        first, second = (
+            blog_repository_impl.DjangoBlogRepository(
+                identity_map=blog_identity_map_impl.BlogIdentityMap(),
+                cache=shared_cache,
+            )
+            for _ in range(2)
+        )
+        blog_id = blog_id_.BlogId(1)
+        first.save(_util.entity_from_id(blog_id))
+
+        first.get_blog(blog_id)
+        with utils.CaptureQueriesContext(connection) as queries:
+            assert second.get_blog(blog_id) is not None
+        assert len(queries) == 0
+
+        models.BlogModel.objects.filter(sno=blog_id).update(title="2")
+        second.evict(blog_id)
+        blog = first.get_blog(blog_id)
+        assert blog is not None
+        assert blog.content.title == "2"
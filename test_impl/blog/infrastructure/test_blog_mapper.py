@@ -25,6 +25,7 @@ __all__: typing.Sequence[str] = ("TestBlogMapper",)
 
 import datetime
 import typing
+from unittest import mock
 
 import pytest
 
@@ -34,6 +35,7 @@ from src.modules.blog.domain import blog_category
 from src.modules.blog.domain import blog_content
 from src.modules.blog.domain import blog_id
 from src.modules.blog.domain import blog_slug
+from src.modules.blog.domain import blog_summary
 from src.modules.blog.infrastructure.persistence import (
     blog_mapper as blog_mapper_,
 )
@@ -82,3 +84,67 @@ class TestBlogMapper:
 
         entity = blog_mapper.model_to_entity(model)
         assert isinstance(entity, blog.Blog)
+
+    @pytest.mark.django_db
+    def test_model_derived_columns(
+        self, blog_mapper: blog_mapper_.BlogMapper
+    ) -> None:
+        model = models.BlogModel.objects.create(
+            title="Café Crème", meta="Über", content="<p>Naïve</p>"
+        )
+        assert model.slug == "cafe-creme"
+        assert model.search_text == "cafe creme\nuber\n<p>naive</p>"
+
+        # The slug is kept when the title is edited, so that links
+        # to the blog are not broken.
+        model.title = "Other"
+        model.save(update_fields=["title"])
+        model.refresh_from_db()
+        assert model.slug == "cafe-creme"
+        assert model.search_text.startswith("other\n")
+
+        # The title, meta and text are folded once per save.
+        with mock.patch.object(
+            blog_content.BlogContent,
+            "fold",
+            wraps=blog_content.BlogContent.fold,
+        ) as fold:
+            model.fill_derived_columns()
+        assert fold.call_count == 3
+
+        # Stored columns are read as they are, not computed again.
+        with (
+            mock.patch.object(
+                blog_content.BlogContent, "compute_search_text"
+            ) as compute_search_text,
+            mock.patch.object(
+                blog.Blog, "compute_slug"
+            ) as compute_slug,
+        ):
+            entity = blog_mapper.model_to_entity(model)
+        compute_search_text.assert_not_called()
+        compute_slug.assert_not_called()
+        assert entity.slug == "cafe-creme"
+        assert entity.content.contains("NAIVE")
+        assert not entity.content.contains("NAIVE", case_sensitive=True)
+
+    def test_row_to_summary(
+        self, blog_mapper: blog_mapper_.BlogMapper
+    ) -> None:
+        row = (
+            1,
+            "1",
+            "1",
+            "1",
+            "https://1.jpg",
+            "uncategorized",
+            datetime.datetime.utcnow(),
+        )
+        assert len(row) == len(blog_mapper.summary_fields)
+
+        summary = blog_mapper.row_to_summary(row)
+        assert isinstance(summary, blog_summary.BlogSummary)
+        assert summary.id == blog_id.BlogId(1)
+        assert (
+            summary.category == blog_category.BlogCategory.UNCATEGORIZED
+        )
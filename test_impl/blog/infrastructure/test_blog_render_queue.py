@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "TestDjangoBlogRenderQueue",
+    "TestRenderBlogsCommand",
+)
+
+import datetime
+import io
+import typing
+from unittest import mock
+
+import pytest
+from django.core import management
+
+from src.modules.blog.application.services import blog_streamer
+from src.modules.blog.domain import blog as blog_
+from src.modules.blog.domain import blog_id as blog_id_
+from src.modules.blog.domain import blog_render_queue
+from src.modules.blog.infrastructure import container
+from src.modules.blog.infrastructure.persistence import (
+    blog_render_queue as blog_render_queue_impl,
+)
+from src.modules.blog.infrastructure.persistence import (
+    blog_repository as blog_repository_impl,
+)
+from src.modules.blog.infrastructure.persistence import models
+from test_impl.blog import _util
+
+_Status = blog_render_queue.BlogRenderStatus
+
+
+@pytest.fixture(name="queue")
+def _() -> blog_render_queue_impl.DjangoBlogRenderQueue:
+    return blog_render_queue_impl.DjangoBlogRenderQueue(
+        max_attempts=2, retry_delay=datetime.timedelta(0)
+    )
+
+
+def _save(sno: int) -> blog_id_.BlogId:
+    blog_id = blog_id_.BlogId(sno)
+    blog_repository_impl.DjangoBlogRepository().save(
+        _util.entity_from_id(blog_id)
+    )
+    return blog_id
+
+
+class TestDjangoBlogRenderQueue:
+    __slots__: typing.Sequence[str] = ()
+
+    @pytest.mark.django_db
+    def test_blogs_are_enqueued_on_creation(
+        self, queue: blog_render_queue_impl.DjangoBlogRenderQueue
+    ) -> None:
+        assert queue.status(blog_id_.BlogId(1)) is None
+
+        blog_id = _save(1)
+        assert queue.status(blog_id) is _Status.PENDING
+
+    @pytest.mark.django_db
+    def test_claim_and_complete(
+        self, queue: blog_render_queue_impl.DjangoBlogRenderQueue
+    ) -> None:
+        first, second = _save(1), _save(2)
+
+        jobs = queue.claim(1)
+        assert jobs == [blog_render_queue.BlogRenderJob(first, 1)]
+        assert queue.status(first) is _Status.RUNNING
+        # A claimed job is not handed out twice.
+        assert queue.claim(2) == [
+            blog_render_queue.BlogRenderJob(second, 1)
+        ]
+        assert not queue.claim(2)
+
+        queue.complete(jobs[0])
+        assert queue.status(first) is _Status.DONE
+
+        # Enqueueing a rendered blog queues it again.
+        queue.enqueue(first)
+        assert queue.status(first) is _Status.PENDING
+
+    @pytest.mark.django_db
+    def test_enqueue_requested_formats(
+        self, queue: blog_render_queue_impl.DjangoBlogRenderQueue
+    ) -> None:
+        blog_id = _save(1)
+
+        # Formats are added to the waiting job.
+        queue.enqueue(blog_id, ["txt"])
+        queue.enqueue(blog_id, ["md", "txt"])
+        (job,) = queue.claim(1)
+        assert job.formats == ("md", "txt")
+
+        # A running job is queued again with all of its formats.
+        queue.enqueue(blog_id, ["epub"])
+        (job,) = queue.claim(1)
+        assert job.formats == ("epub", "md", "txt")
+
+        # A rendered blog is queued again for the new ones only.
+        queue.complete(job)
+        queue.enqueue(blog_id)
+        (job,) = queue.claim(1)
+        assert job.formats == ()
+
+    @pytest.mark.django_db
+    def test_fail_retries_until_out_of_attempts(
+        self, queue: blog_render_queue_impl.DjangoBlogRenderQueue
+    ) -> None:
+        blog_id = _save(1)
+
+        (job,) = queue.claim(1)
+        queue.fail(job, "error")
+        assert queue.status(blog_id) is _Status.PENDING
+
+        (job,) = queue.claim(1)
+        assert job.attempts == 2
+        queue.fail(job, "error")
+        assert queue.status(blog_id) is _Status.FAILED
+        assert not queue.claim(1)
+
+    @pytest.mark.django_db
+    def test_expired_lease_is_claimed_again(self) -> None:
+        queue = blog_render_queue_impl.DjangoBlogRenderQueue(
+            lease=datetime.timedelta(0)
+        )
+        blog_id = _save(1)
+
+        (job,) = queue.claim(1)
+        assert queue.claim(1) == [
+            blog_render_queue.BlogRenderJob(blog_id, 2)
+        ]
+        # The abandoned attempt can no longer complete the job.
+        queue.complete(job)
+        assert queue.status(blog_id) is _Status.RUNNING
+
+
+class TestRenderBlogsCommand:
+    __slots__: typing.Sequence[str] = ()
+
+    @pytest.mark.django_db
+    def test_renders_queued_blogs(self) -> None:
+        first, second = _save(1), _save(2)
+        streamer = mock.Mock(blog_streamer.BlogStreamerService)
+        streamer.prewarm.side_effect = [True, RuntimeError("boom")]
+        blog_container = container.blog_container
+
+        with blog_container.blog_streamer.override(streamer):
+            management.call_command(
+                "render_blogs",
+                "--once",
+                "--concurrency=1",
+                stdout=io.StringIO(),
+                stderr=io.StringIO(),
+            )
+
+        assert streamer.prewarm.call_count == 2
+        queue = blog_container.blog_render_queue()
+        assert queue.status(first) is _Status.DONE
+        # Retried later, after a delay.
+        assert queue.status(second) is _Status.PENDING
+
+    @pytest.mark.django_db
+    def test_renders_requested_formats(self) -> None:
+        blog_id = _save(1)
+        streamer = mock.Mock(blog_streamer.BlogStreamerService)
+        streamer.formats = ["pdf", "txt"]
+        blog_container = container.blog_container
+        # Formats disabled since their request are skipped.
+        blog_container.blog_render_queue().enqueue(
+            blog_id, ["txt", "md"]
+        )
+
+        with blog_container.blog_streamer.override(streamer):
+            management.call_command(
+                "render_blogs", "--once", stdout=io.StringIO()
+            )
+
+        streamer.prewarm.assert_called_once()
+        streamer.render.assert_called_once_with(mock.ANY, "txt")
+
+    @pytest.mark.django_db(transaction=True)
+    def test_renders_current_content(self) -> None:
+        blog_id = _save(1)
+        streamer = mock.Mock(blog_streamer.BlogStreamerService)
+        blog_container = container.blog_container
+        repository = blog_container.blog_repository()
+
+        def render() -> blog_.Blog:
+            with blog_container.blog_streamer.override(streamer):
+                management.call_command(
+                    "render_blogs", "--once", stdout=io.StringIO()
+                )
+            return typing.cast(
+                blog_.Blog, streamer.prewarm.call_args.args[0]
+            )
+
+        assert render().content.digest == (
+            repository.get_blog(blog_id).content.digest
+        )
+
+        # Edited by another process, whose changes this one has not
+        # been told about, so its caches still hold the old blog.
+        models.BlogModel.objects.filter(sno=blog_id).update(
+            content="Edited"
+        )
+        blog_container.blog_render_queue().enqueue(blog_id)
+        assert render().content.content == "Edited"
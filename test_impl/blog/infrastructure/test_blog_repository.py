@@ -23,15 +23,27 @@ from __future__ import annotations
 
 __all__: typing.Sequence[str] = ("TestDjangoBlogRepository",)
 
+import datetime
 import typing
+from unittest import mock
 
 import pytest
+from django.db import connection
+from django.db import transaction
+from django.db.models import signals as django_signals
+from django.test import utils
 
 from src.modules.blog.domain import blog as blog_
+from src.modules.blog.domain import blog_category
+from src.modules.blog.domain import blog_cursor
 from src.modules.blog.domain import blog_id as blog_id_
+from src.modules.blog.domain import blog_summary
+from src.modules.blog.infrastructure import container
 from src.modules.blog.infrastructure.persistence import (
     blog_repository as blog_repository_impl,
 )
+from src.modules.blog.infrastructure.persistence import models
+from src.modules.blog.infrastructure.persistence import signals
 from test_impl.blog import _util
 
 if typing.TYPE_CHECKING:
@@ -64,6 +76,106 @@ class TestDjangoBlogRepository:
         blog = blog_repository.get_blog(blog_id)
         assert isinstance(blog, blog_.Blog)
 
+    @pytest.mark.django_db
+    def test_get_blogs(
+        self, blog_repository: blog_repository_.BlogRepository
+    ) -> None:
+        for sno in (1, 2, 3):
+            blog_repository.save(
+                _util.entity_from_id(blog_id_.BlogId(sno))
+            )
+
+        blog_ids = [blog_id_.BlogId(i) for i in (3, 4, 1, 3)]
+        with utils.CaptureQueriesContext(connection) as queries:
+            batch = blog_repository.get_blogs(blog_ids)
+        assert len(queries) == 1
+        assert [blog.id for blog in batch] == [3, 1]
+        assert list(batch.missing) == [4]
+        assert not blog_repository.get_blogs([])
+
+    @pytest.mark.django_db
+    def test_save_many(
+        self, blog_repository: blog_repository_.BlogRepository
+    ) -> None:
+        receiver = mock.Mock()
+        post_save_receiver = mock.Mock()
+        signals.blogs_saved.connect(receiver)
+        django_signals.post_save.connect(
+            post_save_receiver, sender=models.BlogModel
+        )
+        try:
+            blog_repository.save_many(
+                [
+                    _util.entity_from_id(blog_id_.BlogId(i))
+                    for i in (1, 2)
+                ]
+            )
+            published_at = models.BlogModel.objects.get(sno=1).time
+
+            entities = [
+                _util.entity_from_content(blog_id_.BlogId(i), "Café")
+                for i in (1, 2, 3)
+            ]
+            with utils.CaptureQueriesContext(connection) as queries:
+                blog_repository.save_many(entities, batch_size=2)
+        finally:
+            signals.blogs_saved.disconnect(receiver)
+            django_signals.post_save.disconnect(
+                post_save_receiver, sender=models.BlogModel
+            )
+
+        inserts = [
+            q
+            for q in queries
+            if q["sql"].startswith('INSERT INTO "blog_blogmodel"')
+        ]
+        assert len(inserts) == 2
+        assert receiver.call_count == 2
+        assert receiver.call_args.kwargs["blogs"] == tuple(entities)
+        post_save_receiver.assert_not_called()
+
+        saved = models.BlogModel.objects.order_by("sno")
+        assert [model.content for model in saved] == ["Café"] * 3
+        assert saved[0].time == published_at
+        assert saved[0].content_hash == entities[0].digest
+        assert saved[0].search_text == "1\n1\ncafe"
+        assert (
+            blog_repository.search("cafe", page=1, page_size=10).total
+            == 3
+        )
+
+    @pytest.mark.django_db
+    def test_save_many_is_rolled_back_with_receivers(
+        self, blog_repository: blog_repository_.BlogRepository
+    ) -> None:
+        # Blogs are never saved without being indexed.
+        receiver = mock.Mock(side_effect=RuntimeError("boom"))
+        signals.blogs_saved.connect(receiver)
+        try:
+            with pytest.raises(RuntimeError):
+                blog_repository.save_many(
+                    [_util.entity_from_id(blog_id_.BlogId(1))]
+                )
+        finally:
+            signals.blogs_saved.disconnect(receiver)
+
+        assert not models.BlogModel.objects.exists()
+
+    @pytest.mark.django_db
+    def test_get_blog_version(
+        self, blog_repository: blog_repository_.BlogRepository
+    ) -> None:
+        blog_id = blog_id_.BlogId(1)
+        assert blog_repository.get_blog_version(blog_id) is None
+
+        entity = _util.entity_from_id(blog_id)
+        blog_repository.save(entity)
+
+        version = blog_repository.get_blog_version(blog_id)
+        assert version is not None
+        assert version.id == blog_id
+        assert version.digest == entity.digest
+
     @pytest.mark.django_db
     def test_get_all_blogs(
         self, blog_repository: blog_repository_.BlogRepository
@@ -91,3 +203,183 @@ class TestDjangoBlogRepository:
         )
         assert len(blogs) == 2
         assert blogs[0].id == blog_id_.BlogId(8)
+
+    @pytest.mark.django_db
+    def test_get_latest(
+        self, blog_repository: blog_repository_.BlogRepository
+    ) -> None:
+        assert not blog_repository.get_latest(3)
+
+        for sno in range(5):
+            blog_repository.save(
+                _util.entity_from_id(blog_id_.BlogId(sno))
+            )
+
+        blogs = blog_repository.get_latest(3)
+        assert [blog.id for blog in blogs] == [4, 3, 2]
+
+    @pytest.mark.django_db
+    def test_get_page(
+        self, blog_repository: blog_repository_.BlogRepository
+    ) -> None:
+        page = blog_repository.get_page(1, 3)
+        assert not page
+        assert page.num_pages == 1
+
+        for sno in range(7):
+            blog_repository.save(
+                _util.entity_from_id(blog_id_.BlogId(sno))
+            )
+
+        page = blog_repository.get_page(1, 3)
+        assert page.total == 7
+        assert page.num_pages == 3
+        assert [blog.id for blog in page] == [6, 5, 4]
+
+        page = blog_repository.get_page(10, 3)
+        assert page.number == 3
+        assert not page.has_next
+        assert [blog.id for blog in page] == [0]
+
+        page = blog_repository.get_page(
+            1, 3, filter_={"sno__lt": 2}, order_by="time"
+        )
+        assert page.total == 2
+        assert [blog.id for blog in page] == [0, 1]
+
+    @pytest.mark.django_db
+    def test_get_page_after(
+        self, blog_repository: blog_repository_.BlogRepository
+    ) -> None:
+        page = blog_repository.get_page_after(None, 3)
+        assert not page
+        assert not page.has_next
+
+        for sno in range(7):
+            blog_repository.save(
+                _util.entity_from_id(blog_id_.BlogId(sno))
+            )
+        # Blogs published at the same time are told apart by SNO.
+        models.BlogModel.objects.filter(sno__in=[2, 3, 4]).update(
+            time=datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+        )
+
+        seen = []
+        page = blog_repository.get_page_after(None, 3)
+        seen.extend(blog.id for blog in page)
+        while page.next_cursor is not None:
+            page = blog_repository.get_page_after(page.next_cursor, 3)
+            seen.extend(blog.id for blog in page)
+
+        assert seen == [6, 5, 1, 0, 4, 3, 2]
+        assert page.total == 7
+        assert page.num_pages == 3
+
+        # The same pages are found walking back from the last one.
+        seen = [blog.id for blog in page]
+        while page.previous_cursor is not None:
+            page = blog_repository.get_page_before(
+                page.previous_cursor, 3
+            )
+            seen[:0] = [blog.id for blog in page]
+
+        assert seen == [6, 5, 1, 0, 4, 3, 2]
+        assert page.has_next
+        assert not page.has_previous
+
+        page = blog_repository.get_page_after(
+            None, 3, filter_={"sno__gte": 4}
+        )
+        assert [blog.id for blog in page] == [6, 5, 4]
+        assert not page.has_next
+
+    @pytest.mark.django_db
+    def test_summaries_skip_content(
+        self, blog_repository: blog_repository_.BlogRepository
+    ) -> None:
+        blog_repository.save(
+            _util.entity_from_content(blog_id_.BlogId(1), "django")
+        )
+
+        cursor = blog_cursor.BlogCursor(
+            created_at=datetime.datetime.min.replace(
+                tzinfo=datetime.UTC
+            ),
+            sno=blog_id_.BlogId(0),
+        )
+        with utils.CaptureQueriesContext(connection) as queries:
+            listings = (
+                blog_repository.get_latest(3),
+                blog_repository.get_page(1, 3),
+                blog_repository.get_page_after(None, 3),
+                blog_repository.get_page_before(cursor, 3),
+                blog_repository.search("django", page=1, page_size=3),
+            )
+
+        for listing in listings:
+            assert all(
+                isinstance(blog, blog_summary.BlogSummary)
+                for blog in listing
+            )
+        for query in queries:
+            assert '"content"' not in query["sql"]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_get_category_stats(
+        self, django_assert_num_queries: typing.Any
+    ) -> None:
+        # The repository whose shared cache the callbacks invalidate.
+        blog_repository = container.blog_container.blog_repository()
+        assert not blog_repository.get_category_stats()
+
+        for sno in range(3):
+            blog_repository.save(
+                _util.entity_from_id(blog_id_.BlogId(sno))
+            )
+        models.BlogModel.objects.filter(sno=0).update(
+            category=blog_category.BlogCategory.APPLICATION_ARCHITECT
+        )
+
+        stats = blog_repository.get_category_stats()
+        assert [(s.category, s.count) for s in stats] == [
+            (blog_category.BlogCategory.APPLICATION_ARCHITECT, 1),
+            (blog_category.BlogCategory.UNCATEGORIZED, 2),
+        ]
+
+        with django_assert_num_queries(0):
+            assert blog_repository.get_category_stats() == stats
+
+        # The stats are only invalidated once the deletion has been
+        # committed, so that the ones from before are not cached
+        # again in the meantime.
+        with transaction.atomic():
+            models.BlogModel.objects.get(sno=0).delete()
+            assert blog_repository.get_category_stats() == stats
+
+        stats = blog_repository.get_category_stats()
+        assert [(s.category, s.count) for s in stats] == [
+            (blog_category.BlogCategory.UNCATEGORIZED, 2)
+        ]
+
+    @pytest.mark.django_db
+    def test_search(
+        self, blog_repository: blog_repository_.BlogRepository
+    ) -> None:
+        page = blog_repository.search("django", page=1, page_size=2)
+        assert not page
+        assert page.num_pages == 1
+
+        for sno, content in enumerate(("django", "django orm", "orm")):
+            blog_repository.save(
+                _util.entity_from_content(blog_id_.BlogId(sno), content)
+            )
+
+        page = blog_repository.search("django orm", page=1, page_size=2)
+        assert page.total == 3
+        assert page.has_next
+        assert [blog.id for blog in page][0] == blog_id_.BlogId(1)
+
+        page = blog_repository.search("django", page=5, page_size=1)
+        assert page.number == 2
+        assert not page.has_next
+        assert len(page) == 1
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "TestBlogSearchIndex",
+    "test_create_search_index",
+    "test_term_index_ranks_by_query_words",
+    "test_term_index_ranks_phrases_first",
+    "test_tokenize",
+)
+
+import typing
+from unittest import mock
+
+import pytest
+from django.db import connection
+
+from src.modules.blog.domain import blog_id as blog_id_
+from src.modules.blog.infrastructure.persistence import (
+    blog_repository as blog_repository_impl,
+)
+from src.modules.blog.infrastructure.persistence import (
+    blog_search_index as blog_search_index_impl,
+)
+from test_impl.blog import _util
+from test_impl.shared import _util as shared_util
+
+if typing.TYPE_CHECKING:
+    from src.modules.blog.domain import (
+        blog_search_index as blog_search_index_,
+    )
+
+
+@pytest.fixture(
+    name="blog_search_index",
+    params=[
+        blog_search_index_impl.DjangoBlogSearchIndex,
+        pytest.param(
+            blog_search_index_impl.SqliteBlogSearchIndex,
+            marks=shared_util.sqlite_only,
+        ),
+        pytest.param(
+            blog_search_index_impl.PostgresBlogSearchIndex,
+            marks=shared_util.postgresql_only,
+        ),
+    ],
+)
+def _(
+    request: pytest.FixtureRequest,
+) -> blog_search_index_.BlogSearchIndex:
+    index = typing.cast(
+        "blog_search_index_.BlogSearchIndex", request.param()
+    )
+    return index
+
+
+def _save_and_index(
+    index: blog_search_index_.BlogSearchIndex, sno: int, content: str
+) -> blog_id_.BlogId:
+    blog_id = blog_id_.BlogId(sno)
+    entity = _util.entity_from_content(blog_id, content)
+
+    blog_repository_impl.DjangoBlogRepository().save(entity)
+    index.index(entity)
+    return blog_id
+
+
+def test_tokenize() -> None:
+    terms = list(
+        blog_search_index_impl.tokenize(
+            "<p>Café, <b>DJANGO</b> orm</p>"
+        )
+    )
+    assert terms == ["cafe", "django", "orm"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("vendor", "index_type"),
+    [
+        pytest.param(
+            "sqlite",
+            blog_search_index_impl.SqliteBlogSearchIndex,
+            marks=shared_util.sqlite_only,
+        ),
+        ("postgresql", blog_search_index_impl.PostgresBlogSearchIndex),
+        ("mysql", blog_search_index_impl.DjangoBlogSearchIndex),
+    ],
+)
+def test_create_search_index(
+    vendor: str, index_type: typing.Type[typing.Any]
+) -> None:
+    with mock.patch.object(connection, "vendor", vendor):
+        index = blog_search_index_impl.create_search_index()
+    assert isinstance(index, index_type)
+
+
+@pytest.mark.django_db
+def test_term_index_ranks_by_query_words() -> None:
+    index = blog_search_index_impl.DjangoBlogSearchIndex()
+    # Prefixes matching several terms of a blog count once.
+    first = _save_and_index(index, 1, "python pytest pypi")
+    second = _save_and_index(index, 2, "pyramid django")
+    assert index.lookup("py django") == [second, first]
+
+    # Blogs matching as many words are ranked by occurrences.
+    third = _save_and_index(index, 3, "django django")
+    assert index.lookup("django") == [third, second]
+
+
+@pytest.mark.django_db
+def test_term_index_ranks_phrases_first() -> None:
+    index = blog_search_index_impl.DjangoBlogSearchIndex()
+    apart = _save_and_index(index, 1, "django and the orm orm")
+    phrase = _save_and_index(index, 2, "the django orm")
+    partial = _save_and_index(index, 3, "django django django")
+    reversed_ = _save_and_index(index, 4, "orm django")
+    assert index.lookup("djan orm") == [
+        phrase,
+        apart,
+        reversed_,
+        partial,
+    ]
+
+    # Pages span both the blogs containing every word of the query
+    # and the others.
+    assert index.lookup("django orm", offset=1, limit=2) == [
+        apart,
+        reversed_,
+    ]
+    assert index.lookup("django orm", offset=2, limit=2) == [
+        reversed_,
+        partial,
+    ]
+    assert index.lookup("django orm", offset=4) == []
+
+
+class TestBlogSearchIndex:
+    __slots__: typing.Sequence[str] = ()
+
+    @pytest.mark.django_db
+    def test_index_and_lookup(
+        self, blog_search_index: blog_search_index_.BlogSearchIndex
+    ) -> None:
+        assert not blog_search_index.lookup("django")
+
+        blog_id = _save_and_index(blog_search_index, 1, "Django ORM")
+        assert blog_search_index.lookup("django") == [blog_id]
+        assert blog_search_index.lookup("DJAN") == [blog_id]
+        assert blog_search_index.lookup("<>") == []
+
+        _save_and_index(blog_search_index, 1, "Café")
+        assert not blog_search_index.lookup("django")
+        assert blog_search_index.lookup("cafe") == [blog_id]
+
+    @pytest.mark.django_db
+    def test_lookup_ranks_and_paginates(
+        self, blog_search_index: blog_search_index_.BlogSearchIndex
+    ) -> None:
+        first = _save_and_index(blog_search_index, 1, "django")
+        second = _save_and_index(blog_search_index, 2, "django orm")
+        _save_and_index(blog_search_index, 3, "flask")
+
+        assert blog_search_index.count("django orm") == 2
+        assert blog_search_index.lookup("django orm") == [second, first]
+        assert blog_search_index.lookup(
+            "django orm", offset=1, limit=1
+        ) == [first]
+
+    @pytest.mark.django_db
+    def test_remove(
+        self, blog_search_index: blog_search_index_.BlogSearchIndex
+    ) -> None:
+        blog_id = _save_and_index(blog_search_index, 1, "django")
+
+        blog_search_index.remove(blog_id)
+        assert not blog_search_index.lookup("django")
+        assert blog_search_index.count("django") == 0
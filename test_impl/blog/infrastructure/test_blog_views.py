@@ -30,15 +30,31 @@ __all__: typing.Sequence[str] = (
 )
 
 import datetime
+import io
+import pathlib
 import typing
 from unittest import mock
 
 import pytest
 from django import test
 from django import urls
+from django.core import management
 from pytest_django import asserts
 
+from src.modules.blog.application.services import blog_streamer
+from src.modules.blog.domain import blog_id
+from src.modules.blog.domain import blog_page
+from src.modules.blog.domain import blog_render_queue
+from src.modules.blog.domain import blog_version
 from src.modules.blog.infrastructure.django import views
+from src.modules.blog.infrastructure.persistence import (
+    blog_artifact_store as blog_artifact_store_impl,
+)
+from src.modules.blog.infrastructure.persistence import (
+    blog_repository as blog_repository_impl,
+)
+from src.modules.blog.infrastructure.persistence import models
+from src.modules.blog.infrastructure.rendering import pdf_renderer
 
 
 class TestBlogView:
@@ -68,6 +84,75 @@ class TestBlogView:
 
         asserts.assertTemplateUsed(response, "blog/blog.html")
 
+    def test_view_with_cursor(self, rf: test.RequestFactory) -> None:
+        mock_repo = mock.Mock()
+        mock_repo.get_page_after.return_value = (
+            blog_page.BlogCursorPage(
+                items=[],
+                next_cursor=None,
+                previous_cursor=None,
+                size=3,
+                total=0,
+            )
+        )
+
+        request = rf.get("/blog", {"cursor": "invalid"})
+        response = views.blog(request, repo=mock_repo)
+        assert response.status_code == 200
+
+        mock_repo.get_page_after.assert_called_once_with(None, 3)
+        mock_repo.get_page.assert_not_called()
+
+    @pytest.mark.django_db
+    def test_view_links_pages_by_cursor(
+        self, client: test.Client
+    ) -> None:
+        for sno in range(1, 8):
+            models.BlogModel.objects.create(
+                sno=sno, title=str(sno), meta=str(sno), content=str(sno)
+            )
+
+        def get(query: str) -> typing.Any:
+            response = client.get(urls.reverse("blog:blog") + query)
+            assert response.status_code == 200
+            return response
+
+        def link(response: typing.Any, label: str) -> str:
+            # The query string of the link labelled `label`.
+            html = response.content.decode()
+            end = html.index(label)
+            start = html.rindex('href="', 0, end) + len('href="')
+            return html[start : html.index('"', start)]
+
+        def ids(response: typing.Any) -> typing.List[int]:
+            return [blog.id for blog in response.context["blogs"]]
+
+        response = get("")
+        assert ids(response) == [7, 6, 5]
+        assert "Page 1 of 3" in response.content.decode()
+        assert "Previous" not in response.content.decode()
+
+        # Both directions are walked through cursors.
+        response = get(link(response, "Next"))
+        assert link(response, "Next").startswith("?cursor=")
+        assert ids(response) == [4, 3, 2]
+        assert "Page 2 of 3" in response.content.decode()
+
+        response = get(link(response, "Next"))
+        assert ids(response) == [1]
+        assert "Page 3 of 3" in response.content.decode()
+        assert response.context["next_cursor"] is None
+
+        response = get(link(response, "Previous"))
+        assert link(response, "Previous").startswith("?before=")
+        assert ids(response) == [4, 3, 2]
+        assert "Page 2 of 3" in response.content.decode()
+
+        response = get(link(response, "Previous"))
+        assert ids(response) == [7, 6, 5]
+        assert "Page 1 of 3" in response.content.decode()
+        assert response.context["previous_cursor"] is None
+
 
 class TestCategoryView:
     __slots__: typing.Sequence[str] = ()
@@ -128,6 +213,27 @@ class TestCategoriesView:
 
         asserts.assertTemplateUsed(response, "blog/categories.html")
 
+    @pytest.mark.django_db(transaction=True)
+    def test_view_is_cached(self, rf: test.RequestFactory) -> None:
+        mock_repo = mock.Mock()
+        mock_repo.get_category_stats.return_value = []
+
+        for _ in range(2):
+            request = rf.get("/categories")
+            response = views.categories(request, repo=mock_repo)
+            assert response.status_code == 200
+
+        mock_repo.get_category_stats.assert_called_once()
+
+        # Saving a blog invalidates all cached pages.
+        models.BlogModel.objects.create(
+            title="1", meta="1", content="1"
+        )
+
+        request = rf.get("/categories")
+        views.categories(request, repo=mock_repo)
+        assert mock_repo.get_category_stats.call_count == 2
+
 
 class TestSearchView:
     __slots__: typing.Sequence[str] = ()
@@ -179,28 +285,31 @@ class TestSearchView:
     @pytest.mark.django_db
     def test_search_with_results(self, rf: test.RequestFactory) -> None:
         blog1 = mock.Mock()
-        blog1.contains_word.return_value = True
-        blog1.created_at = datetime.datetime.utcnow()
         blog1.title = "Blog Title 1"
 
         blog2 = mock.Mock()
-        blog2.contains_word.return_value = True
-        blog2.created_at = (
-            datetime.datetime.utcnow() + datetime.timedelta(days=1)
-        )
         blog2.title = "Blog Title 2"
 
         mock_repo = mock.Mock()
-        mock_repo.get_all_blogs.return_value = [blog1, blog2]
+        mock_repo.search.return_value = blog_page.BlogPage(
+            items=[blog2, blog1], number=1, size=3, total=2
+        )
 
-        request = rf.get("/search", {"q": "test"})
+        request = rf.get("/search", {"q": "test", "page": "x"})
         response = views.search(request, repo=mock_repo)
         assert response.status_code == 200
 
-        assert b"Blog Title 1" in response.content
-        assert b"Blog Title 2" in response.content
+        mock_repo.search.assert_called_once_with(
+            "test", page=1, page_size=3
+        )
 
-        assert b"Read more" in response.content
+        # Results keep the relevance order of the repository.
+        content = response.content
+        assert content.index(b"Blog Title 2") < content.index(
+            b"Blog Title 1"
+        )
+        assert b"Read more" in content
+        assert b"Sorry, no results found" not in content
 
 
 class TestBlogpostView:
@@ -220,6 +329,13 @@ class TestBlogpostView:
 
         repo_mock = mock.Mock()
         repo_mock.get_blog.return_value = blogpost_mock
+        repo_mock.get_blog_version.return_value = (
+            blog_version.BlogVersion(
+                id=blog_id.BlogId(1),
+                digest="0",
+                modified_at=datetime.datetime.now(datetime.UTC),
+            )
+        )
 
         response = views.blogpost(
             request,
@@ -237,3 +353,267 @@ class TestBlogpostView:
             urls.reverse("blog:blogpost", args=[1, "2"])
         )
         assert response.status_code == 404
+
+    @pytest.mark.django_db
+    def test_view_tags_pages_by_language(
+        self, client: test.Client
+    ) -> None:
+        models.BlogModel.objects.create(
+            sno=1, title="1", meta="1", content="1"
+        )
+        url = urls.reverse("blog:blogpost", args=[1, "1"])
+
+        response = client.get(url, headers={"Accept-Language": "en"})
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        assert "Accept-Language" in response.headers["Vary"]
+
+        # A page cached in another language is not validated.
+        response = client.get(
+            url,
+            headers={"Accept-Language": "nl", "If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+        response = client.get(
+            url,
+            headers={"Accept-Language": "en", "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+
+    @pytest.mark.django_db(transaction=True)
+    def test_view_answers_conditional_requests(
+        self, rf: test.RequestFactory
+    ) -> None:
+        models.BlogModel.objects.create(
+            sno=1, title="1", meta="1", content="1"
+        )
+
+        response = views.blogpost(rf.get("/blogpost"), id=1, slug="1")
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        last_modified = response.headers["Last-Modified"]
+
+        for headers in (
+            {"If-None-Match": etag},
+            {"If-Modified-Since": last_modified},
+        ):
+            request = rf.get("/blogpost", headers=headers)
+            response = views.blogpost(request, id=1, slug="1")
+            assert response.status_code == 304
+            assert not response.content
+
+        # The PDF is a different representation of the same blog.
+        request = rf.get(
+            "/blogpost",
+            {"format": "pdf"},
+            headers={"If-None-Match": etag},
+        )
+        with mock.patch.object(
+            views.blog_streamer.BlogStreamerService,
+            "open",
+            side_effect=FileNotFoundError,
+        ):
+            response = views.blogpost(request, id=1, slug="1")
+        assert response.status_code == 202
+
+        # Editing the blog makes the client's copy outdated.
+        model = models.BlogModel.objects.get(sno=1)
+        model.title = "2"
+        model.save()
+
+        request = rf.get("/blogpost", headers={"If-None-Match": etag})
+        response = views.blogpost(request, id=1, slug="1")
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    @pytest.mark.django_db
+    def test_view_waits_for_rendering(
+        self, rf: test.RequestFactory, tmp_path: pathlib.Path
+    ) -> None:
+        models.BlogModel.objects.create(
+            sno=1, title="1", meta="1", content="1"
+        )
+        streamer = blog_streamer.BlogStreamerService(
+            store=blog_artifact_store_impl.FileSystemBlogArtifactStore(
+                tmp_path
+            ),
+            renderers=[pdf_renderer.PdfBlogRenderer()],
+        )
+        render_job = models.BlogRenderJobModel.objects.get(blog_id=1)
+
+        request = rf.get("/blogpost", {"format": "pdf"})
+        response = views.blogpost(
+            request, id=1, slug="1", streamer=streamer
+        )
+        assert response.status_code == 202
+        assert response.headers["Retry-After"] == "5"
+        assert "ETag" not in response.headers
+
+        # The file has gone missing after rendering, so the blog
+        # is queued again.
+        render_job.status = blog_render_queue.BlogRenderStatus.DONE
+        render_job.save()
+        response = views.blogpost(
+            request, id=1, slug="1", streamer=streamer
+        )
+        assert response.status_code == 202
+        render_job.refresh_from_db()
+        assert render_job.status == "pending"
+
+        render_job.status = blog_render_queue.BlogRenderStatus.FAILED
+        render_job.save()
+        response = views.blogpost(
+            request, id=1, slug="1", streamer=streamer
+        )
+        assert response.status_code == 404
+
+        blog = blog_repository_impl.DjangoBlogRepository().get_blog(
+            blog_id.BlogId(1)
+        )
+        streamer.init(blog)
+        response = views.blogpost(
+            request, id=1, slug="1", streamer=streamer
+        )
+        assert response.status_code == 200
+
+    @pytest.mark.django_db
+    def test_view_serves_byte_ranges(
+        self, rf: test.RequestFactory, tmp_path: pathlib.Path
+    ) -> None:
+        models.BlogModel.objects.create(
+            sno=1, title="1", meta="1", content="1"
+        )
+        blog = blog_repository_impl.DjangoBlogRepository().get_blog(
+            blog_id.BlogId(1)
+        )
+        streamer = blog_streamer.BlogStreamerService(
+            store=blog_artifact_store_impl.FileSystemBlogArtifactStore(
+                tmp_path
+            ),
+            renderers=[pdf_renderer.PdfBlogRenderer()],
+        )
+        streamer.init(blog)
+        source = pathlib.Path(streamer.locate(blog)).read_bytes()
+
+        def get(**headers: str) -> typing.Any:
+            request = rf.get(
+                "/blogpost", {"format": "pdf"}, headers=headers
+            )
+            return views.blogpost(
+                request, id=1, slug="1", streamer=streamer
+            )
+
+        response = get()
+        assert response.status_code == 200
+        assert response.headers["Accept-Ranges"] == "bytes"
+        assert response.headers["Content-Disposition"] == (
+            f'inline; filename="{blog.slug}.pdf"'
+        )
+        assert b"".join(response.streaming_content) == source
+        etag = response.headers["ETag"]
+
+        response = get(Range="bytes=0-9")
+        assert response.status_code == 206
+        assert response.headers["Content-Range"] == (
+            f"bytes 0-9/{len(source)}"
+        )
+        assert b"".join(response.streaming_content) == source[:10]
+
+        response = get(Range="bytes=-5", If_Range=etag)
+        assert response.status_code == 206
+        assert b"".join(response.streaming_content) == source[-5:]
+
+        response = get(Range="bytes=0-9", If_Range='"outdated"')
+        assert response.status_code == 200
+        assert b"".join(response.streaming_content) == source
+
+        response = get(Range=f"bytes={len(source)}-")
+        assert response.status_code == 416
+        assert response.headers["Content-Range"] == (
+            f"bytes */{len(source)}"
+        )
+
+    @pytest.mark.django_db
+    def test_view_delegates_to_front_proxy(
+        self, rf: test.RequestFactory, tmp_path: pathlib.Path
+    ) -> None:
+        models.BlogModel.objects.create(
+            sno=1, title="1", meta="1", content="1"
+        )
+        blog = blog_repository_impl.DjangoBlogRepository().get_blog(
+            blog_id.BlogId(1)
+        )
+        streamer = blog_streamer.BlogStreamerService(
+            store=blog_artifact_store_impl.FileSystemBlogArtifactStore(
+                tmp_path
+            ),
+            renderers=[pdf_renderer.PdfBlogRenderer()],
+            sendfile_header="X-Accel-Redirect",
+            sendfile_root="/protected/blogs",
+        )
+
+        request = rf.get("/blogpost", {"format": "pdf"})
+        response = views.blogpost(
+            request, id=1, slug="1", streamer=streamer
+        )
+        assert response.status_code == 202
+
+        streamer.init(blog)
+        response = views.blogpost(
+            request, id=1, slug="1", streamer=streamer
+        )
+        assert response.status_code == 200
+        digest = blog.content.digest
+        assert response.headers["X-Accel-Redirect"] == (
+            f"/protected/blogs/{digest[:2]}/{digest[2:4]}/{digest}.pdf"
+        )
+        assert not response.content
+
+    @pytest.mark.django_db
+    def test_view_negotiates_export_format(
+        self, client: test.Client
+    ) -> None:
+        models.BlogModel.objects.create(
+            sno=1, title="1", meta="1", content="1"
+        )
+        url = urls.reverse("blog:blogpost", args=[1, "1"])
+
+        response = client.get(url, headers={"Accept": "text/html"})
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("text/html")
+        assert "Accept" in response.headers["Vary"]
+
+        # The cached page is not sent to clients asking for text,
+        # which the worker renders after its first request, along
+        # with the prewarmed PDF.
+        response = client.get(url, headers={"Accept": "text/plain"})
+        assert response.status_code == 202
+        response = client.get(url, {"format": "md"})
+        assert response.status_code == 202
+        response = client.get(url, {"format": "pdf"})
+        assert response.status_code == 202
+
+        render_job = models.BlogRenderJobModel.objects.get(blog_id=1)
+        assert render_job.formats == "md txt"
+        management.call_command(
+            "render_blogs", "--once", stdout=io.StringIO()
+        )
+
+        response = client.get(url, headers={"Accept": "text/plain"})
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == (
+            "text/plain; charset=utf-8"
+        )
+        assert b"".join(response.streaming_content).startswith(b"1\n=")
+
+        response = client.get(url, {"format": "md"})
+        assert response.status_code == 200
+        assert response.headers["Content-Disposition"].endswith('.md"')
+
+        response = client.get(url, {"format": "pdf"})
+        assert response.status_code == 200
+
+        response = client.get(url, {"format": "docx"})
+        assert response.status_code == 404
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("TestEpubBlogRenderer",)
+
+import io
+import typing
+import zipfile
+from xml.etree import ElementTree
+
+from src.modules.blog.domain import blog_id as blog_id_
+from src.modules.blog.infrastructure.rendering import epub_renderer
+from test_impl.blog import _util
+
+
+def _render(content: str) -> bytes:
+    stream = io.BytesIO()
+    epub_renderer.EpubBlogRenderer().render(
+        _util.entity_from_content(blog_id_.BlogId(1), content), stream
+    )
+    return stream.getvalue()
+
+
+class TestEpubBlogRenderer:
+    __slots__: typing.Sequence[str] = ()
+
+    def test_renders_valid_package(self) -> None:
+        document = _render(
+            "<h2>First</h2><p>A &lt;b&gt; \x00</p>"
+            "<ul><li>Item</li></ul><h2>Second</h2>"
+        )
+        # The media type is the first, uncompressed entry.
+        assert document[30:38] == b"mimetype"
+        assert document[38:58] == b"application/epub+zip"
+
+        with zipfile.ZipFile(io.BytesIO(document)) as archive:
+            assert archive.namelist() == [
+                "mimetype",
+                "META-INF/container.xml",
+                "OEBPS/content.opf",
+                "OEBPS/content.xhtml",
+                "OEBPS/nav.xhtml",
+            ]
+            # Every document is well-formed XML.
+            for name in archive.namelist()[1:]:
+                ElementTree.fromstring(archive.read(name))
+
+            content = archive.read("OEBPS/content.xhtml").decode()
+            assert '<h2 id="section-2">Second</h2>' in content
+            assert "<p>A &lt;b&gt; </p>" in content
+            assert "<ul>\n<li>Item</li>\n</ul>" in content
+            navigation = archive.read("OEBPS/nav.xhtml").decode()
+            assert 'href="content.xhtml#section-1">First<' in navigation
+
+    def test_renders_same_blog_identically(self) -> None:
+        assert _render("<p>1</p>") == _render("<p>1</p>")
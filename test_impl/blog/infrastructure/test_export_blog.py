@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("TestExportBlogCommand",)
+
+import io
+import json
+import pathlib
+import typing
+
+import pytest
+from django import db
+from django.core import management
+from django.test import utils
+
+from src.modules.blog.infrastructure.persistence import models
+
+
+def _export(output: pathlib.Path, *args: str) -> str:
+    stdout = io.StringIO()
+    management.call_command(
+        "export_blog",
+        str(output),
+        "--base-url=https://example.com/",
+        "--processes=1",
+        "--chunk-size=1",
+        *args,
+        stdout=stdout,
+    )
+    return stdout.getvalue()
+
+
+class TestExportBlogCommand:
+    __slots__: typing.Sequence[str] = ()
+
+    @pytest.mark.django_db
+    def test_exports_static_mirror(
+        self, tmp_path: pathlib.Path
+    ) -> None:
+        first = models.BlogModel.objects.create(
+            sno=1, title="First", meta="1", content="<p>1</p>"
+        )
+        models.BlogModel.objects.create(
+            sno=2, title="Second", meta="2", content="<p>2</p>"
+        )
+
+        assert "Exported 2 blog(s)" in _export(
+            tmp_path, "--formats=pdf,md"
+        )
+        assert (
+            b"<p>1</p>"
+            in (
+                tmp_path / f"blogpost/1/{first.slug}/index.html"
+            ).read_bytes()
+        )
+        assert (tmp_path / f"blogpost/1/{first.slug}.pdf").read_bytes()[
+            :5
+        ] == b"%PDF-"
+        assert (
+            (tmp_path / f"blogpost/1/{first.slug}.md")
+            .read_text(encoding="utf-8")
+            .startswith("# First\n")
+        )
+
+        sitemap = (tmp_path / "sitemap.xml").read_text(encoding="utf-8")
+        assert (
+            f"<loc>https://example.com/blogpost/1/{first.slug}</loc>"
+            in sitemap
+        )
+        assert sitemap.index("blogpost/1/") < sitemap.index(
+            "blogpost/2/"
+        )
+        # Pages are dated by the last change of their blog.
+        first.refresh_from_db()
+        lastmod = first.updated_at.isoformat(timespec="seconds")
+        assert f"<lastmod>{lastmod}</lastmod>" in sitemap
+
+        # Only blogs that have changed are exported again.
+        assert "skipped 2 unchanged" in _export(
+            tmp_path, "--formats=pdf,md"
+        )
+        first.content = "<p>Edited</p>"
+        first.save()
+        assert "Exported 1 blog(s), skipped 1" in _export(
+            tmp_path, "--formats=pdf,md"
+        )
+        assert (
+            b"Edited"
+            in (
+                tmp_path / f"blogpost/1/{first.slug}/index.html"
+            ).read_bytes()
+        )
+
+        # Files of deleted blogs and dropped formats are removed.
+        first.delete()
+        assert "removed 1 deleted blog(s)" in _export(tmp_path)
+        assert not (
+            tmp_path / "blogpost/1" / f"{first.slug}.pdf"
+        ).exists()
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert list(manifest) == ["2"]
+        assert all(
+            not path.endswith(".md") for path in manifest["2"]["files"]
+        )
+        assert not list(tmp_path.glob("blogpost/2/*.md"))
+
+    @pytest.mark.django_db
+    def test_reads_versions_per_chunk(
+        self, tmp_path: pathlib.Path
+    ) -> None:
+        def count_queries(output: pathlib.Path) -> int:
+            with utils.CaptureQueriesContext(db.connection) as queries:
+                _export(output, "--chunk-size=10")
+            return len(queries)
+
+        models.BlogModel.objects.create(
+            sno=1, title="First", meta="1", content="<p>1</p>"
+        )
+        one = count_queries(tmp_path / "one")
+        for sno in range(2, 6):
+            models.BlogModel.objects.create(
+                sno=sno, title=str(sno), meta="", content="<p></p>"
+            )
+
+        assert count_queries(tmp_path / "many") == one
+        manifest = json.loads(
+            (tmp_path / "many/manifest.json").read_text()
+        )
+        assert list(manifest) == ["1", "2", "3", "4", "5"]
+
+    @pytest.mark.django_db
+    def test_rejects_unsupported_formats(
+        self, tmp_path: pathlib.Path
+    ) -> None:
+        with pytest.raises(management.CommandError):
+            _export(tmp_path, "--formats=docx")
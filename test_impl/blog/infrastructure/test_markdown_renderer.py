@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("TestMarkdownBlogRenderer",)
+
+import io
+import typing
+
+from src.modules.blog.domain import blog_id as blog_id_
+from src.modules.blog.infrastructure.rendering import markdown_renderer
+from test_impl.blog import _util
+
+
+def _render(content: str) -> str:
+    stream = io.BytesIO()
+    markdown_renderer.MarkdownBlogRenderer().render(
+        _util.entity_from_content(blog_id_.BlogId(1), content), stream
+    )
+    return stream.getvalue().decode("utf-8")
+
+
+class TestMarkdownBlogRenderer:
+    __slots__: typing.Sequence[str] = ()
+
+    def test_renders_structure(self) -> None:
+        document = _render(
+            "<h2>Heading</h2><p>Some text</p>"
+            "<ol><li>First</li><li>Second</li></ol>"
+            "<pre>x = 1</pre>"
+        )
+        assert document == (
+            "# 1\n\n*1*\n\n## Heading\n\nSome text\n\n"
+            "- First\n- Second\n\n```\nx = 1\n```\n"
+        )
+
+    def test_escapes_markup(self) -> None:
+        document = _render(
+            "<p>1. *not* a list</p><p>- [neither](x)</p>"
+            "<pre>``` fenced</pre>"
+        )
+        assert "1\\. \\*not\\* a list\n" in document
+        assert "\\- \\[neither\\](x)\n" in document
+        assert "````\n``` fenced\n````\n" in document
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("TestPdfBlogRenderer",)
+
+import io
+import re
+import typing
+
+import pytest
+
+from src.modules.blog.domain import blog_id as blog_id_
+from src.modules.blog.infrastructure.rendering import pdf_renderer
+from test_impl.blog import _util
+
+
+class _RecordingStream(io.BytesIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.largest_write = 0
+
+    def write(self, data: typing.Any) -> int:
+        self.largest_write = max(self.largest_write, len(data))
+        return super().write(data)
+
+
+@pytest.fixture(name="renderer")
+def _() -> pdf_renderer.PdfBlogRenderer:
+    return pdf_renderer.PdfBlogRenderer()
+
+
+def _render(
+    renderer: pdf_renderer.PdfBlogRenderer, content: str
+) -> bytes:
+    stream = io.BytesIO()
+    renderer.render(
+        _util.entity_from_content(blog_id_.BlogId(1), content), stream
+    )
+    return stream.getvalue()
+
+
+class TestPdfBlogRenderer:
+    __slots__: typing.Sequence[str] = ()
+
+    def test_cross_reference_table_points_to_objects(
+        self, renderer: pdf_renderer.PdfBlogRenderer
+    ) -> None:
+        document = _render(renderer, "<p>Hello</p>" * 500)
+        assert document.startswith(b"%PDF-1.4\n")
+        assert document.endswith(b"%%EOF\n")
+
+        startxref = re.search(rb"startxref\n(\d+)\n%%EOF\n$", document)
+        assert startxref is not None
+        xref_offset = int(startxref.group(1))
+        assert document[xref_offset:].startswith(b"xref\n0 ")
+
+        size = int(re.search(rb"/Size (\d+)", document).group(1))
+        entries = document[xref_offset:].split(b"\n", 2)[2]
+        for number in range(1, size):
+            entry = entries[number * 20 : (number + 1) * 20]
+            assert entry.endswith(b" 00000 n \n")
+            offset = int(entry[:10])
+            assert document[offset:].startswith(b"%d 0 obj\n" % number)
+
+    def test_stream_lengths_and_pagination(
+        self, renderer: pdf_renderer.PdfBlogRenderer
+    ) -> None:
+        document = _render(renderer, "<p>Hello world</p>" * 500)
+
+        streams = re.findall(
+            rb"<< /Length (\d+) >>\nstream\n(.*?)\nendstream",
+            document,
+            re.DOTALL,
+        )
+        pages = int(re.search(rb"/Count (\d+)", document).group(1))
+        assert pages > 1
+        assert len(streams) == pages
+        for length, content in streams:
+            assert int(length) == len(content)
+
+    def test_html_is_laid_out_as_text(
+        self, renderer: pdf_renderer.PdfBlogRenderer
+    ) -> None:
+        document = _render(
+            renderer,
+            "<h2>Heading (1)</h2><p>Fish &amp; chips</p>"
+            "<ul><li>Item</li></ul><pre>a  b</pre>"
+            "<script>hidden()</script>",
+        )
+        assert b"/F1 14 Tf" in document  # The heading style.
+        assert b"(Heading \\(1\\)) Tj" in document
+        assert b"(Fish & chips) Tj" in document
+        assert b"(\x95 Item) Tj" in document
+        assert b"/F2 9 Tf" in document
+        assert b"(a  b) Tj" in document
+        assert b"hidden" not in document
+
+    def test_markdown_is_laid_out_as_text(
+        self, renderer: pdf_renderer.PdfBlogRenderer
+    ) -> None:
+        document = _render(
+            renderer,
+            "# Heading\n\nSome **bold**\ntext, [a link](https://a.b)."
+            "\n\n- Item\n\n```\ncode\n```\n",
+        )
+        assert b"(Heading) Tj" in document
+        assert b"(Some bold text, a link.) Tj" in document
+        assert b"(\x95 Item) Tj" in document
+        assert b"(code) Tj" in document
+
+    def test_long_lines_are_wrapped(
+        self, renderer: pdf_renderer.PdfBlogRenderer
+    ) -> None:
+        document = _render(renderer, "word " * 100 + "x" * 500)
+        lines = re.findall(rb"\((.*?)\) Tj", document)
+        # Title, meta and at least two lines for each part.
+        assert len(lines) >= 6
+        assert b"x" * 500 not in document
+
+    def test_writes_incrementally(
+        self, renderer: pdf_renderer.PdfBlogRenderer
+    ) -> None:
+        stream = _RecordingStream()
+        renderer.render(
+            _util.entity_from_content(
+                blog_id_.BlogId(1), "<p>Hello world</p>" * 100_000
+            ),
+            stream,
+        )
+        assert len(stream.getvalue()) > 1_000_000
+        # No more than about a page is written at once.
+        assert stream.largest_write < 16 * 1024
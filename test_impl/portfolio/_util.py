@@ -21,7 +21,7 @@
 # SOFTWARE.
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("project_from_title",)
+__all__: typing.Sequence[str] = ("project_from_title", "about_me_model")
 
 import datetime
 import typing
@@ -31,6 +31,7 @@ from src.modules.portfolio.domain import project_asset
 from src.modules.portfolio.domain import project_content
 from src.modules.portfolio.domain import project_reference
 from src.modules.portfolio.domain import project_title
+from src.modules.portfolio.infrastructure.persistence import models
 
 
 def project_from_title(title: str) -> project.Project:
@@ -46,3 +47,33 @@ def project_from_title(title: str) -> project.Project:
         created_at=datetime.datetime.utcnow(),
     )
     return entity
+
+
+def about_me_model(
+    skills: typing.Sequence[typing.Tuple[str, str]] = (
+        ("Python", "Languages"),
+        ("Git", "Tools"),
+        ("Rust", "Languages"),
+    ),
+) -> models.AboutMeModel:
+    gradient = models.SkillGradient.BLUE
+    skill_type = models.SkillType.objects.create(
+        name="Programming", gradient=gradient
+    )
+    categories: typing.Dict[str, models.SkillCategory] = {}
+    model = models.AboutMeModel.objects.create(name="1", text="1")
+    for name, category in skills:
+        if category not in categories:
+            categories[category] = models.SkillCategory.objects.create(
+                name=category, gradient=gradient
+            )
+        skill = models.SkillModel(
+            name=name,
+            rate=50,
+            type=skill_type,
+            category=categories[category],
+            gradient=gradient,
+        )
+        skill.save()
+        model.skills.add(skill)
+    return model
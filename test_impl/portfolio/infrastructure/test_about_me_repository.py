@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("TestDjangoAboutMeRepository",)
+
+import dataclasses
+import typing
+
+import pytest
+from django.db import connection
+from django.db import transaction
+from django.test import utils
+
+from src.modules.portfolio.domain import about_me as about_me_
+from src.modules.portfolio.infrastructure import container
+from src.modules.portfolio.infrastructure.persistence import (
+    about_me_repository as about_me_repository_impl,
+)
+from src.modules.portfolio.infrastructure.persistence import models
+from src.shared.infrastructure import memory_cache
+from test_impl.portfolio import _util
+
+
+@pytest.fixture(name="repo")
+def _() -> about_me_repository_impl.DjangoAboutMeRepository:
+    repo = about_me_repository_impl.DjangoAboutMeRepository(
+        cache=memory_cache.InMemoryCache()
+    )
+    return repo
+
+
+class TestDjangoAboutMeRepository:
+    __slots__: typing.Sequence[str] = ()
+
+    @pytest.mark.django_db
+    def test_get_about_me(
+        self, repo: about_me_repository_impl.DjangoAboutMeRepository
+    ) -> None:
+        assert repo.get_about_me() is None
+
+        _util.about_me_model()
+        about_me = repo.get_about_me()
+        assert isinstance(about_me, about_me_.AboutMe)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            about_me.name = "2"  # type: ignore[misc]
+
+        ((skill_type, categories),) = about_me.skills
+        assert skill_type.name == "Programming"
+        assert [
+            (category.name, [skill.name for skill in skills])
+            for category, skills in categories
+        ] == [("Languages", ["Python", "Rust"]), ("Tools", ["Git"])]
+
+    @pytest.mark.parametrize("count", [1, 20])
+    @pytest.mark.django_db
+    def test_query_count_does_not_depend_on_skills(
+        self, count: int
+    ) -> None:
+        _util.about_me_model(
+            [(str(i), f"Category {i % 3}") for i in range(count)]
+        )
+        repo = about_me_repository_impl.DjangoAboutMeRepository()
+
+        with utils.CaptureQueriesContext(connection) as queries:
+            about_me = repo.get_about_me()
+        assert len(queries) == 2
+        assert about_me is not None
+        assert (
+            sum(
+                len(skills)
+                for _, categories in about_me.skills
+                for _, skills in categories
+            )
+            == count
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_snapshot_is_cached(
+        self, repo: about_me_repository_impl.DjangoAboutMeRepository
+    ) -> None:
+        model = _util.about_me_model()
+        repo.get_about_me()
+
+        models.AboutMeModel.objects.filter(pk=model.pk).update(name="2")
+        with utils.CaptureQueriesContext(connection) as queries:
+            about_me = repo.get_about_me()
+        assert len(queries) == 0
+        assert about_me is not None
+        assert about_me.name == "1"
+
+        repo.invalidate()
+        about_me = repo.get_about_me()
+        assert about_me is not None
+        assert about_me.name == "2"
+
+    @pytest.mark.django_db(transaction=True)
+    def test_snapshot_is_invalidated_on_commit(self) -> None:
+        repo = container.portfolio_container.about_me_repository()
+        model = _util.about_me_model()
+        repo.get_about_me()
+
+        with pytest.raises(RuntimeError), transaction.atomic():
+            model.name = "2"
+            model.save()
+            about_me = repo.get_about_me()
+            assert about_me is not None
+            assert about_me.name == "2"
+            raise RuntimeError
+
+        about_me = repo.get_about_me()
+        assert about_me is not None
+        assert about_me.name == "1"
+
+        with transaction.atomic():
+            model.name = "3"
+            model.save()
+            repo.get_about_me()
+
+        about_me = repo.get_about_me()
+        assert about_me is not None
+        assert about_me.name == "3"
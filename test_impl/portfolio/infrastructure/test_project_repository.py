@@ -28,7 +28,9 @@ import typing
 import pytest
 
 from src.modules.portfolio.domain import project as project_
+from src.modules.portfolio.domain import project_content
 from src.modules.portfolio.domain import project_title as project_title_
+from src.modules.portfolio.infrastructure.persistence import models
 from src.modules.portfolio.infrastructure.persistence import (
     project_repository as project_repository_impl,
 )
@@ -89,3 +91,45 @@ class TestDjangoProjectRepository:
             order_by="-title"
         )
         assert projects[0].title == project_title_.ProjectTitle("9")
+
+    @pytest.mark.django_db
+    def test_get_projects(
+        self, project_repository: project_repository_.ProjectRepository
+    ) -> None:
+        for title in ("1", "2"):
+            project_repository.save(_util.project_from_title(title))
+
+        batch = project_repository.get_projects(
+            [project_title_.ProjectTitle(i) for i in ("2", "3", "1")]
+        )
+        assert [project.title for project in batch] == ["2", "1"]
+        assert list(batch.missing) == ["3"]
+
+    @pytest.mark.django_db
+    def test_save_many(
+        self, project_repository: project_repository_.ProjectRepository
+    ) -> None:
+        project_repository.save_many(
+            [_util.project_from_title(str(i)) for i in range(3)]
+        )
+        assert models.ProjectModel.objects.count() == 3
+
+        # Existing projects are updated, matched by their title.
+        entity = _util.project_from_title("0")
+        entity = project_.Project(
+            title=entity.title,
+            asset=entity.asset,
+            reference=entity.reference,
+            content=project_content.ProjectContent(
+                description="2", technologies="2"
+            ),
+            created_at=entity.created_at,
+        )
+        project_repository.save_many(
+            [entity, _util.project_from_title("3")], batch_size=1
+        )
+
+        assert models.ProjectModel.objects.count() == 4
+        project = project_repository.get_project(entity.title)
+        assert project is not None
+        assert project.content.description == "2"
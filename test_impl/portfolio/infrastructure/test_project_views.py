@@ -24,13 +24,19 @@ from __future__ import annotations
 __all__: typing.Sequence[str] = ("TestIndexView",)
 
 import typing
+from unittest import mock
 
 import pytest
 from django import test
 from django import urls
+from django.db import connection
+from django.test import utils
 from pytest_django import asserts
 
 from src.modules.portfolio.infrastructure.django import views
+from src.modules.portfolio.infrastructure.persistence import models
+from src.shared.infrastructure.django import response_cache
+from test_impl.portfolio import _util
 
 
 class TestIndexView:
@@ -88,6 +94,26 @@ class TestAboutView:
 
         asserts.assertTemplateUsed(response, "portfolio/about.html")
 
+    @pytest.mark.django_db(transaction=True)
+    def test_skills_fragment_is_cached(
+        self, rf: test.RequestFactory
+    ) -> None:
+        _util.about_me_model()
+        response = views.about(rf.get("/about"))
+        assert b"Rust" in response.content
+
+        # Another page is rendered, e.g. after a blog has been saved,
+        # but neither the CV nor the skills have changed.
+        response_cache.bump_content_version()
+        with utils.CaptureQueriesContext(connection) as queries:
+            views.about(rf.get("/about"))
+        assert len(queries) == 0
+
+        models.SkillModel.objects.filter(name="Rust").delete()
+        response = views.about(rf.get("/about"))
+        assert b"Python" in response.content
+        assert b"Rust" not in response.content
+
 
 class TestProjectsView:
     __slots__: typing.Sequence[str] = ()
@@ -115,3 +141,22 @@ class TestProjectsView:
         assert response.status_code == 200
 
         asserts.assertTemplateUsed(response, "portfolio/projects.html")
+
+    @pytest.mark.django_db(transaction=True)
+    def test_view_is_cached(self, rf: test.RequestFactory) -> None:
+        mock_repo = mock.Mock()
+        mock_repo.get_all_projects.return_value = []
+
+        for page in ("1", "1", "2"):
+            request = rf.get("/projects", {"page": page})
+            response = views.projects(request, repo=mock_repo)
+            assert response.status_code == 200
+
+        assert mock_repo.get_all_projects.call_count == 2
+
+        # Saving a project invalidates all cached pages.
+        models.ProjectModel.objects.create(title="1", technologies="1")
+
+        request = rf.get("/projects", {"page": "1"})
+        views.projects(request, repo=mock_repo)
+        assert mock_repo.get_all_projects.call_count == 3
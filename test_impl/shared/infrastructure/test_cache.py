@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("TestCache",)
+
+import pathlib
+import typing
+
+import pytest
+
+from src.shared.infrastructure import memory_cache
+from src.shared.infrastructure import sqlite_cache
+
+if typing.TYPE_CHECKING:
+    from src.shared.infrastructure import cache as cache_
+
+
+@pytest.fixture(name="cache", params=["memory", "sqlite"])
+def _(
+    request: pytest.FixtureRequest, tmp_path: pathlib.Path
+) -> cache_.Cache:
+    if request.param == "memory":
+        return memory_cache.InMemoryCache(max_entries=2)
+    return sqlite_cache.SQLiteCache(
+        tmp_path / "cache.sqlite3", max_entries=2
+    )
+
+
+class TestCache:
+    __slots__: typing.Sequence[str] = ()
+
+    def test_get_and_set(self, cache: cache_.Cache) -> None:
+        assert cache.get("key") is None
+
+        value = {"title": "1"}
+        cache.set("key", value)
+        cached = cache.get("key")
+        assert cached == value
+        assert cached is not value
+
+        cache.delete("key")
+        assert cache.get("key") is None
+
+    def test_expired_values_are_missing(
+        self, cache: cache_.Cache
+    ) -> None:
+        cache.set("key", 1, timeout=-1)
+        assert cache.get("key") is None
+        assert cache.get_or_set("key", lambda: 2, timeout=60) == 2
+        assert cache.get("key") == 2
+
+    def test_versions(self, cache: cache_.Cache) -> None:
+        assert cache.get_version("blog:1") == 0
+        key = cache.versioned_key("blog:1", "aggregate")
+        cache.set(key, 1)
+
+        assert cache.bump_version("blog:1") == 1
+        assert cache.get_version("blog:2") == 0
+        assert cache.versioned_key("blog:1", "aggregate") != key
+
+        # Versions outlive the values, so old keys stay unreachable.
+        cache.clear()
+        assert cache.get(key) is None
+        assert cache.get_version("blog:1") == 1
+
+    def test_least_recently_used_is_dropped(self) -> None:
+        cache = memory_cache.InMemoryCache(max_entries=2)
+        cache.set("1", 1)
+        cache.set("2", 2)
+        cache.get("1")
+        cache.set("3", 3)
+        assert cache.get("2") is None
+        assert cache.get("1") == 1
+
+    def test_sqlite_cache_is_shared(
+        self, tmp_path: pathlib.Path
+    ) -> None:
+        path = tmp_path / "cache.sqlite3"
+        # Two instances stand for the workers of an application
+        # server sharing the file.
+        first = sqlite_cache.SQLiteCache(path)
+        second = sqlite_cache.SQLiteCache(path)
+
+        first.set("key", "value")
+        assert second.get("key") == "value"
+
+        second.bump_version("blog:1")
+        assert first.get_version("blog:1") == 1
+
+    def test_sqlite_cache_is_culled(
+        self, tmp_path: pathlib.Path
+    ) -> None:
+        cache = sqlite_cache.SQLiteCache(
+            tmp_path / "cache.sqlite3", max_entries=10
+        )
+        for i in range(sqlite_cache._CULL_FREQUENCY):
+            cache.set(str(i), i)
+
+        kept = [
+            i
+            for i in range(sqlite_cache._CULL_FREQUENCY)
+            if cache.get(str(i)) is not None
+        ]
+        assert len(kept) == 10
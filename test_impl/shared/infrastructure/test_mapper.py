@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("TestDataMapper",)
+
+import typing
+
+import pytest
+from django.db import connection
+from django.db import models as models_
+from django.test import utils
+
+from src.modules.portfolio.infrastructure.persistence import (
+    about_me_mapper,
+)
+from src.modules.portfolio.infrastructure.persistence import models
+from test_impl.portfolio import _util
+
+
+class TestDataMapper:
+    __slots__: typing.Sequence[str] = ()
+
+    @pytest.mark.django_db
+    def test_iter_entities(self) -> None:
+        for _ in range(3):
+            _util.about_me_model()
+        mapper = about_me_mapper.AboutMeMapper()
+        query_set = models.AboutMeModel.objects.prefetch_related(
+            models_.Prefetch(
+                "skills",
+                queryset=models.SkillModel.objects.select_related(
+                    "type", "category"
+                ),
+            )
+        ).order_by("pk")
+
+        with utils.CaptureQueriesContext(connection) as queries:
+            entities = mapper.iter_entities(query_set, chunk_size=2)
+            assert len(queries) == 0
+
+            assert next(entities).skills
+            # The skills of the first chunk are prefetched at once.
+            assert len(queries) == 2
+
+            assert len(list(entities)) == 2
+        assert len(queries) == 3
+
+    @pytest.mark.django_db
+    def test_iter_entities_of_iterable(self) -> None:
+        mapper = about_me_mapper.AboutMeMapper()
+        model = _util.about_me_model()
+
+        (entity,) = mapper.iter_entities([model])
+        assert entity.name == model.name
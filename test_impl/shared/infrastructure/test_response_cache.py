@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("TestCachedResponse",)
+
+import pathlib
+import typing
+from unittest import mock
+
+import pytest
+from django import http
+from django import test
+from django.db import transaction
+
+from src.shared.infrastructure import container
+from src.shared.infrastructure import sqlite_cache
+from src.shared.infrastructure.django import response_cache
+
+
+@pytest.fixture(name="view")
+def _() -> mock.Mock:
+    view = mock.Mock(side_effect=lambda _: http.HttpResponse(b"1"))
+    return view
+
+
+class TestCachedResponse:
+    __slots__: typing.Sequence[str] = ()
+
+    @pytest.mark.django_db(transaction=True)
+    def test_version_is_bumped_on_commit(
+        self, rf: test.RequestFactory, view: mock.Mock
+    ) -> None:
+        cached_view = response_cache.cached_response(view)
+        cached_view(rf.get("/"))
+
+        with transaction.atomic():
+            response_cache.bump_content_version()
+            # A response rendered before the commit is cached under
+            # the previous version.
+            cached_view(rf.get("/"))
+            assert view.call_count == 1
+
+        cached_view(rf.get("/"))
+        assert view.call_count == 2
+
+    def test_version_is_shared_between_processes(
+        self,
+        rf: test.RequestFactory,
+        view: mock.Mock,
+        tmp_path: pathlib.Path,
+    ) -> None:
+        cached_view = response_cache.cached_response(view)
+        path = tmp_path / "cache.sqlite3"
+        with container.shared_container.cache.override(
+            sqlite_cache.SQLiteCache(path)
+        ):
+            cached_view(rf.get("/"))
+            cached_view(rf.get("/"))
+            assert view.call_count == 1
+
+            # Another worker, which caches its own responses.
+            other = sqlite_cache.SQLiteCache(path)
+            other.bump_version("response")
+            cached_view(rf.get("/"))
+            assert view.call_count == 2
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2024 INSPXRXD
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("TestTuneSQLiteConnection",)
+
+import pathlib
+import typing
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.db.backends.sqlite3 import base
+
+from test_impl.shared import _util
+
+
+def _pragma(wrapper: base.DatabaseWrapper, name: str) -> typing.Any:
+    with wrapper.cursor() as cursor:
+        cursor.execute(f"PRAGMA {name}")
+        return cursor.fetchone()[0]
+
+
+@_util.sqlite_only
+class TestTuneSQLiteConnection:
+    __slots__: typing.Sequence[str] = ()
+
+    @pytest.mark.django_db
+    def test_pragmas_are_applied(self, tmp_path: pathlib.Path) -> None:
+        wrapper = base.DatabaseWrapper(
+            {
+                **connection.settings_dict,
+                "NAME": str(tmp_path / "db.sqlite3"),
+            },
+            alias="tuned",
+        )
+        try:
+            assert _pragma(wrapper, "journal_mode") == "wal"
+            assert _pragma(wrapper, "synchronous") == 1
+            assert _pragma(wrapper, "temp_store") == 2
+            assert _pragma(wrapper, "busy_timeout") == 5000
+            assert _pragma(wrapper, "cache_size") == -16000
+            assert _pragma(wrapper, "mmap_size") > 0
+        finally:
+            wrapper.close()
+
+    @pytest.mark.django_db
+    def test_pragmas_are_configurable(
+        self, tmp_path: pathlib.Path
+    ) -> None:
+        wrapper = base.DatabaseWrapper(
+            {
+                **connection.settings_dict,
+                "NAME": str(tmp_path / "db.sqlite3"),
+            },
+            alias="default_journal",
+        )
+        try:
+            with mock.patch.object(
+                settings, "SQLITE_PRAGMAS", {"journal_mode": "DELETE"}
+            ):
+                assert _pragma(wrapper, "journal_mode") == "delete"
+                assert _pragma(wrapper, "mmap_size") == 0
+        finally:
+            wrapper.close()